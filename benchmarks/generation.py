@@ -0,0 +1,78 @@
+"""
+테스트 케이스 생성 벤치마크
+
+로컬 LLM 백엔드(네트워크/API 키 불필요)로 일괄 생성 파이프라인을 실행하여
+캐시 없는 첫 실행(cold)과 같은 요청을 다시 생성하는 실행(warm, 캐시 적중)의 처리량을 측정합니다.
+케이스 파일과 캐시 DB는 임시 디렉토리에 만들어지므로 프로젝트의 cases/, results/는 바뀌지 않습니다.
+
+실행 방법 (프로젝트 루트에서):
+    python benchmarks/generation.py
+    python benchmarks/generation.py --requests 200 --workers 8 --latency 0.5 --error-rate 0.05
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# 요청 문장 템플릿 ({n}은 요청 번호)
+REQUEST_TEMPLATES = [
+    "사용자 {n}이 로그인한 후 장바구니에 상품을 추가하고 결제하는 테스트",
+    "회원 {n}의 주문 목록을 조회하는 테스트",
+    "상품 {n}의 가격을 수정하는 테스트",
+    "게시글 {n}을 삭제하는 테스트",
+]
+
+def build_requests(count: int):
+    return [REQUEST_TEMPLATES[i % len(REQUEST_TEMPLATES)].format(n=i) for i in range(count)]
+
+def run_batch(generator, requests, workers: int, use_cache: bool):
+    """일괄 생성을 한 번 실행하고 (소요 시간, 성공 수, 캐시 적중 수)를 반환합니다."""
+    start = time.perf_counter()
+    results = generator.generate_test_cases(requests, workers, use_cache=use_cache)
+    elapsed = time.perf_counter() - start
+    success = sum(1 for item in results if item["status"] == "success")
+    cached = sum(1 for item in results if item["cached"])
+    return elapsed, success, cached
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="로컬 LLM 백엔드로 테스트 케이스 일괄 생성 벤치마크")
+    parser.add_argument("--requests", type=int, default=50, help="생성할 요청 수")
+    parser.add_argument("--workers", type=int, default=4, help="동시 LLM 요청 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="로컬 백엔드 응답 지연 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 시간에 더할 임의 시간의 최댓값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="요청률 초과 오류 비율 (0~1, 재시도 경로 측정)")
+    parser.add_argument("--no-cache", action="store_true", help="LLM 응답 캐시를 사용하지 않음")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix="testflow_bench_")
+    # 설정은 모듈을 임포트할 때 읽으므로 임포트 전에 지정
+    os.environ["TESTFLOW_LLM_CACHE_DB"] = os.path.join(work_dir, "llm_cache.db")
+    os.environ["TESTFLOW_RESULT_DB"] = os.path.join(work_dir, "results.db")
+    os.environ.setdefault("TESTFLOW_LLM_RETRY_BASE_DELAY", "0.05")
+    sys.path.insert(0, PROJECT_ROOT)
+    os.chdir(work_dir)
+
+    from test_engine.llm_backends import LocalBackend
+    from test_engine.test_case_generator import TestCaseGenerator
+
+    backend = LocalBackend(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate)
+    generator = TestCaseGenerator(backend)
+    requests = build_requests(args.requests)
+    print(f"요청 {len(requests)}건, 동시 {args.workers}, 지연 {args.latency * 1000:.0f} ms, 오류 비율 {args.error_rate:.0%}")
+
+    failed = False
+    # cold: 빈 캐시에서 생성 (응답이 캐시에 채워짐), warm: 같은 요청을 다시 생성
+    for label in ("cold", "warm"):
+        calls_before = backend.calls
+        elapsed, success, cached = run_batch(generator, requests, args.workers, not args.no_cache)
+        failed = failed or success != len(requests)
+        print(f"{label}: {elapsed:.2f} s, {len(requests) / elapsed:.1f} 건/s, 성공 {success}/{len(requests)}, "
+              f"캐시 적중 {cached}, 모델 호출 {backend.calls - calls_before}")
+    print(f"작업 디렉토리: {work_dir}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+임포트 시간 벤치마크
+
+헤드리스 실행 경로(예약 실행, CI 등)의 모듈을 새 인터프리터에서 임포트하는 데 걸리는 시간을 측정하고,
+예산(초)을 넘거나 실행 경로에 필요 없는 무거운 라이브러리가 함께 임포트되면 실패(종료 코드 1)합니다.
+
+실행 방법 (프로젝트 루트에서):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --profile
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# 모듈별 임포트 시간 예산 (초)
+IMPORT_BUDGETS = {
+    "test_engine.test_runner": 0.5,
+    "test_engine.background_runs": 0.5,
+    "test_engine.scheduler_daemon": 0.5,
+}
+
+# 헤드리스 실행 경로에서 임포트되면 안 되는 모듈 (시각화/보고서/LLM 전용)
+HEAVY_MODULES = [
+    "pandas", "pyarrow", "plotly", "altair", "streamlit",
+    "pdfkit", "markdown2", "google.generativeai", "integrations.jira_api"
+]
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = {heavy!r}
+print(json.dumps({{"elapsed": elapsed, "heavy": [name for name in heavy if name in sys.modules]}}))
+"""
+
+def measure(module: str, repeat: int):
+    """새 인터프리터에서 모듈을 repeat번 임포트하여 (임포트 시간 목록, 프로세스 시간 목록, 함께 임포트된 무거운 모듈)을 반환합니다."""
+    import_times, process_times, heavy = [], [], set()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        process_times.append(time.perf_counter() - start)
+        probe = json.loads(output.strip().splitlines()[-1])
+        import_times.append(probe["elapsed"])
+        heavy.update(probe["heavy"])
+    return import_times, process_times, sorted(heavy)
+
+def profile(module: str, top: int = 15) -> None:
+    """-X importtime 결과에서 누적 시간이 큰 모듈을 출력합니다."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative), name.strip()))
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="헤드리스 실행 경로 임포트 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="모듈별 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--budget", type=float, default=None, help="모든 모듈에 적용할 예산 (초)")
+    parser.add_argument("--profile", action="store_true", help="누적 임포트 시간이 큰 모듈 출력")
+    parser.add_argument("modules", nargs="*", help="측정할 모듈 (기본: IMPORT_BUDGETS의 모듈)")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or list(IMPORT_BUDGETS)
+    failed = False
+    for module in modules:
+        budget = args.budget if args.budget is not None else IMPORT_BUDGETS.get(module, 0.5)
+        import_times, process_times, heavy = measure(module, args.repeat)
+        median = statistics.median(import_times)
+        ok = median <= budget and not heavy
+        failed = failed or not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {module}: 임포트 {median * 1000:.0f} ms (예산 {budget * 1000:.0f} ms), "
+              f"프로세스 시작 포함 {statistics.median(process_times) * 1000:.0f} ms")
+        if heavy:
+            print(f"     실행 경로에 불필요한 모듈이 임포트됨: {', '.join(heavy)}")
+        if args.profile:
+            profile(module)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,35 +8,48 @@ from datetime import datetime
 import json
 import pandas as pd
 from io import BytesIO
-import pdfkit
 import base64
-import markdown2
 import streamlit as st
 from test_engine.test_runner import (
     load_all_cases,
     run_test_case,
-    run_selected_cases,
-    load_test_history,
     filter_cases,
     group_cases_by_feature,
     update_case_priority,
+    save_case,
     delete_case,
-    plot_test_trend,
     calculate_coverage,
-    analyze_failure_patterns,
-    plot_coverage,
     load_test_runs,
+    count_test_runs,
     generate_test_report,
     generate_comparison_report,
-    create_issue_file
+    find_result_file,
+    load_test_result,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PER_HOST_LIMIT
 )
-from test_engine.postman_runner import run_postman_collection
-from test_engine.test_case_generator import TestCaseGenerator
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-import threading
+from test_engine.analytics import plot_test_trend, analyze_failure_patterns, plot_coverage, plot_latency_breakdown
+from test_engine.postman_runner import run_postman_collection, NEWMAN_SHARDS, NEWMAN_SHARD_MODE
+from test_engine.postman_shards import SHARD_MODES
+from test_engine.postman_records import postman_records, count_records
+from test_engine.run_store import RunWriter
+from test_engine.background_runs import (submit_test_run, cancel_test_run, get_test_run_progress,
+                                         submit_load_test, get_load_test_progress, pop_load_test_result)
+from test_engine.llm_cache import get_llm_cache, LLM_CACHE_ENABLED, LLM_CACHE_MAX_ENTRIES
+from test_engine.llm_backends import LLM_BACKEND, GEMINI_MODEL
+from test_engine.history_store import load_history_frame
+from test_engine.case_repository import get_case_repository
+from test_engine.result_db import get_result_db, CASES_GENERATION, RESULTS_GENERATION
+from test_engine.test_case_generator import (
+    get_test_case_generator,
+    list_available_models,
+    parse_generation_requests,
+    MODEL_LIST_TTL,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_CONCURRENCY
+)
+from test_engine.job_store import get_job_store, DEFAULT_JOB_OPTIONS, SCHEDULER_NAME, SCHEDULED_TEST_FUNC
 import time
-from integrations.jira_api import JiraAPI
 
 # 페이지 설정
 st.set_page_config(
@@ -66,79 +79,118 @@ if 'last_test_time' not in st.session_state:
     st.session_state.last_test_time = None
 if 'test_type' not in st.session_state:
     st.session_state.test_type = None
+if 'active_run_id' not in st.session_state:
+    st.session_state.active_run_id = None
+if 'active_load_id' not in st.session_state:
+    st.session_state.active_load_id = None
+if 'load_result' not in st.session_state:
+    st.session_state.load_result = None
 
-# 가장 최근 테스트 실행 정보 로드
-if not st.session_state.last_test_time:
-    test_runs = load_test_runs()
-    if test_runs:
-        latest_run = test_runs[0]  # 가장 최근 실행
-        run_id = latest_run.split(" - ")[0]
-        result_file = os.path.join("results", f"test_result_{run_id}.json")
-        
-        if os.path.exists(result_file):
-            with open(result_file, "r", encoding="utf-8") as f:
-                result_data = json.load(f)
-                st.session_state.last_test_time = datetime.strptime(result_data["execution_time"], "%Y-%m-%d %H:%M:%S")
-                st.session_state.test_type = result_data["type"]
-                
-                if result_data["type"] == "postman":
-                    st.session_state.postman_result = result_data["postman_result"]
-                else:
-                    st.session_state.test_case_result = result_data["results"]
+# 실행 선택 목록에 한 번에 표시할 실행 수
+RUN_PAGE_SIZE = 100
+# 테스트 케이스 관리 화면에 한 번에 표시할 케이스 수
+CASE_PAGE_SIZE = 50
+# 진행 중인 테스트 실행 상태를 다시 조회하는 주기 (초)
+RUN_POLL_INTERVAL = 1.0
 
-# 스케줄러 초기화
-scheduler = BackgroundScheduler()
-scheduler.start()
+# 디스크 데이터 캐시
+# 실행기와 케이스 편집기가 쓰기를 할 때마다 세대 카운터를 올리므로,
+# 카운터 값을 캐시 키에 포함하면 변경이 있을 때만 다시 읽습니다.
+def cases_generation() -> int:
+    return get_result_db().get_generation(CASES_GENERATION)
 
-def run_scheduled_test():
-    """매주 토요일 14시에 실행될 테스트 함수"""
-    try:
-        # 모든 테스트 케이스 로드
-        cases = load_all_cases()
-        if not cases:
-            print("실행할 테스트 케이스가 없습니다.")
-            return
-            
-        # 모든 테스트 케이스 선택
-        selected_cases = [f"{case['id']} - {case['title']}" for case in cases]
-        
-        # 테스트 실행
-        results = run_selected_cases(selected_cases, "dev")  # 기본적으로 개발 환경에서 실행
+def results_generation() -> int:
+    return get_result_db().get_generation(RESULTS_GENERATION)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def cached_load_all_cases(generation: int):
+    return load_all_cases()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_filter_managed_cases(generation: int, search_query, search_type, feature_filter):
+    """테스트 케이스 관리 화면의 검색 조건으로 케이스를 필터링합니다."""
+    all_cases = cached_load_all_cases(generation)
+    
+    # 검색 결과 필터링
+    filtered_cases = []
+    for case in all_cases:
+        should_include = True
         
-        # 결과 저장
-        result_data = {
-            "id": datetime.now().strftime("%Y%m%d%H%M%S"),
-            "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "env": "dev",
-            "results": results,
-            "type": "ai_collection",
-            "scheduled": True
-        }
+        # 검색어 필터링
+        if search_query:
+            search_text = ""
+            if search_type == "전체":
+                search_text = f"{case.get('title', '')} {case.get('description', '')} {' '.join(case.get('tags', []))}"
+            elif search_type == "제목":
+                search_text = case.get('title', '')
+            elif search_type == "설명":
+                search_text = case.get('description', '')
+            elif search_type == "태그":
+                search_text = ' '.join(case.get('tags', []))
+            
+            if search_query.lower() not in search_text.lower():
+                should_include = False
         
-        # 결과 파일 저장
-        os.makedirs("results", exist_ok=True)
-        result_file = os.path.join("results", f"test_result_{result_data['id']}.json")
-        with open(result_file, "w", encoding="utf-8") as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
+        # 기능 필터링
+        if feature_filter != "전체":
+            # 파일 경로에서 기능 추출
+            filepath = case.get('filepath', '')
+            case_feature = '기타'
             
-        # 실패한 테스트 케이스에 대해 이슈 파일 생성
-        for result in results:
-            if result["result"] == "FAIL":
-                issue_file = create_issue_file(result)
-                print(f"이슈 파일 생성됨: {issue_file}")
+            # 파일 경로 정규화
+            filepath = filepath.replace('\\', '/') if '\\' in filepath else filepath
             
-        print(f"스케줄된 테스트가 완료되었습니다. 결과 파일: {result_file}")
+            # cases/기능디렉토리/파일명.json 형식에서 기능 디렉토리 추출
+            path_parts = filepath.split('/')
+            if len(path_parts) >= 2 and 'cases' in path_parts:
+                cases_index = path_parts.index('cases')
+                if len(path_parts) > cases_index + 1:
+                    case_feature = path_parts[cases_index + 1]
+            
+            # 선택된 기능과 일치하지 않으면 제외
+            if case_feature != feature_filter:
+                should_include = False
         
-    except Exception as e:
-        print(f"스케줄된 테스트 실행 중 오류 발생: {str(e)}")
+        if should_include:
+            filtered_cases.append(case)
+    
+    return filtered_cases
 
-# 스케줄러에 작업 추가 (매주 토요일 14시에 실행)
-scheduler.add_job(
-    run_scheduled_test,
-    trigger=CronTrigger(day_of_week='sat', hour=14, minute=0),
-    id='weekly_test',
-    replace_existing=True
-)
+@st.cache_data(show_spinner=False, max_entries=4)
+def cached_calculate_coverage(generation: int):
+    return calculate_coverage()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_load_test_runs(generation: int, limit=None, offset=0):
+    return load_test_runs(limit=limit, offset=offset)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def cached_count_test_runs(generation: int):
+    return count_test_runs()
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def cached_load_history_frame(generation: int):
+    return load_history_frame()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def cached_analyze_failure_patterns(generation: int):
+    return analyze_failure_patterns()
+
+# 가장 최근 테스트 실행 정보 로드
+if not st.session_state.last_test_time:
+    test_runs = cached_load_test_runs(results_generation(), limit=1)
+    if test_runs:
+        latest_run = test_runs[0]  # 가장 최근 실행
+        result_data = load_test_result(latest_run)
+        
+        if result_data:
+            st.session_state.last_test_time = datetime.strptime(result_data["execution_time"], "%Y-%m-%d %H:%M:%S")
+            st.session_state.test_type = result_data["type"]
+            
+            if result_data["type"] == "postman":
+                st.session_state.postman_result = result_data.get("postman_result")
+            else:
+                st.session_state.test_case_result = result_data.get("results")
 
 # 사이드바에 메뉴 추가
 st.sidebar.title("메뉴")
@@ -147,11 +199,18 @@ menu = st.sidebar.radio(
     ["테스트 케이스 생성", "테스트 실행", "결과 확인", "테스트 케이스 관리", "대시보드", "결과 분석", "설정"]
 )
 
-# 테스트 케이스 생성기 인스턴스 생성
-test_case_generator = TestCaseGenerator()
+# 다른 경로(직접 파일 수정 등)로 바뀐 데이터를 반영하기 위한 수동 새로고침
+if st.sidebar.button("데이터 새로고침"):
+    get_result_db().bump_generation(CASES_GENERATION)
+    get_result_db().bump_generation(RESULTS_GENERATION)
+    st.rerun()
 
 def convert_report_to_pdf(content):
     """마크다운 보고서를 PDF로 변환합니다."""
+    # PDF 변환 라이브러리는 보고서를 내려받을 때만 필요하므로 지연 임포트
+    import pdfkit
+    import markdown2
+    
     try:
         # 마크다운을 HTML로 변환
         html_content = markdown2.markdown(content, extras=['fenced-code-blocks'])
@@ -228,6 +287,198 @@ def get_binary_file_downloader_html(bin_file: bytes, file_label: str) -> str:
     b64 = base64.b64encode(bin_file).decode()
     return f'<a href="data:application/pdf;base64,{b64}" download="{file_label}">📥 {file_label} 다운로드</a>'
 
+def load_test_run_page(key: str):
+    """실행 목록을 페이지 단위로 불러옵니다. (실행 목록, 페이지 번호)를 반환합니다."""
+    generation = results_generation()
+    total_pages = max(1, -(-cached_count_test_runs(generation) // RUN_PAGE_SIZE))
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(f"실행 목록 페이지 (전체 {total_pages})", min_value=1,
+                               max_value=total_pages, value=1, key=key)
+    return cached_load_test_runs(generation, limit=RUN_PAGE_SIZE, offset=(page - 1) * RUN_PAGE_SIZE), page
+
+def show_test_run_results(run_id: str):
+    """종료된 백그라운드 실행의 결과를 표시하고 세션 상태에 반영합니다."""
+    progress = get_test_run_progress(run_id)
+    results = get_result_db().load_results([run_id]).get(run_id, [])
+    
+    # 세션 상태 업데이트
+    st.session_state.test_case_result = results
+    st.session_state.last_test_time = datetime.now()
+    st.session_state.test_type = "ai_collection"
+    
+    if progress["status"] == "cancelled":
+        st.warning(f"테스트 실행이 취소되었습니다. ({len(results)}/{progress['total'] or len(results)}개 케이스 실행됨)")
+    elif progress["status"] == "failed":
+        st.error("테스트 실행 중 오류가 발생했습니다. 완료된 케이스 결과만 표시합니다.")
+    else:
+        st.success("테스트가 완료되었습니다!")
+    st.metric("성공", sum(1 for r in results if r["result"] == "PASS"))
+    st.metric("실패", sum(1 for r in results if r["result"] == "FAIL"))
+    st.metric("경고", sum(1 for r in results if r["result"] == "ERROR"))
+    
+    # 상세 결과 표시
+    with st.expander("상세 결과 보기"):
+        for result in results:
+            st.subheader(f"테스트 케이스: {result['id']}")
+            st.write(f"상태: {result['result']}")
+            if result['result'] == 'FAIL':
+                st.error(f"실패 사유: 상태 코드 {result.get('status_code', 'N/A')}")
+            elif result['result'] == 'ERROR':
+                st.warning(f"경고 사유: {result['reason']}")
+            st.write("---")
+
+def show_test_run_progress(run_id: str):
+    """
+    진행 중인 실행의 진행률과 중간 결과를 표시합니다.
+
+    실행이 끝나면 전체 화면을 다시 그려 결과를 표시합니다.
+    """
+    progress = get_test_run_progress(run_id)
+    if progress is None:
+        st.session_state.active_run_id = None
+        return
+    if progress["status"] != "running":
+        st.rerun()
+    
+    total = progress["total"] or 0
+    done = progress["done"]
+    counts = progress["counts"]
+    st.progress(min(done / total, 1.0) if total else 0.0,
+                text=f"테스트 실행 중... {done}/{total if total else '?'} (실행 ID: {run_id})")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("성공", counts.get("PASS", 0))
+    with col2:
+        st.metric("실패", counts.get("FAIL", 0))
+    with col3:
+        st.metric("경고", counts.get("ERROR", 0))
+    if progress["cancel_requested"]:
+        st.info("취소 요청됨. 진행 중인 케이스가 끝나면 실행이 중단됩니다.")
+    elif st.button("실행 취소", key=f"cancel_{run_id}"):
+        cancel_test_run(run_id)
+
+# 지원되는 Streamlit 버전이면 진행률 영역만 주기적으로 다시 그림
+_run_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def watch_test_run(run_id: str):
+    """백그라운드 실행의 진행률(진행 중) 또는 결과(종료 후)를 표시합니다."""
+    progress = get_test_run_progress(run_id)
+    if progress is None:
+        st.session_state.active_run_id = None
+        return
+    if progress["status"] != "running":
+        show_test_run_results(run_id)
+        return
+    if _run_fragment is not None:
+        _run_fragment(run_every=RUN_POLL_INTERVAL)(show_test_run_progress)(run_id)
+    else:
+        show_test_run_progress(run_id)
+        time.sleep(RUN_POLL_INTERVAL)
+        st.rerun()
+
+def show_load_result(load_result):
+    """부하 테스트 결과(지연 시간 분위수, 처리량, 오류율, 상태 코드 분포)를 표시합니다."""
+    st.success("부하 테스트가 완료되었습니다!")
+    latency = load_result["latency_ms"]
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("p50 (ms)", f"{latency['p50']:.1f}")
+    with col2:
+        st.metric("p90 (ms)", f"{latency['p90']:.1f}")
+    with col3:
+        st.metric("p99 (ms)", f"{latency['p99']:.1f}")
+    with col4:
+        st.metric("최대 (ms)", f"{latency['max']:.1f}")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("총 요청 수", load_result["total_requests"])
+    with col2:
+        st.metric("처리량 (req/s)", f"{load_result['throughput']:.1f}")
+    with col3:
+        st.metric("오류율", f"{load_result['error_rate']:.1f}%")
+    with st.expander("상태 코드 분포"):
+        st.json(load_result["status_codes"])
+
+def show_load_test_progress(load_id: str):
+    """진행 중인 부하 테스트의 경과 시간을 표시합니다. 끝나면 전체 화면을 다시 그려 결과를 표시합니다."""
+    progress = get_load_test_progress(load_id)
+    if progress is None or progress["status"] in ("completed", "failed"):
+        st.rerun()
+    if progress["status"] == "queued":
+        st.progress(0.0, text="부하 테스트 대기 중... (진행 중인 다른 실행이 끝나면 시작됩니다)")
+        return
+    duration = progress["duration"]
+    st.progress(min(progress["elapsed"] / duration, 1.0) if duration else 0.0,
+                text=f"부하 테스트 실행 중... {progress['elapsed']:.0f}/{duration}초 (ID: {load_id})")
+
+def watch_load_test(load_id: str):
+    """백그라운드 부하 테스트의 진행률(진행 중) 또는 결과(종료 후)를 표시합니다."""
+    progress = get_load_test_progress(load_id)
+    if progress is None:
+        st.session_state.active_load_id = None
+        return
+    if progress["status"] in ("completed", "failed"):
+        st.session_state.active_load_id = None
+        try:
+            st.session_state.load_result = pop_load_test_result(load_id)
+        except Exception as e:
+            st.error(f"부하 테스트 실행 중 오류가 발생했습니다: {str(e)}")
+            return
+        show_load_result(st.session_state.load_result)
+        return
+    if _run_fragment is not None:
+        _run_fragment(run_every=RUN_POLL_INTERVAL)(show_load_test_progress)(load_id)
+    else:
+        show_load_test_progress(load_id)
+        time.sleep(RUN_POLL_INTERVAL)
+        st.rerun()
+
+def show_postman_result(result):
+    """Postman Collection 실행 결과를 요청 레코드로 요약하고 요청별 상세 결과를 표시합니다."""
+    records = postman_records(result)
+    counts = count_records(records)
+    total_count = counts["total"]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("전체 실행", total_count)
+    with col2:
+        st.metric("성공률", f"{(counts['PASS']/total_count*100 if total_count > 0 else 0):.1f}%")
+    with col3:
+        st.metric("실패률", f"{(counts['FAIL']/total_count*100 if total_count > 0 else 0):.1f}%")
+    with col4:
+        st.metric("중단율", f"{(counts['ERROR']/total_count*100 if total_count > 0 else 0):.1f}%")
+    
+    # Postman 상세 결과
+    st.header("📝 Postman Collection 상세 결과")
+    with st.expander("상세 결과 보기"):
+        # 결과 요약 표시
+        st.markdown(f"### 📊 결과 요약")
+        st.markdown(f"- 총 요청 수: {total_count}")
+        st.markdown(f"- 성공: {counts['PASS']}")
+        st.markdown(f"- 실패: {counts['FAIL']}")
+        st.markdown(f"- 경고: {counts['ERROR']}")
+        st.markdown("---")
+        
+        # 상세 결과 표시
+        st.markdown("### 📝 상세 결과")
+        for record in records:
+            st.markdown(f"#### {record['seq']}. {record['method']} - {record['name']}")
+            status = f"{record['status_code']} {record['status'] or ''}".strip() if record["status_code"] is not None else (record["error"] or "응답 없음")
+            if record["result"] == "PASS":
+                st.success(f"상태: {status}")
+            elif record["result"] == "FAIL":
+                st.error(f"상태: {status}")
+            else:
+                st.warning(f"상태: {status}")
+            st.text(f"URL: {record['url']}")
+            if record["response_time_ms"] is not None:
+                st.text(f"응답 시간: {record['response_time_ms']:.0f} ms")
+            for assertion in record["assertions"]:
+                if assertion["error"]:
+                    st.text(f"❌ {assertion['name']}: {assertion['error']}")
+
 if menu == "테스트 케이스 생성":
     st.title("🤖 AI 테스트 케이스 생성")
     
@@ -238,13 +489,16 @@ if menu == "테스트 케이스 생성":
         placeholder="예: 사용자가 로그인한 후 장바구니에 상품을 추가하고 결제하는 테스트 케이스를 생성해줘"
     )
     
+    use_llm_cache = st.checkbox("캐시된 응답 사용", value=LLM_CACHE_ENABLED,
+                                help="같은 요청으로 생성한 적이 있으면 AI 모델을 다시 호출하지 않고 저장된 응답을 사용합니다.")
+    
     if st.button("테스트 케이스 생성"):
         if not natural_language:
             st.warning("테스트 케이스 생성을 위한 요청을 입력해주세요.")
         else:
             with st.spinner("테스트 케이스를 생성 중입니다..."):
                 # 테스트 케이스 생성
-                result = test_case_generator.generate_test_case(natural_language)
+                result = get_test_case_generator().generate_test_case(natural_language, use_llm_cache)
                 
                 if result["status"] == "success":
                     test_case = result["test_case"]
@@ -252,6 +506,8 @@ if menu == "테스트 케이스 생성":
                     
                     # 생성된 테스트 케이스 표시
                     st.success("테스트 케이스가 생성되었습니다!")
+                    if result["cached"]:
+                        st.caption("캐시된 응답으로 생성했습니다.")
                     
                     # 테스트 케이스 정보 표시
                     st.subheader("테스트 케이스 정보")
@@ -284,19 +540,8 @@ if menu == "테스트 케이스 생성":
                     # 테스트 케이스 파일 내용 표시
                     st.subheader("생성된 테스트 케이스 파일")
                     try:
-                        # 파일 경로 구성
-                        feature_folder = "기타"
-                        title = test_case.get("title", "").lower()
-                        if any(keyword in title for keyword in ["결제", "payment", "pay", "카드", "계좌"]):
-                            feature_folder = "결제"
-                        elif any(keyword in title for keyword in ["로그인", "login", "signin", "로그인", "인증"]):
-                            feature_folder = "로그인"
-                        elif any(keyword in title for keyword in ["주문", "order", "구매", "장바구니", "cart"]):
-                            feature_folder = "주문"
-                        elif any(keyword in title for keyword in ["회원가입", "signup", "register", "가입", "회원"]):
-                            feature_folder = "회원가입"
-                        
-                        filepath = os.path.join("cases", feature_folder, f"{test_case_id}.json")
+                        # 케이스 인덱스에서 파일 경로 조회
+                        filepath = get_case_repository().get_filepath(test_case_id)
                         with open(filepath, "r", encoding="utf-8") as f:
                             file_content = f.read()
                             st.code(file_content, language="json")
@@ -305,6 +550,57 @@ if menu == "테스트 케이스 생성":
                 else:
                     st.error(f"테스트 케이스 생성 중 오류가 발생했습니다: {result['error']}")
 
+    
+    # 여러 요청을 한 번에 생성
+    st.divider()
+    st.subheader("📚 일괄 생성")
+    st.caption(f"요청마다 테스트 케이스 하나를 생성합니다. LLM 요청은 동시에 진행되며 분당 최대 {LLM_REQUESTS_PER_MINUTE:.0f}건으로 제한됩니다.")
+    batch_text = st.text_area("요청 목록 (한 줄에 하나)", height=150, key="batch_requests")
+    batch_file = st.file_uploader("또는 요청 파일 업로드", type=["txt", "json", "jsonl"],
+                                  help=".txt는 한 줄에 요청 하나, .json은 문자열 목록, .jsonl은 한 줄에 요청 하나")
+    batch_workers = st.number_input("동시 요청 수", min_value=1, max_value=32, value=LLM_CONCURRENCY)
+    
+    if st.button("일괄 생성"):
+        try:
+            if batch_file is not None:
+                batch_requests = parse_generation_requests(batch_file.getvalue().decode("utf-8"), batch_file.name)
+            else:
+                batch_requests = parse_generation_requests(batch_text)
+        except Exception as e:
+            batch_requests = None
+            st.error(f"요청 목록을 읽는 중 오류가 발생했습니다: {str(e)}")
+        
+        if batch_requests == []:
+            st.warning("생성할 요청을 입력해주세요.")
+        elif batch_requests:
+            progress_bar = st.progress(0.0, text=f"0/{len(batch_requests)} 생성 중...")
+            
+            def report_batch_progress(done, total, item):
+                progress_bar.progress(done / total, text=f"{done}/{total} 생성 중...")
+            
+            batch_results = get_test_case_generator().generate_test_cases(
+                batch_requests, int(batch_workers), report_batch_progress, use_llm_cache
+            )
+            success_count = sum(1 for item in batch_results if item["status"] == "success")
+            progress_bar.progress(1.0, text=f"{len(batch_results)}/{len(batch_results)} 완료")
+            if success_count == len(batch_results):
+                st.success(f"{success_count}개 테스트 케이스가 생성되었습니다!")
+            else:
+                st.warning(f"{success_count}개 생성, {len(batch_results) - success_count}개 실패")
+            st.dataframe(pd.DataFrame([
+                {
+                    "번호": item["index"] + 1,
+                    "요청": item["request"],
+                    "상태": "성공" if item["status"] == "success" else "실패",
+                    "테스트 케이스 ID": item["test_case_id"] or "",
+                    "제목": (item["test_case"] or {}).get("title", ""),
+                    "캐시": "✓" if item["cached"] else "",
+                    "소요 시간 (초)": item["elapsed"],
+                    "오류": item["error"] or ""
+                }
+                for item in batch_results
+            ]))
+
 elif menu == "테스트 실행":
     st.title("▶️ 테스트 실행")
     
@@ -316,15 +612,40 @@ elif menu == "테스트 실행":
     
     if test_type == "AI Collection":
         # 테스트 케이스 선택
-        cases = load_all_cases()
+        cases = cached_load_all_cases(cases_generation())
         selected_cases = st.multiselect(
             "실행할 테스트 케이스 선택",
             options=[f"{case['id']} - {case['title']}" for case in cases]
         )
         
+        # 동시 실행 옵션
+        with st.expander("동시 실행 설정"):
+            col1, col2 = st.columns(2)
+            with col1:
+                max_workers = st.number_input("동시 실행 수", min_value=1, max_value=1000, value=DEFAULT_MAX_WORKERS,
+                                              help="1이면 순차 실행합니다. asyncio 백엔드에서는 동시에 처리할 최대 요청 수입니다.")
+            with col2:
+                per_host_limit = st.number_input("호스트별 최대 동시 요청 수", min_value=1, max_value=64, value=DEFAULT_PER_HOST_LIMIT)
+            backend_label = st.radio("실행 백엔드", ["스레드", "asyncio"], horizontal=True,
+                                     help="asyncio는 느린 엔드포인트에 대해 많은 요청을 단일 스레드로 동시에 처리합니다.")
+            backend = "async" if backend_label == "asyncio" else "thread"
+        
         # 스케줄링 옵션
-        schedule_type = st.radio("실행 방식", ["즉시 실행", "예약 실행"])
-        if schedule_type == "예약 실행":
+        schedule_type = st.radio("실행 방식", ["즉시 실행", "예약 실행", "부하 테스트"])
+        if schedule_type == "부하 테스트":
+            st.caption("선택한 테스트 케이스 중 첫 번째 케이스를 지정한 부하로 반복 실행합니다.")
+            load_mode = st.radio("부하 방식", ["고정 요청률 (RPS)", "고정 동시성"], horizontal=True)
+            col1, col2 = st.columns(2)
+            with col1:
+                if load_mode == "고정 요청률 (RPS)":
+                    load_rps = st.number_input("초당 요청 수", min_value=1, max_value=10000, value=10)
+                    load_concurrency = None
+                else:
+                    load_concurrency = st.number_input("동시 요청 수", min_value=1, max_value=1000, value=10)
+                    load_rps = None
+            with col2:
+                load_duration = st.number_input("실행 시간 (초)", min_value=1, max_value=3600, value=30)
+        elif schedule_type == "예약 실행":
             col1, col2 = st.columns(2)
             with col1:
                 start_date = st.date_input("시작 날짜", min_value=datetime.now().date())
@@ -346,11 +667,82 @@ elif menu == "테스트 실행":
             
             end_date = st.date_input("종료 날짜", min_value=start_date)
             
+            # 실행 중복 및 누락 실행 처리 옵션
+            with st.expander("⚙️ 실행 옵션"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    job_max_instances = st.number_input("최대 동시 실행 수", min_value=1, max_value=10,
+                                                        value=DEFAULT_JOB_OPTIONS["max_instances"],
+                                                        help="이전 실행이 끝나지 않았을 때 새 실행은 이 수를 넘으면 건너뜁니다")
+                    job_coalesce = st.checkbox("밀린 실행은 한 번만 실행", value=DEFAULT_JOB_OPTIONS["coalesce"],
+                                               help="데몬이 멈춰 있는 동안 여러 번 놓친 실행을 한 번으로 합칩니다")
+                with col2:
+                    job_misfire_grace = st.number_input("누락 허용 시간 (초)", min_value=0, max_value=86400,
+                                                        value=DEFAULT_JOB_OPTIONS["misfire_grace_time"],
+                                                        help="예정 시각보다 이 시간 이상 늦어지면 실행하지 않고 누락으로 기록합니다 (0이면 제한 없음)")
+                    job_jitter = st.number_input("시작 시각 분산 (초)", min_value=0, max_value=3600,
+                                                 value=DEFAULT_JOB_OPTIONS["jitter"],
+                                                 help="같은 시각에 예약된 작업들이 몰리지 않도록 시작 시각을 임의로 늦춥니다")
+            
             # 스케줄 정보 표시
             st.info(f"예약된 테스트 실행 정보:\n"
                    f"- 시작: {start_date} {start_time}\n"
                    f"- 종료: {end_date}\n"
                    f"- 반복: {repeat_type}")
+            
+            # 스케줄러 데몬 상태 및 예약 작업 목록
+            job_store = get_job_store()
+            daemon_status = job_store.get_daemon_status(SCHEDULER_NAME)
+            if daemon_status and daemon_status["alive"]:
+                st.caption(f"🟢 스케줄러 데몬 실행 중 (시작: {daemon_status['started_at']}, "
+                           f"마지막 응답: {daemon_status['heartbeat_age']:.0f}초 전)")
+            else:
+                st.warning("스케줄러 데몬이 실행 중이 아닙니다. 예약 작업은 데몬이 실행되어야 동작합니다. "
+                           "프로젝트 루트에서 `python -m test_engine.scheduler_daemon`으로 실행해주세요.")
+            
+            with st.expander("📅 예약된 작업"):
+                scheduled_jobs = job_store.list_jobs()
+                if scheduled_jobs:
+                    st.dataframe(pd.DataFrame([
+                        {
+                            "ID": job["id"],
+                            "이름": job["name"],
+                            "다음 실행": job["next_run_time"] or "-",
+                            "종료 날짜": job["end_date"] or "-",
+                            "최대 동시 실행": job["options"]["max_instances"],
+                            "밀린 실행 합치기": job["options"]["coalesce"],
+                            "누락 허용 (초)": job["options"]["misfire_grace_time"],
+                            "분산 (초)": job["options"]["jitter"],
+                            "등록 시각": job["created_at"]
+                        }
+                        for job in scheduled_jobs
+                    ]))
+                    job_to_remove = st.selectbox("삭제할 작업", [job["id"] for job in scheduled_jobs])
+                    if st.button("예약 작업 삭제"):
+                        job_store.remove_job(job_to_remove)
+                        st.success(f"예약 작업이 삭제되었습니다. (ID: {job_to_remove})")
+                        st.rerun()
+                else:
+                    st.info("예약된 작업이 없습니다.")
+            
+            with st.expander("🕘 예약 작업 실행 이력"):
+                job_runs = job_store.list_job_runs(limit=100)
+                if job_runs:
+                    st.dataframe(pd.DataFrame([
+                        {
+                            "작업 ID": run["job_id"],
+                            "상태": run["status"],
+                            "예정 시각": run["scheduled_run_time"] or "-",
+                            "시작": run["started_at"] or "-",
+                            "종료": run["finished_at"] or "-",
+                            "소요 시간 (초)": round(run["duration_sec"], 1) if run["duration_sec"] is not None else None,
+                            "결과": run["result"] or "",
+                            "오류": (run["error"] or "").split("\n")[0]
+                        }
+                        for run in job_runs
+                    ]))
+                else:
+                    st.info("실행 이력이 없습니다.")
         
         # 실행 버튼
         if st.button("테스트 실행"):
@@ -361,119 +753,107 @@ elif menu == "테스트 실행":
                     # 스케줄링 설정
                     schedule_id = f"test_schedule_{datetime.now().strftime('%Y%m%d%H%M%S')}"
                     
-                    # 반복 설정에 따른 트리거 생성
+                    # 반복 설정에 따른 cron 트리거 인자 구성
                     if repeat_type == "한 번만":
-                        trigger = CronTrigger(
-                            year=start_date.year,
-                            month=start_date.month,
-                            day=start_date.day,
-                            hour=start_time.hour,
-                            minute=start_time.minute
-                        )
+                        trigger_args = {
+                            "year": start_date.year,
+                            "month": start_date.month,
+                            "day": start_date.day,
+                            "hour": start_time.hour,
+                            "minute": start_time.minute
+                        }
                     elif repeat_type == "매일":
-                        trigger = CronTrigger(
-                            hour=start_time.hour,
-                            minute=start_time.minute
-                        )
+                        trigger_args = {
+                            "hour": start_time.hour,
+                            "minute": start_time.minute
+                        }
                     elif repeat_type == "매주":
-                        trigger = CronTrigger(
-                            day_of_week=','.join([str(i) for i in range(7) if ["월", "화", "수", "목", "금", "토", "일"][i] in days]),
-                            hour=start_time.hour,
-                            minute=start_time.minute
-                        )
+                        trigger_args = {
+                            "day_of_week": ','.join([str(i) for i in range(7) if ["월", "화", "수", "목", "금", "토", "일"][i] in days]),
+                            "hour": start_time.hour,
+                            "minute": start_time.minute
+                        }
                     else:  # 매월
-                        trigger = CronTrigger(
-                            day=day_of_month,
-                            hour=start_time.hour,
-                            minute=start_time.minute
-                        )
+                        trigger_args = {
+                            "day": day_of_month,
+                            "hour": start_time.hour,
+                            "minute": start_time.minute
+                        }
                     
-                    # 스케줄러에 작업 추가
-                    scheduler.add_job(
-                        run_scheduled_test,
-                        trigger=trigger,
-                        id=schedule_id,
-                        replace_existing=True,
-                        end_date=end_date
+                    # 작업 저장소에 등록 (실행은 스케줄러 데몬이 담당)
+                    get_job_store().submit_job(
+                        schedule_id,
+                        SCHEDULED_TEST_FUNC,
+                        "cron",
+                        trigger_args,
+                        kwargs={
+                            "selected_cases": selected_cases,
+                            "env": env.lower(),
+                            "max_workers": max_workers,
+                            "per_host_limit": per_host_limit,
+                            "backend": backend
+                        },
+                        name=f"{repeat_type} {start_time.strftime('%H:%M')} ({len(selected_cases)}개 케이스)",
+                        end_date=str(end_date),
+                        options={
+                            "max_instances": int(job_max_instances),
+                            "coalesce": job_coalesce,
+                            "misfire_grace_time": int(job_misfire_grace),
+                            "jitter": int(job_jitter)
+                        }
                     )
                     
                     st.success(f"테스트가 예약되었습니다! (ID: {schedule_id})")
+                elif schedule_type == "부하 테스트":
+                    case_id = selected_cases[0].split(" - ")[0]
+                    case = next(case for case in cases if case["id"] == case_id)
+                    # 백그라운드에서 실행하고 진행 상황은 아래에서 부하 테스트 ID로 조회
+                    st.session_state.load_result = None
+                    st.session_state.active_load_id = submit_load_test(
+                        case, env.lower(), rps=load_rps, concurrency=load_concurrency, duration=load_duration
+                    )
                 else:
-                    with st.spinner("테스트를 실행 중입니다..."):
-                        results = run_selected_cases(selected_cases, env.lower())
-                        
-                        # 결과 처리
-                        success_count = sum(1 for r in results if r["result"] == "PASS")
-                        fail_count = sum(1 for r in results if r["result"] == "FAIL")
-                        warning_count = sum(1 for r in results if r["result"] == "ERROR")
-                        
-                        # 결과 저장
-                        result_data = {
-                            "id": datetime.now().strftime("%Y%m%d%H%M%S"),
-                            "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            "env": env,
-                            "results": results,
-                            "type": "ai_collection",
-                            "scheduled": schedule_type == "예약 실행"
-                        }
-                        
-                        # 결과 파일 저장
-                        os.makedirs("results", exist_ok=True)
-                        result_file = os.path.join("results", f"test_result_{result_data['id']}.json")
-                        with open(result_file, "w", encoding="utf-8") as f:
-                            json.dump(result_data, f, ensure_ascii=False, indent=2)
-                        
-                        # 세션 상태 업데이트
-                        st.session_state.test_case_result = results
-                        st.session_state.last_test_time = datetime.now()
-                        st.session_state.test_type = "ai_collection"
-                        
-                        # 실패한 테스트 케이스에 대해 이슈 파일 생성
-                        for result in results:
-                            if result["result"] == "FAIL":
-                                issue_file = create_issue_file(result)
-                                print(f"이슈 파일 생성됨: {issue_file}")
-
-        # 결과 표시
-                        st.success("테스트가 완료되었습니다!")
-                        st.metric("성공", success_count)
-                        st.metric("실패", fail_count)
-                        st.metric("경고", warning_count)
-                        
-                        # 상세 결과 표시
-                        with st.expander("상세 결과 보기"):
-                            for result in results:
-                                # print(result)
-                                st.subheader(f"테스트 케이스: {result['id']}")
-                                st.write(f"상태: {result['result']}")
-                                if result['result'] == 'FAIL':
-                                    st.error(f"실패 사유: 상태 코드 {result.get('status_code', 'N/A')}")
-                                elif result['result'] == 'ERROR':
-                                    st.warning(f"경고 사유: {result['reason']}")
-                                st.write("---")
+                    # 백그라운드에서 실행하고 진행 상황은 아래에서 실행 ID로 조회
+                    st.session_state.active_run_id = submit_test_run(
+                        selected_cases, env.lower(), max_workers, per_host_limit, backend
+                    )
+        
+        # 진행 중이거나 마지막으로 실행한 테스트의 진행률/결과 표시
+        if st.session_state.active_run_id:
+            watch_test_run(st.session_state.active_run_id)
+        if st.session_state.active_load_id:
+            watch_load_test(st.session_state.active_load_id)
+        elif st.session_state.load_result:
+            show_load_result(st.session_state.load_result)
     
     else:  # Postman Collection 실행
         st.subheader("Postman Collection 실행")
         collection_path = st.text_input("Postman Collection 경로", "postman/kakao_qa_collection.json")
         
+        # newman 분할 실행 옵션
+        with st.expander("newman 분할 실행 설정"):
+            col1, col2 = st.columns(2)
+            with col1:
+                newman_shards = st.number_input("newman 동시 실행 수", min_value=1, max_value=32, value=NEWMAN_SHARDS,
+                                                help="newman으로 실행할 때 컬렉션을 나눠 newman 프로세스 여러 개로 동시에 실행합니다.")
+            with col2:
+                shard_mode = st.selectbox("분할 기준", SHARD_MODES, index=SHARD_MODES.index(NEWMAN_SHARD_MODE),
+                                          format_func=lambda mode: "최상위 폴더" if mode == "folder" else "요청 순서")
+        
         if st.button("Postman Collection 실행"):
             with st.spinner("Postman Collection을 실행 중입니다..."):
-                result = run_postman_collection(collection_path)
+                progress_bar = st.progress(0.0, text="Postman Collection 실행 중...")
                 
-                # 결과 저장
-                result_data = {
-                    "id": datetime.now().strftime("%Y%m%d%H%M%S"),
-                    "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "env": env,
-                    "postman_result": result,
-                    "type": "postman"
-                }
+                def report_postman_progress(done, total, execution):
+                    name = execution.get("item", {}).get("name", "")
+                    progress_bar.progress(min(done / total, 1.0) if total else 0.0, text=f"{done}/{total} {name}")
                 
-                # 결과 파일 저장
-                os.makedirs("results", exist_ok=True)
-                result_file = os.path.join("results", f"test_result_{result_data['id']}.json")
-                with open(result_file, "w", encoding="utf-8") as f:
-                    json.dump(result_data, f, ensure_ascii=False, indent=2)
+                # 요청 결과는 끝나는 대로 실행 기록에 저장됨
+                with RunWriter(env=env, test_type="postman") as writer:
+                    result = run_postman_collection(collection_path, shards=newman_shards, shard_mode=shard_mode,
+                                                    writer=writer, progress_callback=report_postman_progress)
+                    writer.set_postman_result(result)
+                progress_bar.empty()
                 
                 # 세션 상태 업데이트
                 st.session_state.postman_result = result
@@ -482,75 +862,11 @@ elif menu == "테스트 실행":
                 
                 if result["status"] == "success":
                     st.success("✅ Postman Collection 실행 완료!")
+                    st.caption("실행 엔진: " + ("내장 실행기" if result.get("engine") == "native" else "newman")
+                               + (f" (프로세스 {result['raw_result']['run']['shards']}개)"
+                                  if result["raw_result"].get("run", {}).get("shards") else ""))
                     
-                    # 결과 분석
-                    output_lines = result["output"].split('\n')
-                    success_count = sum(1 for line in output_lines if "✅" in line)
-                    fail_count = sum(1 for line in output_lines if "❌" in line)
-                    warning_count = sum(1 for line in output_lines if "⚠️" in line)
-                    total_count = success_count + fail_count + warning_count
-                    
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("전체 실행", total_count)
-                    with col2:
-                        st.metric("성공률", f"{(success_count/total_count*100 if total_count > 0 else 0):.1f}%")
-                    with col3:
-                        st.metric("실패률", f"{(fail_count/total_count*100 if total_count > 0 else 0):.1f}%")
-                    with col4:
-                        st.metric("중단율", f"{(warning_count/total_count*100 if total_count > 0 else 0):.1f}%")
-                    
-                    # Postman 상세 결과
-                    st.header("📝 Postman Collection 상세 결과")
-                    with st.expander("상세 결과 보기"):
-                        # 결과 요약 표시
-                        st.markdown(f"### 📊 결과 요약")
-                        st.markdown(f"- 총 요청 수: {total_count}")
-                        st.markdown(f"- 성공: {success_count}")
-                        st.markdown(f"- 실패: {fail_count}")
-                        st.markdown(f"- 경고: {warning_count}")
-                        st.markdown("---")
-                        
-                        # 상세 결과 표시
-                        st.markdown("### 📝 상세 결과")
-                        for line in output_lines:
-                            if "✅" in line or "❌" in line or "⚠️" in line:
-                                # 요청 정보 추출
-                                request_info = line.split(" - ")
-                                if len(request_info) > 1:
-                                    method_name = request_info[0].strip()
-                                    status = request_info[1].strip()
-                                    
-                                    # 요청 정보 표시
-                                    st.markdown(f"#### {method_name}")
-                                    if "✅" in status:
-                                        st.success(f"상태: {status}")
-                                    elif "❌" in status:
-                                        st.error(f"상태: {status}")
-                                    else:
-                                        st.warning(f"상태: {status}")
-                                    
-                                    # URL 정보 표시
-                                    for next_line in output_lines[output_lines.index(line)+1:]:
-                                        if "URL:" in next_line:
-                                            st.text(next_line)
-                                            break
-                                    
-                                    # 응답 본문 또는 경고 메시지 표시
-                                    if "❌" in status:
-                                        for next_line in output_lines[output_lines.index(line)+1:]:
-                                            if "응답 본문:" in next_line:
-                                                st.code(next_line.replace("응답 본문:", "").strip(), language="json")
-                                                break
-                                    elif "⚠️" in status:
-                                        for next_line in output_lines[output_lines.index(line)+1:]:
-                                            if "실패 사유:" in next_line:
-                                                st.text(next_line)
-                                                break
-                                else:
-                                    st.text(line)
-                            else:
-                                st.text(line)  # 일반 텍스트 라인도 표시
+                    show_postman_result(result)
                 else:
                     st.error("❌ Postman Collection 실행 실패")
                     st.text(result["error"])
@@ -563,74 +879,7 @@ elif menu == "결과 확인":
         st.header("📈 Postman Collection 통계")
         result = st.session_state.postman_result
         if result["status"] == "success":
-            # Postman 결과 분석
-            output_lines = result["output"].split('\n')
-            success_count = sum(1 for line in output_lines if "✅" in line)
-            fail_count = sum(1 for line in output_lines if "❌" in line)
-            warning_count = sum(1 for line in output_lines if "⚠️" in line)
-            total_count = success_count + fail_count + warning_count
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("전체 실행", total_count)
-            with col2:
-                st.metric("성공률", f"{(success_count/total_count*100 if total_count > 0 else 0):.1f}%")
-            with col3:
-                st.metric("실패률", f"{(fail_count/total_count*100 if total_count > 0 else 0):.1f}%")
-            with col4:
-                st.metric("중단율", f"{(warning_count/total_count*100 if total_count > 0 else 0):.1f}%")
-            
-            # Postman 상세 결과
-            st.header("📝 Postman Collection 상세 결과")
-            with st.expander("상세 결과 보기"):
-                # 결과 요약 표시
-                st.markdown(f"### 📊 결과 요약")
-                st.markdown(f"- 총 요청 수: {total_count}")
-                st.markdown(f"- 성공: {success_count}")
-                st.markdown(f"- 실패: {fail_count}")
-                st.markdown(f"- 경고: {warning_count}")
-                st.markdown("---")
-                
-                # 상세 결과 표시
-                st.markdown("### 📝 상세 결과")
-                for line in output_lines:
-                    if "✅" in line or "❌" in line or "⚠️" in line:
-                        # 요청 정보 추출
-                        request_info = line.split(" - ")
-                        if len(request_info) > 1:
-                            method_name = request_info[0].strip()
-                            status = request_info[1].strip()
-                            
-                            # 요청 정보 표시
-                            st.markdown(f"#### {method_name}")
-                            if "✅" in status:
-                                st.success(f"상태: {status}")
-                            elif "❌" in status:
-                                st.error(f"상태: {status}")
-                            else:
-                                st.warning(f"상태: {status}")
-                            
-                            # URL 정보 표시
-                            for next_line in output_lines[output_lines.index(line)+1:]:
-                                if "URL:" in next_line:
-                                    st.text(next_line)
-                                    break
-                            
-                            # 응답 본문 또는 경고 메시지 표시
-                            if "❌" in status:
-                                for next_line in output_lines[output_lines.index(line)+1:]:
-                                    if "응답 본문:" in next_line:
-                                        st.code(next_line.replace("응답 본문:", "").strip(), language="json")
-                                        break
-                            elif "⚠️" in status:
-                                for next_line in output_lines[output_lines.index(line)+1:]:
-                                    if "실패 사유:" in next_line:
-                                        st.text(next_line)
-                                        break
-                        else:
-                            st.text(line)
-                    else:
-                        st.text(line)  # 일반 텍스트 라인도 표시
+            show_postman_result(result)
     
     elif st.session_state.test_type == "ai_collection" and st.session_state.test_case_result:
         st.header("📊 AI Collection 통계")
@@ -650,6 +899,15 @@ elif menu == "결과 확인":
         with col4:
             st.metric("중단율", f"{(warning_count/total_count*100 if total_count > 0 else 0):.1f}%")
         
+        # 구간별 응답 시간
+        timing_rows = [
+            {"테스트 ID": r["id"], **r["timings"], "요청 바이트": r.get("request_bytes"), "응답 바이트": r.get("response_bytes")}
+            for r in results if r.get("timings")
+        ]
+        if timing_rows:
+            st.header("⏱️ 구간별 응답 시간 (ms)")
+            st.dataframe(pd.DataFrame(timing_rows))
+        
         # AI Collection 상세 결과
         st.header("📝 AI Collection 상세 결과")
         with st.expander("상세 결과 보기"):
@@ -668,7 +926,7 @@ elif menu == "결과 확인":
     
     # 테스트 실행 선택 및 보고서 생성
     st.header("📋 보고서 생성")
-    test_runs = load_test_runs()
+    test_runs, _ = load_test_run_page("report_run_page")
     if test_runs:
         selected_run = st.selectbox("테스트 실행 선택", test_runs)
         
@@ -682,20 +940,8 @@ elif menu == "결과 확인":
                 print(f"선택된 실행: {selected_run}")
                 print(f"추출된 ID: {run_id}")
                 
-                # 파일 경로 조회 (여러 가능한 형식 시도)
-                result_files = [
-                    os.path.join("results", f"test_result_{run_id}.json"),  # 기본 형식
-                    os.path.join("results", f"{run_id}.json"),              # 단순 ID
-                    # 폴더 내 파일 검색
-                    *[os.path.join("results", f) for f in os.listdir("results") if f.endswith(".json") and run_id in f]
-                ]
-                
-                # 존재하는 파일 찾기
-                result_file = None
-                for file_path in result_files:
-                    if os.path.exists(file_path):
-                        result_file = file_path
-                        break
+                # 결과 파일 조회 (실행 기록 및 이전 형식 모두 지원)
+                result_file = find_result_file(run_id)
                 
                 if result_file:
                     try:
@@ -761,58 +1007,23 @@ elif menu == "테스트 케이스 관리":
         st.query_params["reset_filter"] = True
         st.rerun()
     
-    # 모든 테스트 케이스 로드
-    all_cases = load_all_cases()
-    
-    # 검색 결과 필터링
-    filtered_cases = []
-    for case in all_cases:
-        should_include = True
-        
-        # 검색어 필터링
-        if search_query:
-            search_text = ""
-            if search_type == "전체":
-                search_text = f"{case.get('title', '')} {case.get('description', '')} {' '.join(case.get('tags', []))}"
-            elif search_type == "제목":
-                search_text = case.get('title', '')
-            elif search_type == "설명":
-                search_text = case.get('description', '')
-            elif search_type == "태그":
-                search_text = ' '.join(case.get('tags', []))
-            
-            if search_query.lower() not in search_text.lower():
-                should_include = False
-        
-        # 기능 필터링
-        if feature_filter != "전체":
-            # 파일 경로에서 기능 추출
-            filepath = case.get('filepath', '')
-            case_feature = '기타'
-            
-            # 파일 경로 정규화
-            filepath = filepath.replace('\\', '/') if '\\' in filepath else filepath
-            
-            # cases/기능디렉토리/파일명.json 형식에서 기능 디렉토리 추출
-            path_parts = filepath.split('/')
-            if len(path_parts) >= 2 and 'cases' in path_parts:
-                cases_index = path_parts.index('cases')
-                if len(path_parts) > cases_index + 1:
-                    case_feature = path_parts[cases_index + 1]
-            
-            # 선택된 기능과 일치하지 않으면 제외
-            if case_feature != feature_filter:
-                should_include = False
-        
-        if should_include:
-            filtered_cases.append(case)
+    # 검색 결과 필터링 (케이스가 바뀌지 않았으면 캐시된 결과 사용)
+    filtered_cases = cached_filter_managed_cases(cases_generation(), search_query, search_type, feature_filter)
     
     # 검색 결과 표시
     st.subheader(f"검색 결과 ({len(filtered_cases)}개)")
     
     if filtered_cases:
+        # 케이스가 많으면 페이지 단위로 표시
+        total_pages = max(1, -(-len(filtered_cases) // CASE_PAGE_SIZE))
+        page = 1
+        if total_pages > 1:
+            page = st.number_input(f"페이지 (전체 {total_pages})", min_value=1, max_value=total_pages, value=1,
+                                   key="case_page")
+        page_cases = filtered_cases[(page - 1) * CASE_PAGE_SIZE:page * CASE_PAGE_SIZE]
+        
         # 결과를 그리드 형태로 표시
-        for case in filtered_cases:
+        for case in page_cases:
             with st.expander(f"📄 {case['title']}"):
                 col1, col2 = st.columns([3, 1])
                 with col1:
@@ -874,8 +1085,9 @@ elif menu == "테스트 케이스 관리":
                         
                         # 수정 버튼
                         if st.form_submit_button("수정"):
-                            # 수정된 테스트 케이스 데이터 구성
+                            # 수정된 테스트 케이스 데이터 구성 (요청 정보 등 나머지 필드는 유지)
                             updated_case = {
+                                **case,
                                 'id': case['id'],
                                 'title': new_title,
                                 'description': new_description,
@@ -889,8 +1101,7 @@ elif menu == "테스트 케이스 관리":
                             
                             # 파일 업데이트
                             try:
-                                with open(case['filepath'], 'w', encoding='utf-8') as f:
-                                    json.dump(updated_case, f, ensure_ascii=False, indent=2)
+                                save_case(updated_case)
                                 st.success("테스트 케이스가 성공적으로 수정되었습니다!")
                             except Exception as e:
                                 st.error(f"테스트 케이스 수정 중 오류가 발생했습니다: {str(e)}")
@@ -907,25 +1118,29 @@ elif menu == "대시보드":
     
     # 테스트 실행 추이 그래프
     st.header("📈 테스트 실행 추이")
-    test_history = load_test_history()
+    test_history = cached_load_history_frame(results_generation())
     fig = plot_test_trend(test_history)
     st.plotly_chart(fig)
     
+    # 구간별 응답 시간
+    st.header("⏱️ 응답 시간 분석")
+    st.plotly_chart(plot_latency_breakdown(test_history))
+    
     # 테스트 커버리지
     st.header("🎯 테스트 커버리지")
-    coverage_data = calculate_coverage()
+    coverage_data = cached_calculate_coverage(cases_generation())
     st.altair_chart(plot_coverage(coverage_data))
     
     # 실패 패턴 분석
     st.header("🔍 실패 패턴 분석")
-    failure_patterns = analyze_failure_patterns()
+    failure_patterns = cached_analyze_failure_patterns(results_generation())
     st.dataframe(failure_patterns)
 
 elif menu == "결과 분석":
     st.title("📊 결과 분석")
     
     # 테스트 실행 선택
-    test_runs = load_test_runs()
+    test_runs, run_page = load_test_run_page("analysis_run_page")
     if not test_runs:
         st.warning("분석할 테스트 실행 이력이 없습니다.")
     else:
@@ -944,6 +1159,11 @@ elif menu == "결과 분석":
                 current_index = test_runs.index(selected_run)
                 if current_index < len(test_runs) - 1:
                     comparison_run = test_runs[current_index + 1]
+                else:
+                    # 현재 페이지의 마지막 실행이면 다음 페이지의 첫 실행과 비교
+                    next_page = cached_load_test_runs(results_generation(), limit=1, offset=run_page * RUN_PAGE_SIZE)
+                    comparison_run = next_page[0] if next_page else None
+                if comparison_run:
                     st.info(f"비교 대상: {comparison_run}")
                 else:
                     st.warning("이전 실행이 없습니다.")
@@ -1091,6 +1311,7 @@ elif menu == "설정":
     if st.button("JIRA 연결 테스트"):
         try:
             with st.spinner("JIRA 연결 테스트 중..."):
+                from integrations.jira_api import JiraAPI
                 jira_client = JiraAPI()
                 result = jira_client.test_connection()
                 
@@ -1172,6 +1393,41 @@ elif menu == "설정":
         except Exception as e:
             st.error(f"설정 저장 중 오류가 발생했습니다: {str(e)}")
     
+    # AI 모델
+    st.header("🤖 AI 모델")
+    with st.expander("사용 가능한 모델 확인"):
+        if LLM_BACKEND != "gemini":
+            st.info(f"현재 LLM 백엔드는 `{LLM_BACKEND}`입니다. (TESTFLOW_LLM_BACKEND) 아래 목록은 Gemini 모델 목록입니다.")
+        st.markdown(f"테스트 케이스 생성에 사용하는 모델: `{GEMINI_MODEL}`")
+        st.caption(f"모델 목록은 {MODEL_LIST_TTL}초 동안 캐시됩니다.")
+        refresh_models = st.button("새로 조회")
+        if st.button("모델 목록 보기") or refresh_models:
+            try:
+                with st.spinner("모델 목록을 조회하는 중..."):
+                    model_names = list_available_models(refresh=refresh_models)
+                if f"models/{GEMINI_MODEL}" not in model_names:
+                    st.warning(f"현재 모델({GEMINI_MODEL})이 사용 가능한 모델 목록에 없습니다.")
+                st.write(model_names)
+            except Exception as e:
+                st.error(f"모델 목록 조회 중 오류가 발생했습니다: {str(e)}")
+    with st.expander("LLM 응답 캐시"):
+        cache_stats = get_llm_cache().stats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("저장된 응답", cache_stats["entries"])
+        with col2:
+            st.metric("적중률", f"{cache_stats['hit_rate'] * 100:.1f}%")
+        with col3:
+            st.metric("적중 / 미적중", f"{cache_stats['hits']} / {cache_stats['misses']}")
+        with col4:
+            st.metric("크기", f"{cache_stats['size_bytes'] / 1024:.1f} KB")
+        st.caption(f"최대 {LLM_CACHE_MAX_ENTRIES}개 응답을 보관하며, 넘으면 가장 오래 사용하지 않은 응답부터 삭제합니다. "
+                   f"(지금까지 삭제된 응답: {cache_stats['evictions']}개)")
+        if st.button("캐시 비우기"):
+            get_llm_cache().clear()
+            st.success("LLM 응답 캐시를 비웠습니다.")
+            st.rerun()
+    
     # 환경 설정
     st.header("🌐 환경 설정")
     with st.expander("테스트 환경 설정"):
@@ -0,0 +1,175 @@
+"""
+테스트 이력 분석 및 시각화
+
+pandas가 필요한 대시보드/분석 기능을 실행 경로(test_runner)와 분리해 둔 모듈입니다.
+헤드리스 실행에서는 이 모듈을 임포트하지 않으며, 차트 라이브러리(plotly, altair)는 차트를 그릴 때 임포트합니다.
+"""
+from typing import List, Dict, Any, Optional, Union
+
+import pandas as pd
+
+from test_engine.history_store import load_history_frame, history_frame_from_runs
+from test_engine.failure_stats import load_failure_patterns
+
+def _as_history_frame(test_history: Union[pd.DataFrame, List[Dict[str, Any]], None]) -> pd.DataFrame:
+    """실행 기록 목록 또는 이력 DataFrame을 이력 DataFrame으로 맞춥니다. (None이면 전체 이력 로드)"""
+    if test_history is None:
+        return load_history_frame()
+    if isinstance(test_history, pd.DataFrame):
+        return test_history
+    return history_frame_from_runs(test_history)
+
+def plot_test_trend(test_history: Union[pd.DataFrame, List[Dict[str, Any]], None] = None) -> "go.Figure":
+    """테스트 실행 추이를 시각화합니다."""
+    import plotly.graph_objects as go
+    
+    df = _as_history_frame(test_history)
+    if df.empty:
+        # 빈 데이터로 기본 그래프 생성
+        fig = go.Figure()
+        fig.add_annotation(
+            text="테스트 실행 이력이 없습니다",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5,
+            showarrow=False
+        )
+        return fig
+    
+    # 실행 × 결과별 카운트 계산 (실행마다 한 점, x축은 실행 시각)
+    result_counts = df.groupby(['run_id', 'result']).size().unstack(fill_value=0)
+    result_counts.index = df.groupby('run_id')['execution_time'].min().loc[result_counts.index]
+    result_counts = result_counts.sort_index()
+    
+    # 그래프 생성
+    fig = go.Figure()
+    
+    # 각 결과별로 선 추가
+    for result in ['PASS', 'FAIL', 'ERROR']:
+        if result in result_counts.columns:
+            fig.add_trace(go.Scatter(
+                x=result_counts.index,
+                y=result_counts[result],
+                name=result,
+                mode='lines+markers'
+            ))
+    
+    # 레이아웃 설정
+    fig.update_layout(
+        title='테스트 실행 추이',
+        xaxis_title='실행 시간',
+        yaxis_title='실행 횟수',
+        legend_title='결과',
+        hovermode='x unified'
+    )
+    
+    return fig
+
+TIMING_COLUMNS = ["connect_ms", "tls_ms", "ttfb_ms", "download_ms", "total_ms"]
+
+def build_latency_frame(test_history: Union[pd.DataFrame, List[Dict[str, Any]], None] = None) -> pd.DataFrame:
+    """테스트 실행 이력에서 구간별 응답 시간과 송수신 바이트 수를 추출합니다."""
+    df = _as_history_frame(test_history)
+    # 구간별 시간이 기록된 결과만 사용 (Postman 결과는 전체 시간만 있음)
+    df = df[df['ttfb_ms'].notna()]
+    df = df.rename(columns={'case_id': 'test_id'})
+    return df[['execution_time', 'test_id', 'env', 'request_bytes', 'response_bytes'] + TIMING_COLUMNS]
+
+def plot_latency_breakdown(test_history: Union[pd.DataFrame, List[Dict[str, Any]], None] = None) -> "go.Figure":
+    """테스트 케이스별 평균 응답 시간을 구간별로 시각화합니다."""
+    import plotly.graph_objects as go
+    
+    df = build_latency_frame(test_history)
+    fig = go.Figure()
+    if df.empty:
+        fig.add_annotation(
+            text="응답 시간 데이터가 없습니다",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5,
+            showarrow=False
+        )
+        return fig
+    
+    # 케이스별 구간 평균 (ms)
+    averages = df.groupby('test_id')[TIMING_COLUMNS].mean().fillna(0)
+    labels = {
+        'connect_ms': '연결',
+        'tls_ms': 'TLS',
+        'ttfb_ms': '첫 바이트 대기',
+        'download_ms': '다운로드'
+    }
+    for column, label in labels.items():
+        fig.add_trace(go.Bar(x=averages.index, y=averages[column], name=label))
+    
+    fig.update_layout(
+        title='테스트 케이스별 평균 응답 시간 (ms)',
+        barmode='stack',
+        xaxis_title='테스트 ID',
+        yaxis_title='시간 (ms)',
+        legend_title='구간'
+    )
+    
+    return fig
+
+def analyze_failure_patterns(test_history: Union[pd.DataFrame, List[Dict[str, Any]], None] = None,
+                             env: Optional[str] = None) -> pd.DataFrame:
+    """
+    실패 패턴을 분석합니다.
+
+    test_history를 주지 않으면 결과 DB에 누적된 실패 집계를 조회하고,
+    주면 해당 이력만으로 집계합니다.
+    """
+    if test_history is None:
+        return load_failure_patterns(env)
+    
+    df = _as_history_frame(test_history)
+    if env:
+        df = df[df['env'] == env]
+    
+    # 실패한 테스트만 필터링 (최근 실패가 먼저 오도록 정렬)
+    failures = df[df['result'] == 'FAIL']
+    if failures.empty:
+        return pd.DataFrame()
+    failures = failures.sort_values('execution_time', ascending=False)
+    
+    # 테스트 ID별 실패 횟수와 가장 최근 실패 정보
+    grouped = failures.groupby('case_id', sort=False)
+    patterns = grouped[['desc', 'status_code', 'execution_time', 'env']].first()
+    patterns['count'] = grouped.size()
+    patterns = patterns.reset_index()
+    
+    df = pd.DataFrame({
+        "테스트 ID": patterns['case_id'],
+        "설명": patterns['desc'].fillna('N/A'),
+        "상태 코드": patterns['status_code'].astype(object).where(patterns['status_code'].notna(), 'N/A'),
+        "실패 횟수": patterns['count'],
+        "마지막 실패": patterns['execution_time'].dt.strftime("%Y-%m-%d %H:%M:%S"),
+        "환경": patterns['env'].fillna('N/A')
+    })
+    return df.sort_values("실패 횟수", ascending=False, kind="stable").reset_index(drop=True)
+
+def plot_coverage(coverage_data: Dict[str, float]) -> "alt.Chart":
+    """테스트 커버리지를 시각화합니다."""
+    import altair as alt
+    
+    # 데이터프레임 생성
+    df = pd.DataFrame({
+        '기능': list(coverage_data.keys()),
+        '커버리지': list(coverage_data.values())
+    })
+    
+    # 전체 커버리지 제외
+    df = df[df['기능'] != '전체']
+    
+    # 차트 생성
+    chart = alt.Chart(df).mark_bar().encode(
+        x='기능',
+        y='커버리지',
+        color=alt.Color('커버리지', scale=alt.Scale(scheme='redyellowgreen', domain=[0, 100])),
+        tooltip=['기능', '커버리지']
+    ).properties(
+        title='테스트 커버리지',
+        width=600,
+        height=400
+    )
+    
+    return chart
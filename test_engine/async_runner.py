@@ -0,0 +1,165 @@
+import os
+import json
+import time
+import asyncio
+from typing import List, Dict, Any, Optional
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp는 async 백엔드에서만 필요
+    aiohttp = None
+
+from test_engine.test_runner import (
+    case_url,
+    build_result,
+    build_error_result,
+    save_result
+)
+from test_engine.case_repository import get_case_repository
+from test_engine.run_store import RunWriter
+
+# 단일 스레드에서 유지할 최대 동시 요청 수 (환경 변수로 조정 가능)
+DEFAULT_ASYNC_CONCURRENCY = int(os.getenv("TESTFLOW_ASYNC_CONCURRENCY", "1000"))
+# 호스트별 최대 동시 요청 수 (0이면 제한 없음)
+DEFAULT_ASYNC_PER_HOST_LIMIT = int(os.getenv("TESTFLOW_ASYNC_PER_HOST_LIMIT", "0"))
+
+def require_aiohttp():
+    """aiohttp 설치 여부를 확인합니다."""
+    if aiohttp is None:
+        raise RuntimeError("async 실행 백엔드를 사용하려면 aiohttp가 필요합니다. (pip install aiohttp)")
+
+def create_trace_config() -> "aiohttp.TraceConfig":
+    """연결 수립 시간과 요청 크기를 trace_request_ctx(dict)에 기록하는 TraceConfig를 생성합니다."""
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_connection_create_start(session, context, params):
+        context.trace_request_ctx["connect_start"] = time.perf_counter()
+
+    async def on_connection_create_end(session, context, params):
+        ctx = context.trace_request_ctx
+        ctx["connect_ms"] = (time.perf_counter() - ctx["connect_start"]) * 1000
+
+    async def on_request_headers_sent(session, context, params):
+        ctx = context.trace_request_ctx
+        ctx["request_bytes"] = len(f"{params.method} {params.url.path_qs} HTTP/1.1\r\n")
+        ctx["request_bytes"] += sum(len(f"{key}: {value}\r\n") for key, value in params.headers.items()) + 2
+
+    async def on_request_chunk_sent(session, context, params):
+        ctx = context.trace_request_ctx
+        ctx["request_bytes"] = ctx.get("request_bytes", 0) + len(params.chunk)
+
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_headers_sent.append(on_request_headers_sent)
+    trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+    return trace_config
+
+async def run_test_case_async(case: Dict[str, Any], env: str = "dev",
+                              session: Optional["aiohttp.ClientSession"] = None,
+                              writer: Optional[RunWriter] = None) -> Dict[str, Any]:
+    """단일 테스트 케이스를 asyncio로 실행합니다. 결과 형식은 run_test_case와 동일합니다."""
+    require_aiohttp()
+
+    if session is None:
+        async with aiohttp.ClientSession(trace_configs=[create_trace_config()]) as own_session:
+            return await run_test_case_async(case, env, own_session, writer)
+
+    loop = asyncio.get_running_loop()
+    try:
+        # 요청 정보 추출
+        url = case_url(case, env)
+        trace_ctx = {}
+        start = time.perf_counter()
+        async with session.request(
+            case.get("method", "GET"),
+            url,
+            headers=case.get("headers", {}),
+            json=case.get("body", {}),
+            trace_request_ctx=trace_ctx
+        ) as response:
+            headers_at = time.perf_counter()
+            raw_body = await response.read()
+            end = time.perf_counter()
+            text = raw_body.decode(response.get_encoding(), errors="replace")
+            if response.headers.get("content-type", "").startswith("application/json"):
+                body = json.loads(text)
+            else:
+                body = text
+            result = build_result(case, env, response.status, body,
+                                  build_metrics(response, raw_body, trace_ctx, start, headers_at, end))
+    except Exception as e:
+        result = build_error_result(case, env, e)
+
+    # 파일 저장은 이벤트 루프를 막지 않도록 스레드 풀에서 처리
+    await loop.run_in_executor(None, save_result, result, writer)
+    return result
+
+def build_metrics(response: "aiohttp.ClientResponse", raw_body: bytes, trace_ctx: Dict[str, Any],
+                  start: float, headers_at: float, end: float) -> Dict[str, Any]:
+    """aiohttp 응답의 구간별 소요 시간과 송수신 바이트 수를 계산합니다.
+
+    aiohttp는 TLS 핸드셰이크를 연결 수립과 구분하지 않으므로 HTTPS에서는
+    connect_ms에 TLS 시간이 포함되고 tls_ms는 None으로 기록합니다.
+    """
+    connect_ms = trace_ctx.get("connect_ms", 0.0)
+    response_bytes = len(f"HTTP/1.1 {response.status} {response.reason}\r\n")
+    response_bytes += sum(len(f"{key}: {value}\r\n") for key, value in response.headers.items()) + 2
+    return {
+        "timings": {
+            "connect_ms": round(connect_ms, 3),
+            "tls_ms": None if response.url.scheme == "https" else 0.0,
+            "ttfb_ms": round(max((headers_at - start) * 1000 - connect_ms, 0.0), 3),
+            "download_ms": round((end - headers_at) * 1000, 3),
+            "total_ms": round((end - start) * 1000, 3)
+        },
+        "request_bytes": trace_ctx.get("request_bytes", 0),
+        "response_bytes": response_bytes + len(raw_body)
+    }
+
+async def run_cases_async(cases: List[Dict[str, Any]], env: str = "dev",
+                          max_concurrency: Optional[int] = None,
+                          per_host_limit: Optional[int] = None,
+                          writer: Optional[RunWriter] = None) -> List[Dict[str, Any]]:
+    """
+    테스트 케이스들을 하나의 이벤트 루프에서 동시에 실행하고 원래 순서대로 결과를 반환합니다.
+
+    실행 중 취소가 요청되면 아직 시작하지 않은 케이스는 건너뛰고 실행된 결과만 반환합니다.
+    """
+    require_aiohttp()
+    if writer is None:
+        with RunWriter(env=env) as own_writer:
+            return await run_cases_async(cases, env, max_concurrency, per_host_limit, own_writer)
+
+    max_concurrency = max_concurrency or DEFAULT_ASYNC_CONCURRENCY
+    per_host_limit = DEFAULT_ASYNC_PER_HOST_LIMIT if per_host_limit is None else per_host_limit
+
+    # 커넥터가 전체/호스트별 동시 연결 수를 제한하고 keep-alive 연결을 재사용
+    connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=per_host_limit)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with aiohttp.ClientSession(connector=connector, trace_configs=[create_trace_config()]) as session:
+        async def run_limited(case):
+            async with semaphore:
+                if writer.cancelled:
+                    return None
+                return await run_test_case_async(case, env, session, writer)
+
+        # gather는 입력 순서대로 결과를 반환
+        results = await asyncio.gather(*(run_limited(case) for case in cases))
+        return [result for result in results if result is not None]
+
+def run_cases_async_blocking(cases: List[Dict[str, Any]], env: str = "dev",
+                             max_concurrency: Optional[int] = None,
+                             per_host_limit: Optional[int] = None,
+                             writer: Optional[RunWriter] = None) -> List[Dict[str, Any]]:
+    """동기 코드(Streamlit, 스케줄러 등)에서 async 백엔드를 실행합니다."""
+    return list(asyncio.run(run_cases_async(cases, env, max_concurrency, per_host_limit, writer)))
+
+def run_selected_cases_async(selected_cases: List[str], env: str = "dev",
+                             max_concurrency: Optional[int] = None,
+                             per_host_limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """선택된 테스트 케이스들을 async 백엔드로 실행합니다."""
+    selected_ids = list(dict.fromkeys(case.split(" - ")[0] for case in selected_cases))
+    repository = get_case_repository()
+    cases_to_run = [case for case in (repository.get(case_id) for case_id in selected_ids) if case]
+    return run_cases_async_blocking(cases_to_run, env, max_concurrency, per_host_limit)
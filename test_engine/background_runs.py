@@ -0,0 +1,165 @@
+"""
+백그라운드 테스트 실행
+
+UI 요청을 처리하는 스레드를 막지 않도록 테스트 실행을 별도 스레드에서 진행합니다.
+실행은 시작하자마자 실행 ID를 돌려주며, 케이스 결과는 완료되는 대로 실행 기록과 결과 DB에
+추가되므로 진행 상황은 결과 DB에서 실행 ID로 조회합니다.
+부하 테스트는 오래 걸리는 부하 테스트가 즉시 실행을 막지 않도록 별도 스레드 풀에서 실행하며,
+결과는 끝난 뒤 부하 테스트 ID로 한 번 꺼내 갑니다.
+"""
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from test_engine.run_store import RunWriter, generate_run_id
+from test_engine.result_db import get_result_db
+
+# 동시에 진행할 수 있는 백그라운드 실행 수
+BACKGROUND_RUN_WORKERS = int(os.getenv("TESTFLOW_BACKGROUND_RUN_WORKERS", "2"))
+# 동시에 진행할 수 있는 부하 테스트 수
+LOAD_TEST_WORKERS = int(os.getenv("TESTFLOW_LOAD_TEST_WORKERS", "1"))
+
+_executor = None
+_load_executor = None
+_executor_lock = threading.Lock()
+# _active_writers, _load_tests는 UI 스레드와 작업 스레드에서 함께 쓰므로 이 잠금을 잡고 접근
+_state_lock = threading.Lock()
+# 이 프로세스에서 진행 중인 실행 (실행 ID -> RunWriter)
+_active_writers: Dict[str, RunWriter] = {}
+# 이 프로세스에서 제출한 부하 테스트 중 결과를 아직 꺼내 가지 않은 것 (부하 테스트 ID -> 상태)
+_load_tests: Dict[str, Dict[str, Any]] = {}
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=BACKGROUND_RUN_WORKERS, thread_name_prefix="testflow-run")
+        return _executor
+
+def _get_load_executor() -> ThreadPoolExecutor:
+    global _load_executor
+    with _executor_lock:
+        if _load_executor is None:
+            _load_executor = ThreadPoolExecutor(max_workers=LOAD_TEST_WORKERS, thread_name_prefix="testflow-load")
+        return _load_executor
+
+def _run_in_background(writer: RunWriter, selected_cases: List[str], env: str,
+                       max_workers: Optional[int], per_host_limit: Optional[int], backend: str) -> None:
+    # 실행할 때만 필요한 모듈은 지연 임포트 (test_runner가 이 모듈을 참조하지 않도록)
+    from test_engine.test_runner import run_selected_cases, create_issue_file
+
+    try:
+        with writer:
+            results = run_selected_cases(selected_cases, env, max_workers, per_host_limit, backend, writer)
+
+        # 실패한 테스트 케이스에 대해 이슈 파일 생성
+        for result in results:
+            if result["result"] == "FAIL":
+                issue_file = create_issue_file(result)
+                print(f"이슈 파일 생성됨: {issue_file}")
+    except Exception as e:
+        print(f"백그라운드 테스트 실행 중 오류 발생 ({writer.run_id}): {str(e)}")
+    finally:
+        with _state_lock:
+            _active_writers.pop(writer.run_id, None)
+
+def submit_test_run(selected_cases: List[str], env: str = "dev",
+                    max_workers: Optional[int] = None, per_host_limit: Optional[int] = None,
+                    backend: str = "thread") -> str:
+    """
+    선택된 테스트 케이스 실행을 백그라운드에 등록하고 바로 실행 ID를 반환합니다.
+
+    Args:
+        selected_cases: 실행할 케이스 목록 ("ID - 제목" 형식)
+        env: 테스트 환경
+        max_workers: 동시 실행 수
+        per_host_limit: 호스트별 최대 동시 요청 수
+        backend: 실행 백엔드 (thread, async)
+
+    Returns:
+        실행 ID
+    """
+    writer = RunWriter(env=env, test_type="ai_collection", scheduled=False)
+    writer.set_total(len(dict.fromkeys(case.split(" - ")[0] for case in selected_cases)))
+    with _state_lock:
+        _active_writers[writer.run_id] = writer
+    try:
+        _get_executor().submit(_run_in_background, writer, selected_cases, env,
+                               max_workers, per_host_limit, backend)
+    except Exception:
+        with _state_lock:
+            _active_writers.pop(writer.run_id, None)
+        writer.close("failed")
+        raise
+    return writer.run_id
+
+def cancel_test_run(run_id: str) -> bool:
+    """
+    진행 중인 실행의 취소를 요청합니다. 이미 시작된 케이스는 끝까지 실행됩니다.
+
+    다른 프로세스(스케줄러 데몬 등)에서 진행 중인 실행도 결과 DB를 통해 취소됩니다.
+    """
+    with _state_lock:
+        writer = _active_writers.get(run_id)
+    if writer is not None:
+        writer.cancel()
+        return True
+    return get_result_db().request_cancel(run_id)
+
+def get_test_run_progress(run_id: str) -> Optional[Dict[str, Any]]:
+    """실행 진행 상황(status, total, done, counts, cancel_requested)을 반환합니다."""
+    return get_result_db().get_run_progress(run_id)
+
+def _run_load_test_in_background(load_test: Dict[str, Any], case: Dict[str, Any], env: str,
+                                 rps: Optional[float], concurrency: Optional[int], duration: float) -> Dict[str, Any]:
+    # test_runner를 임포트하는 모듈이므로 실행할 때 임포트
+    from test_engine.load_runner import run_load_test, save_load_result
+
+    with _state_lock:
+        load_test["started"] = time.monotonic()
+    result = run_load_test(case, env, rps=rps, concurrency=concurrency, duration=duration)
+    save_load_result(result)
+    return result
+
+def submit_load_test(case: Dict[str, Any], env: str = "dev", rps: Optional[float] = None,
+                     concurrency: Optional[int] = None, duration: float = 30) -> str:
+    """
+    부하 테스트를 백그라운드에 등록하고 바로 부하 테스트 ID를 반환합니다.
+
+    결과는 끝나면 results/load에 저장되며, pop_load_test_result로 꺼낼 수 있습니다.
+    """
+    load_id = generate_run_id()
+    load_test = {"duration": duration, "started": None}
+    load_test["future"] = _get_load_executor().submit(_run_load_test_in_background, load_test, case, env,
+                                                      rps, concurrency, duration)
+    with _state_lock:
+        _load_tests[load_id] = load_test
+    return load_id
+
+def get_load_test_progress(load_id: str) -> Optional[Dict[str, Any]]:
+    """
+    부하 테스트 진행 상황(status, elapsed, duration)을 반환합니다.
+
+    status는 queued(다른 부하 테스트가 끝나기를 기다리는 중), running, completed, failed 중 하나이며,
+    이 프로세스에서 제출하지 않았거나 결과를 이미 꺼낸 경우 None을 반환합니다.
+    """
+    with _state_lock:
+        load_test = _load_tests.get(load_id)
+        if load_test is None:
+            return None
+        future = load_test["future"]
+        started = load_test["started"]
+    if future.done():
+        status = "failed" if future.exception() is not None else "completed"
+    else:
+        status = "running" if started is not None else "queued"
+    elapsed = time.monotonic() - started if started is not None else 0.0
+    return {"status": status, "elapsed": min(elapsed, load_test["duration"]), "duration": load_test["duration"]}
+
+def pop_load_test_result(load_id: str) -> Dict[str, Any]:
+    """끝난 부하 테스트의 결과를 꺼내고 목록에서 지웁니다. (실패한 경우 실행 중 발생한 예외를 다시 발생)"""
+    with _state_lock:
+        load_test = _load_tests.pop(load_id)
+    return load_test["future"].result()
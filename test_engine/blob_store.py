@@ -0,0 +1,97 @@
+"""
+압축된 내용 주소 기반(content-addressed) 블롭 저장소
+
+실행 기록에 그대로 넣기에는 큰 데이터(newman 원본 리포트, 응답 본문)를 압축하여
+results/blobs/<해시 앞 2자리>/<나머지 해시> 파일로 저장합니다. 키는 원본 데이터의 SHA-256이므로
+같은 내용은 한 번만 저장되고, 실행 기록에는 키만 남겨 필요할 때 읽습니다.
+
+zstandard 패키지가 있으면 zstd로, 없으면 zlib으로 압축하며, 읽을 때는 파일 앞부분으로 압축 형식을 판별합니다.
+"""
+import os
+import json
+import zlib
+import uuid
+import hashlib
+import threading
+from typing import Any
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 zlib으로 압축
+    zstandard = None
+
+from test_engine.result_db import RESULTS_DIR
+
+# 블롭 저장 위치 (환경 변수로 조정 가능)
+BLOB_DIR = os.getenv("TESTFLOW_BLOB_DIR", os.path.join(RESULTS_DIR, "blobs"))
+# 압축 수준 (zstd 1~22, zlib 1~9 범위로 맞춤)
+BLOB_COMPRESSION_LEVEL = int(os.getenv("TESTFLOW_BLOB_COMPRESSION_LEVEL", "9"))
+
+# zstd 프레임 시작 바이트
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+def compress(data: bytes, level: int = BLOB_COMPRESSION_LEVEL) -> bytes:
+    """zstd(없으면 zlib)로 압축합니다."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=max(1, min(level, 22))).compress(data)
+    return zlib.compress(data, max(1, min(level, 9)))
+
+def decompress(data: bytes) -> bytes:
+    """compress로 압축한 데이터를 압축 형식에 맞게 해제합니다."""
+    if data.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 블롭입니다. zstandard 패키지를 설치해주세요.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+class BlobStore:
+    """
+    압축된 블롭을 SHA-256 키로 저장하고 읽는 저장소
+
+    파일은 임시 파일에 쓴 뒤 이름을 바꾸므로 여러 스레드/프로세스가 같은 내용을 동시에 저장해도 안전합니다.
+    """
+
+    def __init__(self, root: str = BLOB_DIR, level: int = BLOB_COMPRESSION_LEVEL):
+        self.root = root
+        self.level = level
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key[2:])
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def put(self, data: bytes) -> str:
+        """데이터를 저장하고 키(SHA-256)를 반환합니다. 같은 내용이 이미 있으면 다시 쓰지 않습니다."""
+        key = hashlib.sha256(data).hexdigest()
+        path = self.path(key)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(compress(data, self.level))
+            os.replace(temp_path, path)
+        return key
+
+    def get(self, key: str) -> bytes:
+        """키에 해당하는 데이터를 읽습니다. (없으면 FileNotFoundError)"""
+        with open(self.path(key), "rb") as f:
+            return decompress(f.read())
+
+    def put_json(self, value: Any) -> str:
+        """값을 JSON으로 저장하고 키를 반환합니다."""
+        return self.put(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    def get_json(self, key: str) -> Any:
+        return json.loads(self.get(key).decode("utf-8"))
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_blob_store() -> BlobStore:
+    """프로세스 공용 블롭 저장소를 반환합니다."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BlobStore()
+        return _store
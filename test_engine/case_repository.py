@@ -0,0 +1,235 @@
+import os
+import copy
+import json
+import time
+import uuid
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from test_engine.result_db import get_result_db, CASES_GENERATION
+
+CASES_DIR = "cases"
+# 새 케이스 ID 할당 시 이미 있는 ID와 겹치면 다시 시도하는 최대 횟수
+CREATE_MAX_ATTEMPTS = 10
+# 저장소를 거치지 않고 직접 수정된 케이스 파일을 반영하기 위해 디렉토리를 다시 훑는 간격 (초)
+CASE_RESCAN_INTERVAL = float(os.getenv("TESTFLOW_CASE_RESCAN_INTERVAL", "30"))
+
+def new_case_id(prefix: str = "test_case") -> str:
+    """
+    새 테스트 케이스 ID를 만듭니다. ("<prefix>_<YYYYmmdd_HHMMSS>_<임의 8자리 16진수>")
+
+    시각 부분으로 생성 순서대로 정렬되고, 임의 부분으로 같은 초에 여러 스레드/프로세스가
+    만들어도 겹치지 않습니다.
+    """
+    return f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+def _write_new_file(file_path: str, data: Dict[str, Any]) -> None:
+    """
+    파일이 없을 때만 JSON 파일을 만듭니다. 이미 있으면 FileExistsError가 발생합니다.
+
+    임시 파일에 모두 쓴 뒤 하드 링크로 최종 경로에 연결하므로, 다른 프로세스가
+    쓰는 도중의 파일을 읽거나 같은 경로의 파일을 덮어쓰는 일이 없습니다.
+    하드 링크를 지원하지 않는 파일 시스템에서는 O_EXCL로 직접 만듭니다.
+    """
+    content = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    temp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(content)
+    try:
+        os.link(temp_path, file_path)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+    finally:
+        os.remove(temp_path)
+
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0))
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+
+class CaseRepository:
+    """
+    cases/ 디렉토리의 테스트 케이스를 메모리에 인덱싱하는 저장소
+
+    파일 경로별로 (mtime, size)를 기억하여 변경된 파일만 다시 파싱하고,
+    케이스 ID → 파일 경로 인덱스로 단일 케이스를 O(1)로 조회합니다.
+    저장/삭제할 때마다 cases 세대 카운터를 증가시켜 UI 캐시가 무효화되도록 합니다.
+    전체 조회는 세대 카운터가 바뀌었을 때(다른 프로세스의 저장 포함)나 CASE_RESCAN_INTERVAL이
+    지났을 때만 디렉토리를 다시 훑습니다.
+    """
+
+    def __init__(self, cases_dir: str = CASES_DIR):
+        self.cases_dir = cases_dir
+        self._entries = {}  # 파일 경로 → (mtime_ns, size, case)
+        self._by_id = {}  # 케이스 ID → 파일 경로
+        self._loaded = False
+        self._generation = None  # 마지막으로 훑을 때의 cases 세대 카운터
+        self._scanned_at = 0.0
+        self._lock = threading.RLock()
+
+    def _load_file(self, file_path: str, stat: os.stat_result) -> None:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                case = json.load(f)
+        except Exception as e:
+            print(f"Error loading case file {file_path}: {str(e)}")
+            self._forget(file_path)
+            return
+        # 파일 경로 정보 추가
+        case['filepath'] = file_path
+        self._forget(file_path)
+        self._entries[file_path] = (stat.st_mtime_ns, stat.st_size, case)
+        if "id" in case:
+            self._by_id[case["id"]] = file_path
+
+    def _forget(self, file_path: str) -> None:
+        entry = self._entries.pop(file_path, None)
+        if entry and self._by_id.get(entry[2].get("id")) == file_path:
+            del self._by_id[entry[2]["id"]]
+
+    def _is_current(self, file_path: str, stat: os.stat_result) -> bool:
+        entry = self._entries.get(file_path)
+        return entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size
+
+    def refresh(self) -> None:
+        """디렉토리를 훑어 추가/변경/삭제된 파일만 인덱스에 반영합니다."""
+        with self._lock:
+            # 훑는 도중의 저장을 놓치지 않도록 세대 카운터를 먼저 읽음
+            generation = get_result_db().get_generation(CASES_GENERATION)
+            seen = set()
+            if os.path.exists(self.cases_dir):
+                for root, dirs, files in os.walk(self.cases_dir):
+                    for file in files:
+                        if not file.endswith(".json"):
+                            continue
+                        file_path = os.path.join(root, file)
+                        try:
+                            stat = os.stat(file_path)
+                        except FileNotFoundError:
+                            continue
+                        seen.add(file_path)
+                        if not self._is_current(file_path, stat):
+                            self._load_file(file_path, stat)
+            for file_path in list(self._entries):
+                if file_path not in seen:
+                    self._forget(file_path)
+            self._loaded = True
+            self._generation = generation
+            self._scanned_at = time.monotonic()
+
+    def _is_stale(self) -> bool:
+        if not self._loaded or time.monotonic() - self._scanned_at >= CASE_RESCAN_INTERVAL:
+            return True
+        return get_result_db().get_generation(CASES_GENERATION) != self._generation
+
+    def all(self) -> List[Dict[str, Any]]:
+        """모든 테스트 케이스를 반환합니다. (반환된 dict를 수정해도 캐시에 영향 없음)"""
+        with self._lock:
+            if self._is_stale():
+                self.refresh()
+            return [copy.deepcopy(entry[2]) for entry in self._entries.values()]
+
+    def get(self, case_id: str) -> Optional[Dict[str, Any]]:
+        """
+        케이스 ID로 테스트 케이스를 조회합니다. 해당 파일 하나의 변경 여부만 확인합니다.
+        (반환된 dict를 수정해도 캐시에 영향 없음)
+        """
+        with self._lock:
+            if not self._loaded:
+                self.refresh()
+            file_path = self._by_id.get(case_id)
+            if file_path is not None:
+                try:
+                    stat = os.stat(file_path)
+                    if not self._is_current(file_path, stat):
+                        self._load_file(file_path, stat)
+                except FileNotFoundError:
+                    self._forget(file_path)
+                file_path = self._by_id.get(case_id)
+            if file_path is None:
+                # 다른 프로세스에서 새로 추가되었을 수 있으므로 한 번 다시 훑어봄
+                self.refresh()
+                file_path = self._by_id.get(case_id)
+                if file_path is None:
+                    return None
+            return copy.deepcopy(self._entries[file_path][2])
+
+    def get_filepath(self, case_id: str) -> Optional[str]:
+        """케이스 ID에 해당하는 파일 경로를 반환합니다."""
+        case = self.get(case_id)
+        return case['filepath'] if case else None
+
+    def save(self, case: Dict[str, Any], file_path: Optional[str] = None) -> str:
+        """
+        테스트 케이스를 파일로 저장하고 인덱스를 갱신합니다.
+
+        file_path를 지정하지 않으면 기존 파일 경로에 덮어쓰고, 새 케이스는 cases/기타/에 저장합니다.
+        """
+        with self._lock:
+            if file_path is None:
+                file_path = case.get('filepath') or self._by_id.get(case["id"])
+            if file_path is None:
+                file_path = os.path.join(self.cases_dir, "기타", f"{case['id']}.json")
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            data = {key: value for key, value in case.items() if key != 'filepath'}
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+            self._load_file(file_path, os.stat(file_path))
+            get_result_db().bump_generation(CASES_GENERATION)
+            return file_path
+
+    def create(self, case: Dict[str, Any], feature: str = "기타", prefix: str = "test_case") -> str:
+        """
+        새 ID를 할당하여 테스트 케이스를 cases/<feature>/<ID>.json에 새 파일로 저장합니다.
+
+        파일은 없을 때만 만들어지므로(create-if-absent), 여러 스레드나 프로세스가 동시에
+        생성/가져오기를 해도 기존 케이스를 덮어쓰지 않습니다. ID가 겹치면 새 ID로 다시 시도합니다.
+
+        Returns:
+            할당된 케이스 ID (case와 저장된 파일의 id, test_case_id에 모두 설정됨)
+        """
+        feature_dir = os.path.join(self.cases_dir, feature)
+        os.makedirs(feature_dir, exist_ok=True)
+        data = {key: value for key, value in case.items() if key != 'filepath'}
+
+        for _ in range(CREATE_MAX_ATTEMPTS):
+            case_id = new_case_id(prefix)
+            with self._lock:
+                if case_id in self._by_id:
+                    continue
+            file_path = os.path.join(feature_dir, f"{case_id}.json")
+            data["id"] = data["test_case_id"] = case_id
+            try:
+                _write_new_file(file_path, data)
+            except FileExistsError:
+                continue
+
+            case["id"] = case["test_case_id"] = case_id
+            with self._lock:
+                self._load_file(file_path, os.stat(file_path))
+            get_result_db().bump_generation(CASES_GENERATION)
+            return case_id
+        raise RuntimeError(f"테스트 케이스 ID를 할당하지 못했습니다. ({CREATE_MAX_ATTEMPTS}회 시도)")
+
+    def delete(self, case_id: str) -> bool:
+        """테스트 케이스 파일을 삭제하고 인덱스에서 제거합니다."""
+        with self._lock:
+            file_path = self.get_filepath(case_id)
+            if file_path is None:
+                return False
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            self._forget(file_path)
+            get_result_db().bump_generation(CASES_GENERATION)
+            return True
+
+# 프로세스 공용 저장소
+_repository = CaseRepository()
+
+def get_case_repository() -> CaseRepository:
+    """프로세스 공용 테스트 케이스 저장소를 반환합니다."""
+    return _repository
@@ -0,0 +1,73 @@
+from typing import List, Dict, Any, Optional
+
+from test_engine.result_db import get_result_db
+from test_engine.history_rows import history_rows
+
+# 한 번에 집계할 실행 수
+AGGREGATE_BATCH_SIZE = 500
+
+def run_failures(run: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """실행 기록(케이스 결과 포함)에서 실패한 결과만 집계용 행으로 추출합니다."""
+    return [row for row in history_rows([run]) if row["result"] == "FAIL"]
+
+def update_failure_stats() -> int:
+    """
+    종료되었지만 아직 집계되지 않은 실행의 실패 결과를 실패 집계에 반영합니다.
+
+    실행이 완료될 때와 실패 집계를 조회할 때 호출되며, 처음 호출될 때는 기존 이력 전체를 한 번 집계합니다.
+
+    Returns:
+        새로 반영한 실행 수
+    """
+    db = get_result_db()
+    updated = 0
+    while True:
+        run_ids = db.pending_failure_runs(AGGREGATE_BATCH_SIZE)
+        if not run_ids:
+            return updated
+        runs = db.get_runs(run_ids, postman_result=False)
+        results_by_run = db.load_results(run_ids)
+        records_by_run = db.load_postman_records(run_ids)
+        for run in runs:
+            run["results"] = results_by_run.get(run["id"], [])
+            run["postman_records"] = records_by_run.get(run["id"], [])
+            if db.record_failures(run["id"], run_failures(run)):
+                updated += 1
+        if len(run_ids) < AGGREGATE_BATCH_SIZE:
+            return updated
+
+def load_failure_patterns(env: Optional[str] = None, limit: Optional[int] = None) -> "pd.DataFrame":
+    """
+    케이스별 실패 집계를 실패 횟수 순으로 조회합니다.
+
+    Args:
+        env: 지정하면 해당 환경의 실패만 집계
+        limit: 최대 행 수
+    """
+    # 실행이 완료될 때 호출되는 집계 갱신 경로는 pandas가 필요 없으므로 조회할 때만 임포트
+    import pandas as pd
+
+    try:
+        update_failure_stats()
+    except Exception as e:
+        print(f"실패 집계 갱신 중 오류: {str(e)}")
+
+    db = get_result_db()
+    stats = db.list_failure_stats(env, limit)
+    if not stats:
+        return pd.DataFrame()
+
+    breakdown = db.list_failure_env_breakdown([stat["case_id"] for stat in stats])
+    return pd.DataFrame({
+        "테스트 ID": [stat["case_id"] for stat in stats],
+        "설명": [stat.get("last_desc") or "N/A" for stat in stats],
+        "상태 코드": [stat["last_status_code"] if stat["last_status_code"] is not None else "N/A" for stat in stats],
+        "실패 횟수": [stat["fail_count"] for stat in stats],
+        "첫 실패": [stat["first_failure"] for stat in stats],
+        "마지막 실패": [stat["last_failure"] for stat in stats],
+        "환경": [stat["env"] or "N/A" for stat in stats],
+        "환경별 실패": [
+            ", ".join(f"{name}: {count}" for name, count in sorted(breakdown.get(stat["case_id"], {}).items()))
+            for stat in stats
+        ]
+    })
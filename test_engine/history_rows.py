@@ -0,0 +1,77 @@
+"""
+테스트 실행 기록을 케이스 결과 단위의 행(dict)으로 평탄화합니다.
+
+분석용 이력(history_store)과 실패 집계(failure_stats)가 함께 사용하며,
+실행 경로에서도 가져다 쓰므로 pandas/pyarrow에 의존하지 않습니다.
+"""
+from typing import List, Dict, Any
+
+from test_engine.postman_records import postman_records, int_or_none, float_or_none
+
+# 케이스 결과 한 건 = 한 행
+HISTORY_COLUMNS = [
+    "run_id", "execution_time", "env", "type", "case_id", "desc", "result", "status_code",
+    "reason", "connect_ms", "tls_ms", "ttfb_ms", "download_ms", "total_ms",
+    "request_bytes", "response_bytes"
+]
+
+def _case_result_row(run: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+    timings = result.get("timings") or {}
+    return {
+        "run_id": run["id"],
+        # 추이/집계가 실행 단위로 묶이도록 케이스별 시각이 아닌 실행 시각을 사용
+        "execution_time": run["execution_time"],
+        "env": result.get("env", run.get("env")),
+        "type": run.get("type"),
+        "case_id": result.get("id", "UNKNOWN"),
+        "desc": result.get("desc"),
+        "result": result.get("result", "UNKNOWN"),
+        "status_code": int_or_none(result.get("status_code")),
+        "reason": result.get("reason"),
+        "connect_ms": float_or_none(timings.get("connect_ms")),
+        "tls_ms": float_or_none(timings.get("tls_ms")),
+        "ttfb_ms": float_or_none(timings.get("ttfb_ms")),
+        "download_ms": float_or_none(timings.get("download_ms")),
+        "total_ms": float_or_none(timings.get("total_ms")),
+        "request_bytes": int_or_none(result.get("request_bytes")),
+        "response_bytes": int_or_none(result.get("response_bytes"))
+    }
+
+def _postman_rows(run: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Postman 실행의 요청 레코드 하나를 한 행으로 변환합니다."""
+    if "postman_records" in run:
+        records = run["postman_records"]
+    else:
+        records = postman_records(run.get("postman_result"))
+    return [
+        {
+            "run_id": run["id"],
+            "execution_time": run["execution_time"],
+            "env": run.get("env"),
+            "type": run.get("type"),
+            "case_id": record["name"],
+            "desc": f"{record['method']} - {record['name']}",
+            "result": record["result"],
+            "status_code": record["status_code"],
+            "reason": (record["error"] or record["status"]) if record["result"] != "PASS" else None,
+            "connect_ms": record["connect_ms"],
+            "tls_ms": record["tls_ms"],
+            "ttfb_ms": record["ttfb_ms"],
+            "download_ms": record["download_ms"],
+            "total_ms": record["response_time_ms"],
+            "request_bytes": record["request_bytes"],
+            "response_bytes": record["response_bytes"]
+        }
+        for record in records
+    ]
+
+def history_rows(runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """실행 기록 목록(케이스 결과 포함)을 케이스 결과 단위의 행 목록으로 평탄화합니다."""
+    rows = []
+    for run in runs:
+        results = run.get("results") or []
+        if results:
+            rows.extend(_case_result_row(run, result) for result in results)
+        elif run.get("postman_records") or run.get("postman_result"):
+            rows.extend(_postman_rows(run))
+    return rows
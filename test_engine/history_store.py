@@ -0,0 +1,157 @@
+import os
+import glob
+import uuid
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow가 없으면 결과 DB에서 직접 프레임을 만듦
+    pa = None
+    pq = None
+
+from test_engine.result_db import get_result_db
+from test_engine.history_rows import HISTORY_COLUMNS, history_rows
+
+# 분석용 컬럼형(Parquet) 이력 저장 위치
+HISTORY_DIR = os.path.join("results", "history")
+# 조각 파일이 이 개수를 넘으면 하나로 합침
+HISTORY_COMPACT_PARTS = int(os.getenv("TESTFLOW_HISTORY_COMPACT_PARTS", "16"))
+
+if pa is not None:
+    HISTORY_SCHEMA = pa.schema([
+        ("run_id", pa.string()),
+        ("execution_time", pa.timestamp("s")),
+        ("env", pa.string()),
+        ("type", pa.string()),
+        ("case_id", pa.string()),
+        ("desc", pa.string()),
+        ("result", pa.string()),
+        ("status_code", pa.int32()),
+        ("reason", pa.string()),
+        ("connect_ms", pa.float64()),
+        ("tls_ms", pa.float64()),
+        ("ttfb_ms", pa.float64()),
+        ("download_ms", pa.float64()),
+        ("total_ms", pa.float64()),
+        ("request_bytes", pa.int64()),
+        ("response_bytes", pa.int64())
+    ])
+
+_export_lock = threading.Lock()
+
+def history_frame_from_rows(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """행 목록으로 타입이 지정된 이력 DataFrame을 만듭니다."""
+    df = pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+    df["execution_time"] = pd.to_datetime(df["execution_time"], errors="coerce")
+    df["status_code"] = df["status_code"].astype("Int32")
+    df["request_bytes"] = df["request_bytes"].astype("Int64")
+    df["response_bytes"] = df["response_bytes"].astype("Int64")
+    for column in ["connect_ms", "tls_ms", "ttfb_ms", "download_ms", "total_ms"]:
+        df[column] = df[column].astype("float64")
+    return df
+
+def history_frame_from_runs(runs: List[Dict[str, Any]]) -> pd.DataFrame:
+    """load_test_history 형식의 실행 기록 목록을 이력 DataFrame으로 변환합니다."""
+    return history_frame_from_rows(history_rows(runs))
+
+def _load_runs_with_results(run_ids: List[str]) -> List[Dict[str, Any]]:
+    db = get_result_db()
+    # Postman 실행은 원본 결과 대신 요청 레코드를 읽음
+    runs = db.get_runs(run_ids, postman_result=False)
+    results_by_run = db.load_results([run["id"] for run in runs])
+    records_by_run = db.load_postman_records([run["id"] for run in runs])
+    for run in runs:
+        run["results"] = results_by_run.get(run["id"], [])
+        run["postman_records"] = records_by_run.get(run["id"], [])
+    return runs
+
+def _part_files() -> List[str]:
+    return sorted(glob.glob(os.path.join(HISTORY_DIR, "part_*.parquet")))
+
+def _write_part(table: "pa.Table") -> str:
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    name = f"part_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}.parquet"
+    path = os.path.join(HISTORY_DIR, name)
+    # 임시 파일에 쓴 뒤 이름을 바꿔 읽는 쪽에서 불완전한 파일을 보지 않도록 함
+    pq.write_table(table, path + ".tmp", compression="zstd")
+    os.replace(path + ".tmp", path)
+    return path
+
+def export_history() -> int:
+    """
+    아직 내보내지 않은 종료된 실행들을 Parquet 조각 파일 하나로 추가합니다.
+
+    Returns:
+        내보낸 행 수
+    """
+    if pa is None:
+        return 0
+    with _export_lock:
+        db = get_result_db()
+        run_ids = db.claim_unexported_runs()
+        if not run_ids:
+            return 0
+        try:
+            df = history_frame_from_runs(_load_runs_with_results(run_ids))
+            if not df.empty:
+                _write_part(pa.Table.from_pandas(df, schema=HISTORY_SCHEMA, preserve_index=False))
+        except Exception:
+            db.reset_exported(run_ids)
+            raise
+        if len(_part_files()) > HISTORY_COMPACT_PARTS:
+            compact_history()
+        return len(df)
+
+def compact_history() -> None:
+    """조각 파일들을 하나의 Parquet 파일로 합칩니다."""
+    if pa is None:
+        return
+    parts = _part_files()
+    if len(parts) < 2:
+        return
+    table = pa.concat_tables([pq.read_table(part, schema=HISTORY_SCHEMA) for part in parts])
+    table = table.sort_by("execution_time")
+    _write_part(table)
+    for part in parts:
+        os.remove(part)
+
+def load_history_frame(since: Optional[datetime] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    케이스 결과 단위의 테스트 이력을 DataFrame으로 로드합니다.
+
+    새로 종료된 실행은 먼저 Parquet 이력에 추가한 뒤 읽습니다. pyarrow가 없으면 결과 DB에서 직접 만듭니다.
+
+    Args:
+        since: 이 시각 이후의 이력만 로드
+        columns: 로드할 컬럼 목록 (None이면 전체)
+    """
+    if pa is None:
+        runs = get_result_db().list_runs(postman_result=False)
+        df = history_frame_from_runs(_load_runs_with_results([run["id"] for run in runs]))
+        if since is not None:
+            df = df[df["execution_time"] >= pd.Timestamp(since)]
+        return df[columns] if columns else df
+
+    try:
+        export_history()
+    except Exception as e:
+        print(f"테스트 이력 내보내기 중 오류: {str(e)}")
+
+    filters = [("execution_time", ">=", pd.Timestamp(since))] if since is not None else None
+    for attempt in range(2):
+        parts = _part_files()
+        if not parts:
+            return history_frame_from_rows([])[columns] if columns else history_frame_from_rows([])
+        try:
+            table = pq.read_table(parts, schema=HISTORY_SCHEMA, columns=columns, filters=filters)
+            break
+        except FileNotFoundError:
+            # 다른 프로세스가 조각 파일을 합치는 중이면 목록을 다시 읽음
+            if attempt:
+                raise
+    return table.to_pandas(types_mapper={pa.int32(): pd.Int32Dtype(), pa.int64(): pd.Int64Dtype()}.get)
@@ -0,0 +1,173 @@
+import os
+import time
+import atexit
+import threading
+from typing import Dict, Any, Tuple
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# 호스트별 커넥션 풀 크기 (환경 변수로 조정 가능)
+DEFAULT_POOL_SIZE = int(os.getenv("TESTFLOW_HTTP_POOL_SIZE", "10"))
+
+def session_key(url: str) -> str:
+    """URL에서 세션 키(scheme://host:port)를 추출합니다."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+# 현재 스레드에서 진행 중인 요청의 연결 수립 시간을 기록
+_timing = threading.local()
+
+def _reset_connection_timing() -> None:
+    _timing.tcp_ms = 0.0
+    _timing.connect_ms = 0.0
+
+class ConnectTimingMixin:
+    """TCP 연결과 (HTTPS의 경우) TLS 핸드셰이크 시간을 기록하는 커넥션 믹스인"""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        _timing.tcp_ms = (time.perf_counter() - start) * 1000
+        return sock
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _timing.connect_ms = (time.perf_counter() - start) * 1000
+
+class TimedHTTPConnection(ConnectTimingMixin, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(ConnectTimingMixin, HTTPSConnection):
+    pass
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """연결 수립 시간을 측정하는 커넥션 풀을 사용하는 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool
+        }
+
+def measure_request_bytes(request: requests.PreparedRequest) -> int:
+    """요청 라인, 헤더, 본문을 포함한 요청 크기(바이트)를 계산합니다."""
+    size = len(f"{request.method} {request.path_url} HTTP/1.1\r\n")
+    size += sum(len(f"{key}: {value}\r\n") for key, value in request.headers.items()) + 2
+    body = request.body or b""
+    size += len(body.encode("utf-8") if isinstance(body, str) else body)
+    return size
+
+def measure_response_bytes(response: requests.Response) -> int:
+    """상태 라인, 헤더, 전송된(압축 상태) 본문을 포함한 응답 크기(바이트)를 계산합니다."""
+    size = len(f"HTTP/1.1 {response.status_code} {response.reason}\r\n")
+    size += sum(len(f"{key}: {value}\r\n") for key, value in response.headers.items()) + 2
+    try:
+        size += response.raw.tell()
+    except Exception:
+        size += len(response.content)
+    return size
+
+def timed_request(session: requests.Session, method: str, url: str, **kwargs) -> Tuple[requests.Response, Dict[str, Any]]:
+    """
+    요청을 실행하고 구간별 소요 시간(ms)과 송수신 바이트 수를 함께 반환합니다.
+
+    - connect_ms: TCP 연결 수립 (keep-alive 재사용 시 0)
+    - tls_ms: TLS 핸드셰이크 (HTTP 또는 재사용 시 0)
+    - ttfb_ms: 연결 수립 이후 응답 헤더(첫 바이트)를 받기까지의 대기 시간
+    - download_ms: 응답 본문 수신 시간
+    - total_ms: 전체 소요 시간
+    """
+    _reset_connection_timing()
+    start = time.perf_counter()
+    response = session.request(method=method, url=url, stream=True, **kwargs)
+    headers_at = time.perf_counter()
+    response.content  # 본문을 모두 수신
+    end = time.perf_counter()
+
+    connect_total_ms = _timing.connect_ms
+    connect_ms = min(_timing.tcp_ms, connect_total_ms) if connect_total_ms else 0.0
+    tls_ms = connect_total_ms - connect_ms if url.startswith("https") else 0.0
+    metrics = {
+        "timings": {
+            "connect_ms": round(connect_ms, 3),
+            "tls_ms": round(tls_ms, 3),
+            "ttfb_ms": round(max((headers_at - start) * 1000 - connect_total_ms, 0.0), 3),
+            "download_ms": round((end - headers_at) * 1000, 3),
+            "total_ms": round((end - start) * 1000, 3)
+        },
+        "request_bytes": measure_request_bytes(response.request),
+        "response_bytes": measure_response_bytes(response)
+    }
+    return response, metrics
+
+class SessionManager:
+    """기본 URL별로 keep-alive HTTP 세션을 재사용하도록 관리하는 클래스"""
+
+    def __init__(self, pool_size: int = None):
+        """
+        세션 매니저 초기화
+
+        Args:
+            pool_size: 기본 URL마다 유지할 최대 커넥션 수
+        """
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, base_url: str) -> requests.Session:
+        """기본 URL에 해당하는 세션을 반환합니다. 없으면 새로 생성합니다."""
+        key = session_key(base_url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session()
+                self._sessions[key] = session
+            return session
+
+    def _create_session(self) -> requests.Session:
+        """커넥션 풀 크기가 설정된 세션을 생성합니다."""
+        session = requests.Session()
+        adapter = TimedHTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close_all(self) -> None:
+        """열려 있는 모든 세션과 커넥션을 닫습니다."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                print(f"세션 종료 중 오류: {str(e)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_all()
+
+# 단일 케이스 실행 등 실행 범위가 없는 호출에서 사용하는 프로세스 공용 세션 매니저
+_default_manager = SessionManager()
+atexit.register(_default_manager.close_all)
+
+def get_session_manager() -> SessionManager:
+    """프로세스 공용 세션 매니저를 반환합니다."""
+    return _default_manager
+
+def get_session(base_url: str) -> requests.Session:
+    """프로세스 공용 세션 매니저에서 기본 URL에 해당하는 세션을 반환합니다."""
+    return _default_manager.get_session(base_url)
@@ -0,0 +1,292 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from test_engine.result_db import RESULTS_DIR
+
+# 예약 작업 명세와 스케줄러 데몬 상태를 저장하는 DB 경로 (환경 변수로 조정 가능)
+SCHEDULER_DB_PATH = os.getenv("TESTFLOW_SCHEDULER_DB", os.path.join(RESULTS_DIR, "scheduler.db"))
+# 데몬이 이 시간(초) 동안 응답이 없으면 중지된 것으로 간주
+DAEMON_LEASE_SECONDS = 30
+# 데몬 상태 이름 (daemon_status 테이블 키)
+SCHEDULER_NAME = "scheduler"
+# 예약 테스트 실행 함수 참조 (스케줄러 데몬이 실행, UI가 작업을 등록할 때 사용)
+SCHEDULED_TEST_FUNC = "test_engine.scheduler_daemon:run_scheduled_test"
+
+# 작업별 실행 옵션 기본값
+# - max_instances: 같은 작업을 동시에 실행할 수 있는 최대 개수 (이전 실행이 끝나지 않았으면 건너뜀)
+# - coalesce: 밀린 실행이 여러 번이면 한 번만 실행
+# - misfire_grace_time: 예정 시각보다 이 시간(초) 이상 늦어지면 실행하지 않음
+# - jitter: 실행 시각을 0~jitter초 사이에서 무작위로 늦춰 같은 시각에 몰리지 않도록 함
+DEFAULT_JOB_OPTIONS = {
+    "max_instances": 1,
+    "coalesce": True,
+    "misfire_grace_time": 600,
+    "jitter": 0
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_jobs (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    func TEXT NOT NULL,
+    trigger TEXT NOT NULL,
+    trigger_args TEXT NOT NULL,
+    kwargs TEXT NOT NULL,
+    end_date TEXT,
+    created_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    removed INTEGER NOT NULL DEFAULT 0,
+    next_run_time TEXT,
+    options TEXT NOT NULL DEFAULT '{}',
+    applied_version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS job_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    scheduled_run_time TEXT,
+    started_at TEXT,
+    finished_at TEXT,
+    duration_sec REAL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_job_runs_job_time ON job_runs (job_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_job_runs_time ON job_runs (started_at);
+
+CREATE TABLE IF NOT EXISTS daemon_status (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    heartbeat REAL NOT NULL,
+    started_at TEXT NOT NULL
+);
+"""
+
+def _job_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "func": row["func"],
+        "trigger": row["trigger"],
+        "trigger_args": json.loads(row["trigger_args"]),
+        "kwargs": json.loads(row["kwargs"]),
+        "end_date": row["end_date"],
+        "created_at": row["created_at"],
+        "version": row["version"],
+        "removed": bool(row["removed"]),
+        "next_run_time": row["next_run_time"],
+        "options": {**DEFAULT_JOB_OPTIONS, **json.loads(row["options"] or "{}")},
+        "applied_version": row["applied_version"]
+    }
+
+class JobStore:
+    """
+    UI와 스케줄러 데몬이 공유하는 예약 작업 저장소
+
+    UI는 작업 명세(실행 함수, 트리거, 인자)를 등록/삭제만 하고, 실제 실행은 별도 프로세스의
+    스케줄러 데몬이 이 테이블을 주기적으로 읽어 반영합니다. 데몬은 다음 실행 시각과
+    하트비트를 다시 기록하여 UI에서 상태를 확인할 수 있게 합니다.
+    """
+
+    def __init__(self, db_path: str = SCHEDULER_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    # 작업 명세
+
+    def submit_job(self, job_id: str, func: str, trigger: str, trigger_args: Dict[str, Any],
+                   kwargs: Optional[Dict[str, Any]] = None, name: Optional[str] = None,
+                   end_date: Optional[str] = None, options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        예약 작업을 등록합니다. 같은 ID가 있으면 명세를 교체합니다.
+
+        Args:
+            job_id: 작업 ID
+            func: 실행할 함수 참조 ("모듈:함수" 형식)
+            trigger: APScheduler 트리거 이름 (cron, date, interval)
+            trigger_args: 트리거 인자
+            kwargs: 실행 함수에 전달할 키워드 인자
+            name: 표시용 이름
+            end_date: 반복 종료 날짜
+            options: 실행 옵션 (max_instances, coalesce, misfire_grace_time, jitter)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO scheduled_jobs (id, name, func, trigger, trigger_args, kwargs, end_date, created_at, options) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET name = excluded.name, func = excluded.func, "
+                "trigger = excluded.trigger, trigger_args = excluded.trigger_args, kwargs = excluded.kwargs, "
+                "end_date = excluded.end_date, options = excluded.options, "
+                "version = version + 1, removed = 0, next_run_time = NULL",
+                (job_id, name or job_id, func, trigger, json.dumps(trigger_args, ensure_ascii=False),
+                 json.dumps(kwargs or {}, ensure_ascii=False), end_date,
+                 datetime.now().strftime("%Y-%m-%d %H:%M:%S"), json.dumps(options or {}))
+            )
+            self._conn.commit()
+
+    def add_job_if_absent(self, job_id: str, func: str, trigger: str, trigger_args: Dict[str, Any],
+                          kwargs: Optional[Dict[str, Any]] = None, name: Optional[str] = None) -> bool:
+        """같은 ID의 작업(삭제된 작업 포함)이 없을 때만 등록합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO scheduled_jobs (id, name, func, trigger, trigger_args, kwargs, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, name or job_id, func, trigger, json.dumps(trigger_args, ensure_ascii=False),
+                 json.dumps(kwargs or {}, ensure_ascii=False), datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def remove_job(self, job_id: str) -> bool:
+        """예약 작업 삭제를 요청합니다. 데몬이 다음 동기화 때 스케줄에서 제거합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE scheduled_jobs SET removed = 1, version = version + 1, next_run_time = NULL "
+                "WHERE id = ? AND removed = 0",
+                (job_id,)
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def list_jobs(self, include_removed: bool = False) -> List[Dict[str, Any]]:
+        """등록된 예약 작업 목록을 반환합니다."""
+        query = "SELECT * FROM scheduled_jobs"
+        if not include_removed:
+            query += " WHERE removed = 0"
+        query += " ORDER BY created_at"
+        with self._lock:
+            return [_job_from_row(row) for row in self._conn.execute(query)]
+
+    def mark_applied(self, job_id: str, version: int) -> None:
+        """데몬이 해당 버전의 명세를 스케줄에 반영했음을 기록합니다. (재시작 시 다시 등록하지 않도록)"""
+        with self._lock:
+            self._conn.execute("UPDATE scheduled_jobs SET applied_version = ? WHERE id = ?", (version, job_id))
+            self._conn.commit()
+
+    def set_next_run_times(self, next_run_times: Dict[str, Optional[str]]) -> None:
+        """데몬이 계산한 작업별 다음 실행 시각을 기록합니다."""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE scheduled_jobs SET next_run_time = ? WHERE id = ?",
+                [(next_run_time, job_id) for job_id, next_run_time in next_run_times.items()]
+            )
+            self._conn.commit()
+
+    # 실행 이력
+
+    def start_job_run(self, job_id: str, scheduled_run_time: Optional[str]) -> int:
+        """작업 실행 시작을 기록하고 실행 이력 ID를 반환합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO job_runs (job_id, scheduled_run_time, started_at, status) VALUES (?, ?, ?, 'running')",
+                (job_id, scheduled_run_time, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def finish_job_run(self, run_id: int, status: str, duration_sec: float,
+                       result: Optional[str] = None, error: Optional[str] = None) -> None:
+        """작업 실행 종료(성공/오류)와 소요 시간을 기록합니다."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job_runs SET finished_at = ?, duration_sec = ?, status = ?, result = ?, error = ? WHERE id = ?",
+                (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), round(duration_sec, 3), status, result, error, run_id)
+            )
+            self._conn.commit()
+
+    def record_job_event(self, job_id: str, scheduled_run_time: Optional[str], status: str,
+                         error: Optional[str] = None) -> None:
+        """실행되지 않은 예약(missed, skipped 등)을 실행 이력에 기록합니다."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO job_runs (job_id, scheduled_run_time, started_at, status, error) VALUES (?, ?, ?, ?, ?)",
+                (job_id, scheduled_run_time, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), status, error)
+            )
+            self._conn.commit()
+
+    def list_job_runs(self, job_id: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """작업 실행 이력을 최신순으로 반환합니다."""
+        query = "SELECT * FROM job_runs"
+        params = []
+        if job_id:
+            query += " WHERE job_id = ?"
+            params.append(job_id)
+        query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+        params += [limit, offset]
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+
+    # 데몬 상태
+
+    def acquire_lease(self, name: str, owner: str, lease_seconds: float = DAEMON_LEASE_SECONDS) -> bool:
+        """
+        데몬 실행 권한을 얻거나 갱신합니다. (하트비트 겸용)
+
+        다른 소유자의 하트비트가 lease_seconds 이내이면 False를 반환하여 데몬이 중복 실행되지 않도록 합니다.
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute("SELECT owner, heartbeat FROM daemon_status WHERE name = ?", (name,)).fetchone()
+                if row and row["owner"] != owner and now - row["heartbeat"] < lease_seconds:
+                    self._conn.rollback()
+                    return False
+                if row and row["owner"] == owner:
+                    self._conn.execute("UPDATE daemon_status SET heartbeat = ? WHERE name = ?", (now, name))
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO daemon_status (name, owner, heartbeat, started_at) VALUES (?, ?, ?, ?)",
+                        (name, owner, now, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                    )
+                self._conn.commit()
+                return True
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def release_lease(self, name: str, owner: str) -> None:
+        """데몬 종료 시 실행 권한을 반납합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM daemon_status WHERE name = ? AND owner = ?", (name, owner))
+            self._conn.commit()
+
+    def get_daemon_status(self, name: str) -> Optional[Dict[str, Any]]:
+        """데몬 상태(소유자, 마지막 하트비트 경과 시간, 시작 시각, 실행 중 여부)를 반환합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM daemon_status WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        age = time.time() - row["heartbeat"]
+        return {
+            "owner": row["owner"],
+            "heartbeat_age": age,
+            "started_at": row["started_at"],
+            "alive": age < DAEMON_LEASE_SECONDS
+        }
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """프로세스 공용 예약 작업 저장소를 반환합니다."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore()
+        return _store
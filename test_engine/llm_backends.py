@@ -0,0 +1,163 @@
+"""
+테스트 케이스 생성에 사용하는 LLM 백엔드
+
+- gemini: Google Gemini API (기본값, GOOGLE_API_KEY 필요)
+- local: 네트워크 없이 요청 문장으로 테스트 케이스 JSON을 만들어 주는 로컬 대역
+  (지연 시간, 일시적 오류 비율, 미리 준비한 응답을 설정할 수 있어 벤치마크와 CI에 사용)
+
+사용할 백엔드는 TESTFLOW_LLM_BACKEND 환경 변수로 선택합니다.
+"""
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+
+from test_engine.llm_cache import normalize_request
+
+# 사용할 Gemini 모델
+GEMINI_MODEL = 'gemini-2.0-flash-lite-preview-02-05'
+# 사용할 LLM 백엔드 (gemini, local)
+LLM_BACKEND = os.getenv("TESTFLOW_LLM_BACKEND", "gemini")
+
+# 로컬 백엔드 설정 (환경 변수로 조정 가능)
+# 응답 지연 시간 (초)
+LOCAL_LLM_LATENCY = float(os.getenv("TESTFLOW_LOCAL_LLM_LATENCY", "0.2"))
+# 응답 지연 시간에 더해지는 임의 시간의 최댓값 (초)
+LOCAL_LLM_JITTER = float(os.getenv("TESTFLOW_LOCAL_LLM_JITTER", "0"))
+# 요청률 초과(429) 오류를 흉내 내는 비율 (0~1)
+LOCAL_LLM_ERROR_RATE = float(os.getenv("TESTFLOW_LOCAL_LLM_ERROR_RATE", "0"))
+# 미리 준비한 응답 파일 ({"요청": 응답 문자열 또는 테스트 케이스 객체})
+LOCAL_LLM_RESPONSES = os.getenv("TESTFLOW_LOCAL_LLM_RESPONSES", "")
+# 지연 시간/오류 발생에 쓰는 난수 시드
+LOCAL_LLM_SEED = int(os.getenv("TESTFLOW_LOCAL_LLM_SEED", "0"))
+
+# 프롬프트에서 자연어 요청을 찾기 위한 정규식
+_REQUEST_PATTERN = re.compile(r"^\s*요청:\s*(.*)$", re.MULTILINE)
+# 요청 문장을 단계로 나누는 구분자
+_STEP_SEPARATOR = re.compile(r"\s*(?:,|그리고|한 후에?|하고 나서|하고|다음에?)\s+")
+# 요청에 포함된 단어로 HTTP 메서드 결정 (앞에 있는 규칙이 우선)
+METHOD_KEYWORDS = [
+    ("DELETE", ["삭제", "제거", "탈퇴", "delete", "remove"]),
+    ("PUT", ["수정", "변경", "업데이트", "update", "edit"]),
+    ("POST", ["생성", "추가", "등록", "가입", "결제", "주문", "로그인", "create", "add", "login", "pay"]),
+    ("GET", ["조회", "검색", "확인", "목록", "get", "list", "search"]),
+]
+
+class ResourceExhausted(Exception):
+    """로컬 백엔드가 흉내 내는 요청률 초과 오류 (Gemini의 429 오류와 같은 이름)"""
+    code = 429
+
+class LLMBackend(ABC):
+    """
+    LLM 백엔드 인터페이스
+
+    generate(prompt)는 응답 텍스트를 반환하고, 실패하면 예외를 발생시킵니다.
+    model은 캐시 키에 쓰이므로 백엔드/모델마다 달라야 합니다.
+    """
+    name = ""
+    model = ""
+    # 요청률 제한(TESTFLOW_LLM_RPM)을 적용할지 여부
+    rate_limited = True
+
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """프롬프트에 대한 응답 텍스트를 반환합니다."""
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini API 백엔드"""
+    name = "gemini"
+
+    def __init__(self, model: str = GEMINI_MODEL):
+        # Gemini SDK는 임포트 비용이 커서 백엔드를 처음 만들 때 임포트
+        import google.generativeai as genai
+
+        self.model = model
+        # Gemini API 설정 (네트워크 요청 없음)
+        genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
+        self._model = genai.GenerativeModel(model)
+
+    def generate(self, prompt: str) -> str:
+        return self._model.generate_content(prompt).text
+
+class LocalBackend(LLMBackend):
+    """
+    네트워크 없이 동작하는 로컬 LLM 대역
+
+    미리 준비한 응답(responses)에 요청이 있으면 그 응답을, 없으면 요청 문장으로 만든
+    테스트 케이스 JSON을 반환합니다. 같은 요청에는 항상 같은 응답을 반환하며,
+    latency(+ 0~jitter)초 동안 대기하고 error_rate 비율로 요청률 초과 오류를 발생시킵니다.
+    """
+    name = "local"
+    model = "local-template"
+    rate_limited = False
+
+    def __init__(self, latency: float = LOCAL_LLM_LATENCY, jitter: float = LOCAL_LLM_JITTER,
+                 error_rate: float = LOCAL_LLM_ERROR_RATE, responses: Optional[Dict[str, Any]] = None,
+                 seed: int = LOCAL_LLM_SEED):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        if responses is None and LOCAL_LLM_RESPONSES:
+            with open(LOCAL_LLM_RESPONSES, "r", encoding="utf-8") as f:
+                responses = json.load(f)
+        self.responses = {normalize_request(request): response for request, response in (responses or {}).items()}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            raise ResourceExhausted("429 Resource has been exhausted (local backend)")
+
+        match = _REQUEST_PATTERN.search(prompt)
+        request = match.group(1).strip() if match else prompt.strip()
+        response = self.responses.get(normalize_request(request))
+        if response is None:
+            response = self.build_response(request)
+        return response if isinstance(response, str) else json.dumps(response, ensure_ascii=False, indent=2)
+
+    def build_response(self, request: str) -> Dict[str, Any]:
+        """요청 문장으로 테스트 케이스를 만듭니다. (요청 문장이 같으면 항상 같은 결과)"""
+        digest = hashlib.sha256(normalize_request(request).encode("utf-8")).hexdigest()[:8]
+        lowered = request.lower()
+        method = next((method for method, keywords in METHOD_KEYWORDS
+                       if any(keyword in lowered for keyword in keywords)), "GET")
+        actions = [action for action in _STEP_SEPARATOR.split(request.strip().rstrip(".")) if action] or [request]
+        return {
+            "id": f"TC_{digest}",
+            "method": method,
+            "test_case_id": f"TC_{digest}",
+            "title": request[:50],
+            "description": f"{request} (로컬 백엔드 생성)",
+            "steps": [
+                {"step_id": i, "action": action, "expected_result": f"{action} 요청이 정상 처리된다"}
+                for i, action in enumerate(actions, 1)
+            ],
+            "preconditions": ["테스트 환경이 준비되어 있다"],
+            "postconditions": ["테스트 데이터가 정리된다"],
+            "tags": ["local", method.lower()],
+            "test_type": "ai_collection"
+        }
+
+BACKENDS = {
+    "gemini": GeminiBackend,
+    "local": LocalBackend
+}
+
+def create_backend(name: Optional[str] = None) -> LLMBackend:
+    """이름(기본값 TESTFLOW_LLM_BACKEND)에 해당하는 LLM 백엔드를 생성합니다."""
+    name = (name or LLM_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 LLM 백엔드입니다: {name} (사용 가능: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -0,0 +1,157 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from typing import Dict, Any, Optional
+
+from test_engine.result_db import RESULTS_DIR
+
+# LLM 응답 캐시 DB 경로 (환경 변수로 조정 가능)
+LLM_CACHE_PATH = os.getenv("TESTFLOW_LLM_CACHE_DB", os.path.join(RESULTS_DIR, "llm_cache.db"))
+# 캐시에 보관할 최대 응답 수 (넘으면 가장 오래 사용되지 않은 응답부터 삭제)
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("TESTFLOW_LLM_CACHE_MAX_ENTRIES", "5000"))
+# 캐시 사용 여부 ("0"이면 사용하지 않음)
+LLM_CACHE_ENABLED = os.getenv("TESTFLOW_LLM_CACHE", "1") != "0"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    template_version TEXT NOT NULL,
+    request TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used);
+
+CREATE TABLE IF NOT EXISTS cache_stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# 요청 끝의 문장 부호는 의미가 같으므로 정규화 시 제거
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?。~…]+$")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_request(text: str) -> str:
+    """
+    캐시 키로 쓰기 위해 자연어 요청을 정규화합니다.
+
+    유니코드 정규화(NFKC), 소문자 변환, 공백 정리, 끝 문장 부호 제거로
+    띄어쓰기나 마침표만 다른 요청을 같은 요청으로 취급합니다.
+    """
+    text = unicodedata.normalize("NFKC", text).lower().strip()
+    text = _WHITESPACE.sub(" ", text)
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+def cache_key(request: str, model: str, template_version: str) -> str:
+    """정규화한 요청, 모델 이름, 프롬프트 템플릿 버전으로 캐시 키를 만듭니다."""
+    raw = "\0".join([model, str(template_version), normalize_request(request)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class LLMCache:
+    """
+    LLM 응답을 보관하는 크기 제한 LRU 캐시 (SQLite)
+
+    같은 요청(정규화 후)·모델·프롬프트 템플릿 버전이면 저장된 응답을 재사용합니다.
+    max_entries를 넘으면 마지막 사용 시각이 가장 오래된 응답부터 삭제합니다.
+    여러 스레드에서 하나의 연결을 공유하며, 여러 프로세스가 동시에 열 수 있도록 WAL 모드를 사용합니다.
+    """
+
+    def __init__(self, db_path: str = LLM_CACHE_PATH, max_entries: int = LLM_CACHE_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        self._conn.execute(
+            "INSERT INTO cache_stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    def get(self, request: str, model: str, template_version: str) -> Optional[str]:
+        """캐시된 응답을 반환합니다. 없으면 None을 반환합니다."""
+        key = cache_key(request, model, template_version)
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._count("misses")
+            else:
+                self._conn.execute("UPDATE llm_cache SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                                   (time.time(), key))
+                self._count("hits")
+            self._conn.commit()
+        return row["response"] if row else None
+
+    def put(self, request: str, model: str, template_version: str, response: str) -> None:
+        """응답을 캐시에 저장하고, 최대 개수를 넘으면 오래 사용되지 않은 응답을 삭제합니다."""
+        key = cache_key(request, model, template_version)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(key, model, template_version, request, response, size, created_at, last_used, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, model, str(template_version), request, response, len(response.encode("utf-8")), now, now)
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY last_used LIMIT ?)",
+                    (overflow,)
+                )
+                self._count("evictions", overflow)
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계(hits, misses, evictions, hit_rate, entries, size_bytes)를 반환합니다."""
+        with self._lock:
+            counters = {row["name"]: row["value"] for row in self._conn.execute("SELECT name, value FROM cache_stats")}
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": entries,
+            "size_bytes": size
+        }
+
+    def clear(self) -> None:
+        """캐시된 응답과 통계를 모두 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.execute("DELETE FROM cache_stats")
+            self._conn.commit()
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_llm_cache() -> LLMCache:
+    """프로세스 공용 LLM 응답 캐시를 반환합니다."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMCache()
+        return _cache
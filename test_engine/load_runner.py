@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from test_engine.http_session import SessionManager, timed_request
+from test_engine.test_runner import case_url
+from test_engine.case_repository import get_case_repository
+from test_engine.run_store import generate_run_id
+
+LOAD_RESULT_DIR = os.path.join("results", "load")
+
+class LatencyHistogram:
+    """
+    HDR 방식의 로그-선형 버킷 히스토그램
+
+    기록 개수와 관계없이 고정된 크기의 카운트 배열만 사용하므로 메모리가 일정합니다.
+    값은 마이크로초 단위 정수로 저장되며, 상대 오차는 약 1.6% 이내입니다.
+    """
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    SUB_BUCKET_HALF = SUB_BUCKET_COUNT // 2
+
+    def __init__(self, max_value_ms: float = 3600 * 1000):
+        """
+        히스토그램 초기화
+
+        Args:
+            max_value_ms: 추적할 최대 지연 시간 (이보다 큰 값은 최댓값으로 기록)
+        """
+        self.max_trackable = int(max_value_ms * 1000)
+        self.counts = [0] * (self._index_for(self.max_trackable) + 1)
+        self.total_count = 0
+        self.total_sum = 0
+        self.min_value = None
+        self.max_value = 0
+
+    def _index_for(self, value: int) -> int:
+        if value < self.SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - self.SUB_BUCKET_BITS
+        top = value >> shift
+        return self.SUB_BUCKET_COUNT + (shift - 1) * self.SUB_BUCKET_HALF + (top - self.SUB_BUCKET_HALF)
+
+    def _highest_value_for(self, index: int) -> int:
+        if index < self.SUB_BUCKET_COUNT:
+            return index
+        shift = (index - self.SUB_BUCKET_COUNT) // self.SUB_BUCKET_HALF + 1
+        top = (index - self.SUB_BUCKET_COUNT) % self.SUB_BUCKET_HALF + self.SUB_BUCKET_HALF
+        return ((top + 1) << shift) - 1
+
+    def record(self, value_ms: float) -> None:
+        """지연 시간(ms)을 기록합니다."""
+        value = min(max(int(value_ms * 1000), 0), self.max_trackable)
+        self.counts[self._index_for(value)] += 1
+        self.total_count += 1
+        self.total_sum += value
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+        self.max_value = max(self.max_value, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """다른 히스토그램의 기록을 합칩니다. (최대 추적값이 같아야 합니다)"""
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.total_count += other.total_count
+        self.total_sum += other.total_sum
+        if other.min_value is not None:
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+
+    def percentile(self, percent: float) -> float:
+        """백분위 지연 시간(ms)을 반환합니다."""
+        if self.total_count == 0:
+            return 0.0
+        target = max(1, int(round(percent / 100 * self.total_count)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_value_for(index), self.max_value) / 1000
+        return self.max_value / 1000
+
+    def summary(self) -> Dict[str, float]:
+        """주요 지연 시간 통계(ms)를 반환합니다."""
+        return {
+            "min": (self.min_value or 0) / 1000,
+            "mean": (self.total_sum / self.total_count / 1000) if self.total_count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max_value / 1000
+        }
+
+def run_load_test(case: Dict[str, Any], env: str = "dev", rps: Optional[float] = None,
+                  concurrency: Optional[int] = None, duration: float = 10.0,
+                  max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    테스트 케이스를 일정한 요청률(rps) 또는 동시성(concurrency)으로 duration초 동안 반복 실행합니다.
+
+    - rps 지정 시: 요청을 예정된 시각에 맞춰 보내며, 지연 시간은 예정 시각부터 측정합니다.
+      (응답이 밀려 전송이 늦어진 시간도 지연으로 집계되어 coordinated omission을 보정)
+    - concurrency 지정 시: concurrency개의 워커가 응답을 받는 즉시 다음 요청을 보냅니다.
+
+    max_workers는 rps 모드에서 동시에 처리 중인 최대 요청 수이며, concurrency 모드에서는 쓰지 않습니다.
+    상태 코드가 expected_status와 다르거나 예외가 발생한 요청은 오류로 집계합니다.
+    """
+    if not rps and not concurrency:
+        raise ValueError("rps 또는 concurrency 중 하나를 지정해야 합니다.")
+    if rps and concurrency:
+        raise ValueError("rps와 concurrency는 함께 지정할 수 없습니다.")
+    if concurrency and max_workers:
+        raise ValueError("concurrency 모드에서는 max_workers를 지정할 수 없습니다. (동시성은 concurrency로 지정)")
+
+    url = case_url(case, env)
+    expected_status = case.get("expected_status", 200)
+    workers = concurrency or max_workers or min(max(int(rps), 1), 256)
+
+    histogram = LatencyHistogram()
+    status_codes = {}
+    counters = {"requests": 0, "errors": 0}
+    lock = threading.Lock()
+
+    with SessionManager(pool_size=workers) as session_manager:
+        session = session_manager.get_session(url)
+
+        def send(scheduled_at: float) -> None:
+            try:
+                response, _ = timed_request(
+                    session,
+                    method=case.get("method", "GET"),
+                    url=url,
+                    headers=case.get("headers", {}),
+                    json=case.get("body", {})
+                )
+                status = response.status_code
+                failed = status != expected_status
+            except Exception:
+                status = "ERROR"
+                failed = True
+            latency_ms = (time.perf_counter() - scheduled_at) * 1000
+            with lock:
+                histogram.record(latency_ms)
+                counters["requests"] += 1
+                counters["errors"] += 1 if failed else 0
+                status_codes[str(status)] = status_codes.get(str(status), 0) + 1
+
+        start = time.perf_counter()
+        deadline = start + duration
+
+        if rps:
+            # 동시에 처리 중인 요청 수를 제한하여 대기열이 무한히 쌓이지 않도록 함
+            in_flight = threading.BoundedSemaphore(workers)
+
+            def send_and_release(scheduled_at: float) -> None:
+                try:
+                    send(scheduled_at)
+                finally:
+                    in_flight.release()
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sent = 0
+                while True:
+                    scheduled_at = start + sent / rps
+                    if scheduled_at >= deadline:
+                        break
+                    delay = scheduled_at - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    in_flight.acquire()
+                    executor.submit(send_and_release, scheduled_at)
+                    sent += 1
+        else:
+            def worker() -> None:
+                while time.perf_counter() < deadline:
+                    send(time.perf_counter())
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for _ in range(concurrency):
+                    executor.submit(worker)
+
+        elapsed = time.perf_counter() - start
+
+    total = counters["requests"]
+    return {
+        "id": case.get("id", "unknown"),
+        "desc": case.get("description", "No description"),
+        "mode": "rps" if rps else "concurrency",
+        "target_rps": rps,
+        "concurrency": concurrency,
+        "duration": duration,
+        "elapsed": round(elapsed, 3),
+        "total_requests": total,
+        "errors": counters["errors"],
+        "error_rate": (counters["errors"] / total * 100) if total else 0.0,
+        "throughput": (total / elapsed) if elapsed > 0 else 0.0,
+        "latency_ms": histogram.summary(),
+        "status_codes": status_codes,
+        "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "env": env,
+        "test_type": "load"
+    }
+
+def run_load_test_by_id(case_id: str, env: str = "dev", **kwargs) -> Dict[str, Any]:
+    """cases/에 저장된 테스트 케이스를 ID로 찾아 부하 테스트를 실행하고 결과를 저장합니다."""
+    case = get_case_repository().get(case_id)
+    if case is None:
+        raise ValueError(f"테스트 케이스를 찾을 수 없습니다: {case_id}")
+
+    result = run_load_test(case, env, **kwargs)
+    save_load_result(result)
+    return result
+
+def save_load_result(result: Dict[str, Any]) -> str:
+    """
+    부하 테스트 결과를 results/load 디렉토리에 저장합니다.
+
+    부하 테스트 결과는 케이스 결과(PASS/FAIL)가 아니므로 실행 기록/결과 DB에 넣지 않으며,
+    실행 이력, 대시보드, 실패 집계에도 포함되지 않습니다.
+    """
+    os.makedirs(LOAD_RESULT_DIR, exist_ok=True)
+    # 같은 케이스를 같은 초에 여러 번 실행해도 겹치지 않도록 실행 ID 형식의 이름을 사용
+    filepath = os.path.join(LOAD_RESULT_DIR, f"load_result_{result['id']}_{generate_run_id()}.json")
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return filepath
@@ -0,0 +1,68 @@
+/**
+ * newman 스트리밍 실행기
+ *
+ * 컬렉션을 newman 라이브러리로 실행하면서 요청(item) 하나가 끝날 때마다 그 실행 결과를
+ * JSON 한 줄로 표준 출력에 씁니다. 출력한 실행 결과는 newman 요약의 executions에서 빼고,
+ * newman이 요청별로 따로 들고 있는 같은 객체(내부 cache)에서도 요청/응답/검사 결과를 지우므로
+ * 요청마다 남는 것은 cursor와 item 참조뿐입니다. (실패 목록(failures)은 요약에 그대로 남음)
+ *
+ * 사용법: node newman_stream.js <컬렉션 경로>
+ *
+ * 출력 (한 줄에 하나):
+ *   {"type": "execution", "execution": {...}}   요청 하나의 결과 (newman JSON 리포트의 executions 항목과 같은 형식)
+ *   {"type": "done", "summary": {...}}          실행 요약 (executions를 뺀 newman JSON 리포트)
+ *
+ * 종료 코드는 newman CLI와 같습니다. (실패한 테스트나 오류가 있으면 1)
+ */
+var newman;
+
+try {
+    newman = require('newman');
+}
+catch (e) {
+    process.stderr.write('newman을 찾을 수 없습니다. 프로젝트 루트에서 npm install을 실행해주세요.\n');
+    process.exit(2);
+}
+
+var collectionPath = process.argv[2];
+
+if (!collectionPath) {
+    process.stderr.write('사용법: node newman_stream.js <컬렉션 경로>\n');
+    process.exit(2);
+}
+
+function emit (record) {
+    process.stdout.write(JSON.stringify(record) + '\n');
+}
+
+var run = newman.run({ collection: collectionPath }, function (err, summary) {
+    if (err) {
+        process.stderr.write(String(err.stack || err) + '\n');
+        process.exitCode = 1;
+
+        return;
+    }
+
+    var report = JSON.parse(JSON.stringify(summary, function (key, value) {
+        return key === 'exports' ? undefined : value;
+    }));
+
+    emit({ type: 'done', summary: report });
+    process.exitCode = (summary.run.failures.length || summary.run.error) ? 1 : 0;
+});
+
+// 요청 하나가 끝나면(테스트 스크립트까지 실행된 후) 그 사이에 쌓인 실행 결과를 내보내고 요약에서 지움
+run.on('item', function () {
+    var executions = run.summary && run.summary.run.executions;
+
+    if (!executions || !executions.length) { return; }
+
+    executions.splice(0).forEach(function (execution) {
+        emit({ type: 'execution', execution: execution });
+
+        // newman 내부 cache가 같은 객체를 cursor.ref로 계속 참조하므로 큰 속성은 객체에서 직접 지움
+        Object.keys(execution).forEach(function (key) {
+            if (key !== 'cursor' && key !== 'item') { delete execution[key]; }
+        });
+    });
+});
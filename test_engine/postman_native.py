@@ -0,0 +1,665 @@
+"""
+내장 Postman 컬렉션 실행기
+
+Postman v2.1 컬렉션 중 자주 쓰는 기능(요청, 변수, 폴더, 상태 코드/본문 검사)만 사용하는 컬렉션을
+newman(Node 프로세스) 없이 이 프로세스에서 실행합니다. 요청은 테스트 실행기와 같은 keep-alive
+세션 풀(http_session)로 보내며, 결과는 newman JSON 리포트와 같은 구조로 반환합니다.
+
+스크립트는 JavaScript를 실행하지 않으며, 아래 형태의 선언적인 문장만 지원합니다.
+    pm.test("상태 코드 200", function () { pm.response.to.have.status(200); });
+    pm.test("토큰 발급", () => { pm.expect(pm.response.json().token).to.exist; });
+    pm.collectionVariables.set("token", pm.response.json().token);
+검사 대상은 pm.response.json()(뒤에 .이름, [번호] 경로 가능), pm.response.text(), pm.response.code이며,
+검사는 equal/eql, include, exist, have.property를 지원합니다.
+그 밖의 문장, 인증, urlencoded/formdata 본문, 동적 변수({{$guid}} 등)가 있으면 find_unsupported가 이유를
+반환하므로 호출하는 쪽에서 newman으로 실행하면 됩니다.
+"""
+import os
+import re
+import ast
+import json
+import time
+import uuid
+import statistics
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from urllib.parse import urlparse, parse_qsl
+
+from test_engine.http_session import SessionManager, DEFAULT_POOL_SIZE, timed_request
+from test_engine.blob_store import get_blob_store
+
+# 동시에 보낼 요청 수 (1이면 newman과 같이 컬렉션 순서대로 실행)
+# 스크립트로 변수를 설정하는 컬렉션은 요청 순서에 의존하므로 이 값과 관계없이 순서대로 실행
+POSTMAN_NATIVE_WORKERS = int(os.getenv("TESTFLOW_POSTMAN_WORKERS", "1"))
+
+# 본문을 보내지 않는 메서드
+BODY_PRUNED_METHODS = {"GET", "HEAD", "COPY", "PURGE", "UNLOCK"}
+# raw 본문 언어별 기본 Content-Type
+RAW_CONTENT_TYPES = {
+    "json": "application/json",
+    "text": "text/plain",
+    "xml": "application/xml",
+    "html": "text/html",
+    "javascript": "application/javascript"
+}
+# 스크립트로 설정할 수 있는 변수 범위 (pm.<범위>.set)
+VARIABLE_SCOPES = {"collectionVariables": "collection", "environment": "environment"}
+
+_VARIABLE_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+
+class _Undefined:
+    """JSON에 없는 속성 (JavaScript undefined, null과 구분)"""
+    def __repr__(self):
+        return "undefined"
+
+UNDEFINED = _Undefined()
+
+class UnsupportedScript(Exception):
+    """내장 실행기가 해석할 수 없는 스크립트"""
+
+class AssertionFailed(Exception):
+    """검사 실패"""
+
+# --- 스크립트 해석 ----------------------------------------------------------
+
+def strip_js_comments(text: str) -> str:
+    """문자열 리터럴 밖의 // 및 /* */ 주석을 제거합니다. (JSON 본문과 스크립트에 공통 사용)"""
+    result = []
+    i, length = 0, len(text)
+    quote = None
+    while i < length:
+        ch = text[i]
+        if quote:
+            result.append(ch)
+            if ch == "\\" and i + 1 < length:
+                result.append(text[i + 1])
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in "\"'`":
+            quote = ch
+            result.append(ch)
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = length if end == -1 else end
+            continue
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = length if end == -1 else end + 2
+            continue
+        else:
+            result.append(ch)
+        i += 1
+    return "".join(result)
+
+def split_statements(source: str) -> List[str]:
+    """괄호 밖의 ; 또는 줄바꿈으로 문장을 나눕니다. (문자열 안의 구분자는 무시)"""
+    statements = []
+    current = []
+    depth = 0
+    quote = None
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        if quote:
+            current.append(ch)
+            if ch == "\\" and i + 1 < len(source):
+                current.append(source[i + 1])
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "\"'`":
+            quote = ch
+            current.append(ch)
+        elif ch in "([{":
+            depth += 1
+            current.append(ch)
+        elif ch in ")]}":
+            depth -= 1
+            current.append(ch)
+        elif ch in ";\n" and depth == 0:
+            statements.append("".join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    statements.append("".join(current).strip())
+    if quote or depth:
+        raise UnsupportedScript("괄호나 문자열이 닫히지 않았습니다.")
+    return [statement for statement in statements if statement]
+
+_STRING = r"""(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')"""
+_NAME = r"[A-Za-z_$][\w$]*"
+_PATH = rf"(?:\.{_NAME}|\[\d+\]|\[{_STRING}\])*"
+_VALUE = rf"pm\.response\.json\(\){_PATH}|pm\.response\.text\(\)|pm\.response\.code"
+
+_TEST_PATTERN = re.compile(
+    rf"pm\.test\(\s*({_STRING})\s*,\s*(?:function\s*\(\s*\)|\(\s*\)\s*=>)\s*\{{(.*)\}}\s*\)", re.DOTALL
+)
+_SET_PATTERN = re.compile(rf"pm\.({'|'.join(VARIABLE_SCOPES)})\.set\(\s*({_STRING})\s*,\s*(.+)\)", re.DOTALL)
+_STATUS_PATTERN = re.compile(r"pm\.response\.to\.have\.status\(\s*(\d+)\s*\)")
+_EXPECT_PATTERN = re.compile(
+    rf"pm\.expect\(\s*({_VALUE})\s*\)\.to(?:\.(?:be|have|deep))*\.(equal|eql|include|exist|property)(?:\((.*)\))?",
+    re.DOTALL
+)
+_PATH_PART_PATTERN = re.compile(rf"\.({_NAME})|\[(\d+)\]|\[({_STRING})\]")
+
+def _literal(text: str) -> Any:
+    """JSON 값 또는 작은따옴표 문자열 리터럴을 해석합니다."""
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    if re.fullmatch(_STRING, text):
+        return ast.literal_eval(text)
+    raise UnsupportedScript(f"값을 해석할 수 없습니다: {text[:40]!r}")
+
+def _value(text: str) -> tuple:
+    """검사/변수 설정에 쓰는 값: ("json", 경로) ("text",) ("code",) ("lit", 값)"""
+    text = text.strip()
+    if re.fullmatch(_VALUE, text):
+        if text == "pm.response.text()":
+            return ("text",)
+        if text == "pm.response.code":
+            return ("code",)
+        path = []
+        for name, index, key in _PATH_PART_PATTERN.findall(text[len("pm.response.json()"):]):
+            path.append(int(index) if index else (ast.literal_eval(key) if key else name))
+        return ("json", path)
+    return ("lit", _literal(text))
+
+def _check(statement: str) -> tuple:
+    """pm.test 안의 검사 문장: ("status", 코드) 또는 ("expect", 값, 검사, 인자)"""
+    match = _STATUS_PATTERN.fullmatch(statement)
+    if match:
+        return ("status", int(match.group(1)))
+    match = _EXPECT_PATTERN.fullmatch(statement)
+    if not match:
+        raise UnsupportedScript(f"지원하지 않는 검사입니다: {statement[:60]!r}")
+    value, method, argument = match.groups()
+    if (method == "exist") != (argument is None):
+        raise UnsupportedScript(f"지원하지 않는 검사입니다: {statement[:60]!r}")
+    return ("expect", _value(value), method, None if argument is None else _literal(argument))
+
+def parse_script(source: str, event_name: str) -> List[tuple]:
+    """
+    스크립트를 단계 목록으로 해석합니다. 지원하지 않는 문장이 있으면 UnsupportedScript가 발생합니다.
+
+    단계: ("test", 이름, [검사]) ("set", 범위, 키, 값)
+    """
+    steps = []
+    for statement in split_statements(strip_js_comments(source)):
+        match = _TEST_PATTERN.fullmatch(statement)
+        if match:
+            if event_name != "test":
+                raise UnsupportedScript("pm.test는 테스트 스크립트에서만 지원합니다.")
+            checks = [_check(check) for check in split_statements(match.group(2))]
+            steps.append(("test", ast.literal_eval(match.group(1)), checks))
+            continue
+        match = _SET_PATTERN.fullmatch(statement)
+        if match:
+            value = _value(match.group(3))
+            if value[0] != "lit" and event_name != "test":
+                raise UnsupportedScript("사전 요청 스크립트에서는 응답 값을 사용할 수 없습니다.")
+            steps.append(("set", VARIABLE_SCOPES[match.group(1)], ast.literal_eval(match.group(2)), value))
+            continue
+        raise UnsupportedScript(f"지원하지 않는 문장입니다: {statement[:60]!r}")
+    return steps
+
+# --- 스크립트 실행 ----------------------------------------------------------
+
+class ResponseData:
+    """검사와 변수 설정에서 읽는 응답 (JSON은 처음 읽을 때 한 번만 해석)"""
+
+    def __init__(self, code: int, content: bytes):
+        self.code = code
+        self.content = content
+        self._json = None
+
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        if self._json is None:
+            try:
+                self._json = json.loads(self.text())
+            except ValueError:
+                raise ValueError(f"JSONError: 응답 본문이 JSON이 아닙니다: {self.text()[:100]!r}")
+        return self._json
+
+def _js_repr(value: Any) -> str:
+    """검사 실패 메시지에 쓸 값 표현 (chai와 비슷한 형식)"""
+    if value is UNDEFINED:
+        return "undefined"
+    if isinstance(value, str):
+        return f"'{value}'"
+    return json.dumps(value, ensure_ascii=False)
+
+def _evaluate(value: tuple, response: Optional[ResponseData]) -> Any:
+    kind = value[0]
+    if kind == "lit":
+        return value[1]
+    if kind == "code":
+        return response.code
+    if kind == "text":
+        return response.text()
+    current = response.json()
+    for part in value[1]:
+        if isinstance(current, list) and isinstance(part, int) and part < len(current):
+            current = current[part]
+        elif isinstance(current, dict) and str(part) in current:
+            current = current[str(part)]
+        elif isinstance(current, (dict, list)):
+            # 없는 속성은 undefined (그 뒤의 속성을 읽으면 TypeError)
+            current = UNDEFINED
+        else:
+            raise TypeError(f"Cannot read properties of {_js_repr(current)} (reading '{part}')")
+    return current
+
+def _run_check(check: tuple, response: ResponseData) -> None:
+    if check[0] == "status":
+        if response.code != check[1]:
+            raise AssertionFailed(f"expected response to have status code {check[1]} but got {response.code}")
+        return
+    _, value, method, expected = check
+    actual = _evaluate(value, response)
+    if method in ("equal", "eql"):
+        # true와 1처럼 타입이 다른 값은 다르게 취급 (정수와 실수는 같은 number)
+        passed = actual == expected and (isinstance(actual, bool) == isinstance(expected, bool))
+        description = f"deeply equal {_js_repr(expected)}" if method == "eql" else f"equal {_js_repr(expected)}"
+    elif method == "include":
+        if isinstance(actual, dict) and isinstance(expected, dict):
+            passed = all(key in actual and actual[key] == item for key, item in expected.items())
+        else:
+            passed = isinstance(actual, (str, list)) and expected in actual
+        description = f"include {_js_repr(expected)}"
+    elif method == "property":
+        passed = isinstance(actual, dict) and str(expected) in actual
+        description = f"have property {_js_repr(expected)}"
+    else:
+        passed = actual is not None and actual is not UNDEFINED
+        description = "exist"
+    if not passed:
+        raise AssertionFailed(f"expected {_js_repr(actual)} to {description}")
+
+def _error_info(error: Exception) -> Dict[str, str]:
+    name = "AssertionError" if isinstance(error, AssertionFailed) else type(error).__name__
+    return {"name": name, "message": str(error)}
+
+def run_script(steps: List[tuple], variables: "VariableStore", response: Optional[ResponseData],
+               assertions: List[Dict[str, Any]]) -> None:
+    """
+    스크립트 단계를 실행합니다.
+
+    검사는 pm.test마다 따로 실패로 기록하고(assertions에 추가), 변수 설정 중 오류는 newman과 같이
+    스크립트 오류로 전달합니다.
+    """
+    for step in steps:
+        if step[0] == "set":
+            _, scope, key, value = step
+            variables.set(scope, key, _evaluate(value, response))
+            continue
+        _, name, checks = step
+        assertion = {"assertion": name, "skipped": False}
+        try:
+            for check in checks:
+                _run_check(check, response)
+        except Exception as e:
+            # 검사 실패뿐 아니라 검사 중 오류(JSON이 아닌 응답 등)도 해당 테스트의 실패로 기록
+            assertion["error"] = dict(_error_info(e), index=len(assertions), test=name, stack="")
+        assertions.append(assertion)
+
+# --- 변수 -------------------------------------------------------------------
+
+class VariableStore:
+    """
+    실행 중의 변수 범위 (우선순위: 환경 > 컬렉션)
+
+    스크립트에서 설정한 값은 이후 요청에 그대로 이어집니다.
+    """
+
+    def __init__(self, collection_variables: Dict[str, Any], environment: Optional[Dict[str, Any]] = None):
+        self.collection = dict(collection_variables)
+        self.environment = dict(environment or {})
+
+    def set(self, scope: str, key: str, value: Any) -> None:
+        getattr(self, scope)[key] = None if value is UNDEFINED else value
+
+    def resolve(self, text: Any) -> Any:
+        """문자열의 {{변수}}를 값으로 바꿉니다. 정의되지 않은 변수는 그대로 둡니다."""
+        if not isinstance(text, str) or "{{" not in text:
+            return text
+
+        def replace(match):
+            name = match.group(1).strip()
+            for scope in (self.environment, self.collection):
+                if name in scope:
+                    value = scope[name]
+                    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+            return match.group(0)
+
+        return _VARIABLE_PATTERN.sub(replace, text)
+
+def variables_from_list(values: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Postman 변수 목록([{key, value, disabled}])을 dict로 변환합니다."""
+    return {item["key"]: item.get("value", "") for item in values or []
+            if "key" in item and not item.get("disabled") and item.get("enabled", True)}
+
+# --- 컬렉션 -----------------------------------------------------------------
+
+def load_collection(path: str) -> Dict[str, Any]:
+    """Postman 컬렉션 파일을 읽습니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def iter_items(collection: Dict[str, Any]) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """요청 항목과 상위 항목 목록(컬렉션, 폴더...)을 컬렉션 순서대로 반환합니다."""
+    items = []
+
+    def walk(children, parents):
+        for child in children:
+            if "item" in child:
+                walk(child["item"], parents + [child])
+            elif "request" in child:
+                items.append((child, parents))
+
+    walk(collection.get("item", []), [collection])
+    return items
+
+def _script_source(node: Dict[str, Any], listen: str) -> str:
+    sources = []
+    for event in node.get("event") or []:
+        if event.get("listen") == listen and not event.get("disabled"):
+            exec_lines = (event.get("script") or {}).get("exec") or []
+            sources.append("\n".join(exec_lines) if isinstance(exec_lines, list) else str(exec_lines))
+    return "\n".join(sources)
+
+def _scripts(item: Dict[str, Any], parents: List[Dict[str, Any]], listen: str) -> List[List[tuple]]:
+    """컬렉션 → 폴더 → 요청 순서로 실행할 스크립트 (해석된 단계 목록)"""
+    scripts = []
+    for node in parents + [item]:
+        steps = parse_script(_script_source(node, listen), listen)
+        if steps:
+            scripts.append(steps)
+    return scripts
+
+def _request_of(item: Dict[str, Any]) -> Dict[str, Any]:
+    request = item["request"]
+    return {"method": "GET", "url": request} if isinstance(request, str) else request
+
+def find_unsupported(collection: Dict[str, Any]) -> List[str]:
+    """내장 실행기로 실행할 수 없는 이유 목록을 반환합니다. 비어 있으면 실행할 수 있습니다."""
+    problems = []
+    nodes = [collection] + [parent for _, parents in iter_items(collection) for parent in parents[1:]]
+    nodes += [item for item, _ in iter_items(collection)]
+    for node in nodes:
+        name = node.get("info", node).get("name", "")
+        for listen in ("prerequest", "test"):
+            try:
+                parse_script(_script_source(node, listen), listen)
+            except UnsupportedScript as e:
+                problems.append(f"{name} {listen} 스크립트: {str(e)}")
+        auth = node.get("auth") or (_request_of(node).get("auth") if "request" in node else None)
+        if auth and auth.get("type") != "noauth":
+            problems.append(f"{name}: 인증({auth.get('type')})은 newman으로 실행합니다.")
+        # Postman이 기본값으로 넣는 빈 설정(disabledSystemHeaders: {} 등)과 disableBodyPruning만 지원
+        behavior = dict(node.get("protocolProfileBehavior") or {})
+        behavior.pop("disableBodyPruning", None)
+        if any(behavior.values()):
+            problems.append(f"{name}: protocolProfileBehavior는 newman으로 실행합니다.")
+        if "request" in node:
+            request = _request_of(node)
+            mode = (request.get("body") or {}).get("mode", "none")
+            if mode not in ("raw", "none"):
+                problems.append(f"{name}: {mode} 본문은 newman으로 실행합니다.")
+            if "{{$" in json.dumps(request, ensure_ascii=False):
+                problems.append(f"{name}: 동적 변수는 newman으로 실행합니다.")
+    # 중복 제거 (순서 유지)
+    return list(dict.fromkeys(problems))
+
+def sets_variables(collection: Dict[str, Any]) -> bool:
+    """스크립트로 변수를 설정하는 컬렉션인지 확인합니다. (설정한 값을 이후 요청이 읽으므로 순서대로 실행해야 함)"""
+    items = iter_items(collection)
+    nodes = [collection] + [parent for _, parents in items for parent in parents[1:]] + [item for item, _ in items]
+    return any(step[0] == "set"
+               for node in nodes for listen in ("prerequest", "test")
+               for step in parse_script(_script_source(node, listen), listen))
+
+# --- 요청 실행 --------------------------------------------------------------
+
+def build_request(item: Dict[str, Any], variables: VariableStore) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    변수를 적용하여 보낼 요청을 만듭니다.
+
+    Returns:
+        (newman 리포트의 request 형식, requests에 넘길 추가 인자)
+    """
+    request = _request_of(item)
+    method = str(variables.resolve(request.get("method", "GET"))).upper()
+    url = request.get("url", "")
+    raw_url = variables.resolve(url.get("raw", "") if isinstance(url, dict) else url)
+    if "://" not in raw_url:
+        raw_url = f"http://{raw_url}"
+
+    headers = [
+        {"key": variables.resolve(header["key"]), "value": variables.resolve(header.get("value", ""))}
+        for header in request.get("header") or [] if not header.get("disabled")
+    ]
+    header_names = {header["key"].lower() for header in headers}
+
+    body = request.get("body") or {}
+    send = {}
+    report_body = None
+    prune = method in BODY_PRUNED_METHODS and not (item.get("protocolProfileBehavior") or {}).get("disableBodyPruning")
+    if body.get("mode") == "raw" and not body.get("disabled") and not prune:
+        language = ((body.get("options") or {}).get("raw") or {}).get("language", "text")
+        raw = variables.resolve(body.get("raw", ""))
+        # JSON 본문의 주석은 Postman과 같이 보내기 전에 제거
+        if language == "json":
+            raw = strip_js_comments(raw)
+        if raw.strip():
+            send["data"] = raw.encode("utf-8")
+            if "content-type" not in header_names and language in RAW_CONTENT_TYPES:
+                headers.append({"key": "Content-Type", "value": RAW_CONTENT_TYPES[language]})
+        report_body = {"mode": "raw", "raw": raw, "options": body.get("options", {})}
+
+    parsed = urlparse(raw_url)
+    report = {
+        "url": {
+            "raw": raw_url,
+            "protocol": parsed.scheme,
+            "host": parsed.hostname.split(".") if parsed.hostname else [],
+            "port": str(parsed.port) if parsed.port else "",
+            "path": [part for part in parsed.path.split("/") if part],
+            "query": [{"key": key, "value": value} for key, value in parse_qsl(parsed.query, keep_blank_values=True)]
+        },
+        "header": headers,
+        "method": method,
+    }
+    if report_body is not None:
+        report["body"] = report_body
+    return report, send
+
+def _script_failure(error: Exception, item: Dict[str, Any], event_name: str) -> Dict[str, Any]:
+    return {
+        "error": _error_info(error),
+        "at": f"{event_name}-script",
+        "source": {"id": item.get("id", ""), "name": item.get("name", "")}
+    }
+
+def _run_scripts(execution: Dict[str, Any], item: Dict[str, Any], parents: List[Dict[str, Any]],
+                 event_name: str, variables: VariableStore, response: Optional[ResponseData]) -> None:
+    for steps in _scripts(item, parents, event_name):
+        execution["_scripts"][event_name] += 1
+        try:
+            run_script(steps, variables, response, execution["assertions"])
+        except Exception as e:
+            # 스크립트 오류는 이 요청의 실패로만 기록하고 다음 요청은 계속 실행
+            execution["_failures"].append(_script_failure(e, item, event_name))
+
+def run_item(item: Dict[str, Any], parents: List[Dict[str, Any]], variables: VariableStore,
+             session_manager: SessionManager) -> Dict[str, Any]:
+    """요청 하나를 실행하고 newman 리포트의 execution 형식으로 반환합니다."""
+    item_name = item.get("name", "")
+    execution = {
+        "cursor": {},
+        "item": {"id": item.get("id", ""), "name": item_name},
+        "id": item.get("id", ""),
+        "assertions": [],
+        "_failures": [],
+        "_scripts": {"prerequest": 0, "test": 0}
+    }
+
+    # 사전 요청 스크립트 (요청 전에 변수를 설정할 수 있음)
+    _run_scripts(execution, item, parents, "prerequest", variables, None)
+
+    request, send = build_request(item, variables)
+    execution["request"] = request
+    try:
+        session = session_manager.get_session(request["url"]["raw"])
+        response, metrics = timed_request(
+            session, request["method"], request["url"]["raw"],
+            headers={header["key"]: header["value"] for header in request["header"]},
+            **send
+        )
+    except Exception as e:
+        execution["requestError"] = _error_info(e)
+        execution["_failures"].append({
+            "error": _error_info(e),
+            "at": "request",
+            "source": {"id": item.get("id", ""), "name": item_name}
+        })
+        return execution
+
+    content = response.content
+    execution["response"] = {
+        "id": str(uuid.uuid4()),
+        "status": response.reason,
+        "code": response.status_code,
+        "header": [{"key": key, "value": value} for key, value in response.headers.items()],
+        # 응답 본문은 블롭 저장소에 바이트 그대로 저장하고 키만 남김 (run_store.load_response_body로 읽음)
+        "stream": {"type": "Buffer", "blob": get_blob_store().put(content), "size": len(content)},
+        "cookie": [],
+        "responseTime": round(metrics["timings"]["total_ms"]),
+        "responseSize": len(content),
+        "timings": metrics["timings"],
+        "requestBytes": metrics["request_bytes"],
+        "responseBytes": metrics["response_bytes"]
+    }
+
+    # 테스트 스크립트 (상태 코드/본문 검사, 다음 요청에 쓸 변수 설정)
+    _run_scripts(execution, item, parents, "test", variables, ResponseData(response.status_code, content))
+    return execution
+
+def _stat(total: int, failed: int) -> Dict[str, int]:
+    return {"total": total, "pending": 0, "failed": failed}
+
+def run_collection(collection: Dict[str, Any], environment: Optional[Dict[str, Any]] = None,
+                   max_workers: Optional[int] = None,
+                   on_execution: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    컬렉션을 실행하고 newman JSON 리포트와 같은 구조의 결과를 반환합니다.
+
+    Args:
+        collection: Postman v2.1 컬렉션
+        environment: 환경 변수 (Postman 환경 파일의 values 또는 dict)
+        max_workers: 동시에 보낼 요청 수 (스크립트로 변수를 설정하는 컬렉션은 항상 순서대로 실행)
+        on_execution: 요청이 끝날 때마다 그 실행 결과(newman 리포트의 executions 항목)로 호출
+            (동시 실행에서도 이 함수를 호출한 스레드에서 끝난 순서대로 호출됨)
+
+    Raises:
+        UnsupportedScript: 내장 실행기로 실행할 수 없는 컬렉션인 경우
+    """
+    problems = find_unsupported(collection)
+    if problems:
+        raise UnsupportedScript("; ".join(problems))
+    if isinstance(environment, list):
+        environment = variables_from_list(environment)
+    variables = VariableStore(variables_from_list(collection.get("variable")), environment)
+    items = iter_items(collection)
+    max_workers = max_workers or POSTMAN_NATIVE_WORKERS
+    # 동시 실행에서는 변수가 바뀌지 않으므로(읽기만 함) 여러 스레드가 같은 변수 범위를 써도 안전
+    if sets_variables(collection):
+        max_workers = 1
+
+    def finished(execution):
+        if on_execution:
+            # 내부 집계 필드(_failures, _scripts)는 빼고 전달
+            on_execution({key: value for key, value in execution.items() if not key.startswith("_")})
+        return execution
+
+    started = int(time.time() * 1000)
+    with SessionManager(pool_size=max(DEFAULT_POOL_SIZE, max_workers)) as session_manager:
+        if max_workers <= 1 or len(items) <= 1:
+            executions = [finished(run_item(item, parents, variables, session_manager)) for item, parents in items]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+                futures = [executor.submit(run_item, item, parents, variables, session_manager)
+                           for item, parents in items]
+                for future in as_completed(futures):
+                    finished(future.result())
+                executions = [future.result() for future in futures]
+    completed = int(time.time() * 1000)
+
+    failures = []
+    assertion_total = assertion_failed = 0
+    script_counts = {"prerequest": [0, 0], "test": [0, 0]}
+    for execution in executions:
+        for failure in execution.pop("_failures"):
+            failure["parent"] = {"name": collection.get("info", {}).get("name", "")}
+            failures.append(failure)
+            event = failure["at"].split("-")[0]
+            if event in script_counts:
+                script_counts[event][1] += 1
+        for event, count in execution.pop("_scripts").items():
+            script_counts[event][0] += count
+        for assertion in execution["assertions"]:
+            assertion_total += 1
+            if "error" in assertion:
+                assertion_failed += 1
+                failures.append({
+                    "error": assertion["error"],
+                    "at": f"assertion:{assertion['error']['index']} in test-script",
+                    "source": execution["item"],
+                    "parent": {"name": collection.get("info", {}).get("name", "")}
+                })
+        # newman과 같이 검사가 없는 요청에는 assertions를 넣지 않음
+        if not execution["assertions"]:
+            del execution["assertions"]
+
+    response_times = [execution["response"]["responseTime"] for execution in executions if "response" in execution]
+    request_failed = sum(1 for execution in executions if "requestError" in execution)
+    return {
+        "collection": {"info": collection.get("info", {}), "item": collection.get("item", [])},
+        "environment": {"values": [{"key": key, "value": value} for key, value in variables.environment.items()]},
+        "globals": {"values": []},
+        "run": {
+            "stats": {
+                "iterations": _stat(1, 0),
+                "items": _stat(len(items), 0),
+                "scripts": _stat(sum(count for count, _ in script_counts.values()),
+                                 sum(failed for _, failed in script_counts.values())),
+                "prerequests": _stat(len(items), 0),
+                "requests": _stat(len(items), request_failed),
+                "tests": _stat(len(items), 0),
+                "assertions": _stat(assertion_total, assertion_failed),
+                "testScripts": _stat(*script_counts["test"]),
+                "prerequestScripts": _stat(*script_counts["prerequest"])
+            },
+            "timings": {
+                "responseAverage": statistics.mean(response_times) if response_times else 0,
+                "responseMin": min(response_times) if response_times else 0,
+                "responseMax": max(response_times) if response_times else 0,
+                "responseSd": statistics.pstdev(response_times) if response_times else 0,
+                "started": started,
+                "completed": completed
+            },
+            "executions": executions,
+            "transfers": {"responseTotal": sum(execution["response"]["responseSize"]
+                                               for execution in executions if "response" in execution)},
+            "failures": failures,
+            "error": None
+        }
+    }
@@ -0,0 +1,128 @@
+"""
+Postman 실행 결과를 요청 단위 레코드로 변환합니다.
+
+newman(또는 내장 실행기) 리포트의 executions 항목 하나가 레코드 하나가 되며,
+결과 DB의 postman_executions 테이블, 분석용 이력, 보고서가 같은 레코드를 사용합니다.
+실행 경로와 결과 DB에서 가져다 쓰므로 표준 라이브러리 외에는 의존하지 않습니다.
+"""
+from typing import List, Dict, Any, Optional
+
+# 레코드 한 건 = 요청 하나 (assertions는 테스트(pm.test) 결과 목록)
+RECORD_FIELDS = [
+    "seq", "name", "method", "url", "result", "status_code", "status", "error",
+    "response_time_ms", "connect_ms", "tls_ms", "ttfb_ms", "download_ms",
+    "request_bytes", "response_bytes", "assertions_total", "assertions_failed", "assertions"
+]
+
+def int_or_none(value: Any) -> Optional[int]:
+    """정수면 그대로, 아니면(bool 포함) None을 반환합니다."""
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+def float_or_none(value: Any) -> Optional[float]:
+    """숫자면 float로, 아니면(bool 포함) None을 반환합니다."""
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+def _url_text(url: Any) -> str:
+    """Postman URL 객체(또는 문자열)를 문자열로 만듭니다."""
+    if isinstance(url, str):
+        return url
+    if not isinstance(url, dict):
+        return ""
+    if url.get("raw"):
+        return url["raw"]
+    host = url.get("host", "")
+    host = ".".join(host) if isinstance(host, list) else host
+    path = url.get("path", "")
+    path = "/".join(path) if isinstance(path, list) else path
+    text = f"{url['protocol']}://" if url.get("protocol") else ""
+    text += host
+    if url.get("port"):
+        text += f":{url['port']}"
+    if path:
+        text += "/" + path.lstrip("/")
+    query = [f"{param.get('key', '')}={param.get('value') or ''}" for param in url.get("query", [])
+             if isinstance(param, dict) and not param.get("disabled")]
+    if query:
+        text += "?" + "&".join(query)
+    return text
+
+def _error_message(error: Any) -> Optional[str]:
+    if not error:
+        return None
+    if isinstance(error, dict):
+        return error.get("message") or error.get("name") or str(error)
+    return str(error)
+
+def execution_record(execution: Dict[str, Any], seq: int) -> Dict[str, Any]:
+    """
+    리포트의 요청 실행 하나를 레코드로 변환합니다.
+
+    응답이 없으면 ERROR, 상태 코드가 400 이상이거나 실패한 테스트가 있으면 FAIL, 그 외에는 PASS입니다.
+    """
+    request = execution.get("request") or {}
+    response = execution.get("response") or None
+    name = request.get("name") or (execution.get("item") or {}).get("name") or "UNKNOWN"
+    assertions = [
+        {
+            "name": assertion.get("assertion", ""),
+            "passed": not assertion.get("error") and not assertion.get("skipped"),
+            "skipped": bool(assertion.get("skipped")),
+            "error": _error_message(assertion.get("error"))
+        }
+        for assertion in execution.get("assertions") or []
+    ]
+    failed = sum(1 for assertion in assertions if assertion["error"])
+    code = int_or_none(response.get("code")) if response else None
+    if code is None:
+        outcome = "ERROR"
+    elif code >= 400 or failed:
+        outcome = "FAIL"
+    else:
+        outcome = "PASS"
+    # 내장 실행기 결과에는 구간별 소요 시간과 송수신 바이트 수가 포함됨 (newman 결과에는 없음)
+    response = response or {}
+    timings = response.get("timings") or {}
+    return {
+        "seq": seq,
+        "name": name,
+        "method": request.get("method", ""),
+        "url": _url_text(request.get("url")),
+        "result": outcome,
+        "status_code": code,
+        "status": response.get("status"),
+        "error": _error_message(execution.get("requestError")),
+        "response_time_ms": float_or_none(timings.get("total_ms", response.get("responseTime"))),
+        "connect_ms": float_or_none(timings.get("connect_ms")),
+        "tls_ms": float_or_none(timings.get("tls_ms")),
+        "ttfb_ms": float_or_none(timings.get("ttfb_ms")),
+        "download_ms": float_or_none(timings.get("download_ms")),
+        "request_bytes": int_or_none(response.get("requestBytes")),
+        "response_bytes": int_or_none(response.get("responseBytes", response.get("responseSize"))),
+        "assertions_total": len(assertions),
+        "assertions_failed": failed,
+        "assertions": assertions
+    }
+
+def build_records(report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """newman JSON 리포트의 모든 요청 실행을 레코드 목록으로 변환합니다. (seq는 1부터)"""
+    executions = (report or {}).get("run", {}).get("executions", [])
+    return [execution_record(execution, seq) for seq, execution in enumerate(executions, 1)]
+
+def postman_records(postman_result: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    run_postman_collection 결과의 요청 레코드를 반환합니다.
+
+    레코드가 함께 저장되지 않은 이전 결과는 raw_result에서 만듭니다.
+    """
+    if not postman_result:
+        return []
+    if "records" in postman_result:
+        return postman_result["records"]
+    return build_records(postman_result.get("raw_result"))
+
+def count_records(records: List[Dict[str, Any]]) -> Dict[str, int]:
+    """레코드를 결과별로 셉니다. (total, PASS, FAIL, ERROR)"""
+    counts = {"total": len(records), "PASS": 0, "FAIL": 0, "ERROR": 0}
+    for record in records:
+        counts[record["result"]] = counts.get(record["result"], 0) + 1
+    return counts
@@ -2,9 +2,149 @@ import subprocess
 import os
 import sys
 import json
+import uuid
+import logging
+import queue
+import shlex
+import tempfile
+import threading
 from datetime import datetime
+from test_engine.postman_native import load_collection, find_unsupported, run_collection
+from test_engine.postman_shards import split_collection, merge_reports, count_requests
+from test_engine.postman_records import build_records, count_records
+from test_engine.run_store import compact_execution
 
-def run_postman_collection(collection_path=None):
+# Postman 컬렉션 실행 엔진
+# - auto: 내장 실행기가 지원하는 컬렉션은 이 프로세스에서 실행하고, 아니면 newman으로 실행
+# - native: 항상 내장 실행기로 실행 (지원하지 않는 컬렉션은 실패)
+# - newman: 항상 newman으로 실행
+POSTMAN_ENGINE = os.getenv("TESTFLOW_POSTMAN_ENGINE", "auto")
+# newman 스트리밍 실행기를 실행할 Node.js 명령
+NODE_COMMAND = os.getenv("TESTFLOW_NODE_COMMAND", "node")
+# 요청이 끝날 때마다 결과를 JSON 한 줄로 출력하는 newman 실행 스크립트 (프로젝트의 node_modules/newman 사용)
+NEWMAN_STREAM_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "newman_stream.js")
+# newman으로 실행할 때 동시에 띄울 newman 프로세스 수 (1이면 분할하지 않음)
+NEWMAN_SHARDS = int(os.getenv("TESTFLOW_NEWMAN_SHARDS", "1"))
+# 컬렉션 분할 방식 (folder: 최상위 폴더 단위, range: 요청 순서대로 고르게)
+NEWMAN_SHARD_MODE = os.getenv("TESTFLOW_NEWMAN_SHARD_MODE", "folder")
+
+logger = logging.getLogger(__name__)
+
+def _read_events(index, stream, events):
+    """newman 프로세스의 출력을 한 줄씩 읽어 (프로세스 번호, 이벤트)로 큐에 넣습니다. 출력이 끝나면 None을 넣습니다."""
+    try:
+        for line in stream:
+            try:
+                events.put((index, json.loads(line)))
+            except json.JSONDecodeError:
+                continue
+    finally:
+        events.put((index, None))
+
+def run_newman(collection_paths, on_execution=None):
+    """
+    컬렉션마다 newman 프로세스를 하나씩 띄워 동시에 실행하고, 컬렉션 순서대로 newman JSON 리포트 목록을 반환합니다.
+
+    요청 결과는 newman이 요청을 끝낼 때마다 한 줄씩 읽어 응답 본문을 바로 블롭 저장소로 옮기며,
+    on_execution(execution)은 이 함수를 호출한 스레드에서 요청마다 바로 호출됩니다. 테스트 실패로 newman이 1로 종료해도 리포트를 반환하며,
+    요약을 받지 못했거나 다른 종료 코드로 끝나면 CalledProcessError를 발생시킵니다.
+    """
+    events = queue.Queue()
+    processes = []
+    try:
+        for index, collection_path in enumerate(collection_paths):
+            stderr = tempfile.TemporaryFile()
+            process = subprocess.Popen(
+                shlex.split(NODE_COMMAND) + [NEWMAN_STREAM_SCRIPT, collection_path],
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+                encoding='utf-8'
+            )
+            processes.append((process, stderr))
+            threading.Thread(target=_read_events, args=(index, process.stdout, events), daemon=True).start()
+        
+        executions = [[] for _ in processes]
+        summaries = [None] * len(processes)
+        running = len(processes)
+        while running:
+            index, event = events.get()
+            if event is None:
+                running -= 1
+            elif event.get("type") == "execution":
+                execution = compact_execution(event["execution"])
+                executions[index].append(execution)
+                if on_execution:
+                    on_execution(execution)
+            elif event.get("type") == "done":
+                summaries[index] = event["summary"]
+        
+        reports = []
+        for (process, stderr), summary, index_executions in zip(processes, summaries, executions):
+            returncode = process.wait()
+            stderr.seek(0)
+            error = stderr.read().decode('utf-8', errors='replace')
+            # 종료 코드 1은 실패한 테스트가 있다는 뜻이므로 요약을 받았으면 정상 종료로 처리 (실패는 레코드에 표시됨)
+            if returncode not in (0, 1) or summary is None:
+                raise subprocess.CalledProcessError(returncode, process.args,
+                                                    stderr=error or f"newman 실행 실패 (종료 코드 {returncode})")
+            summary.setdefault("run", {})["executions"] = index_executions
+            reports.append(summary)
+        return reports
+    finally:
+        # 중간에 오류가 나거나 중단되면 남은 newman 프로세스도 종료
+        for process, stderr in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr.close()
+
+def run_newman_shards(collection_path, output_path, shards, shard_mode, on_execution=None):
+    """
+    컬렉션을 나눠 newman 프로세스 여러 개로 동시에 실행하고 리포트를 하나로 합칩니다.
+
+    샤드별 컬렉션과 리포트는 logs/postman_shards/<실행 ID>/에 저장됩니다.
+    """
+    collection = load_collection(collection_path)
+    parts = split_collection(collection, shards, shard_mode)
+    if len(parts) <= 1:
+        return run_newman([collection_path], on_execution)[0]
+    
+    shard_dir = os.path.join(os.path.dirname(output_path), "postman_shards", uuid.uuid4().hex[:8])
+    os.makedirs(shard_dir, exist_ok=True)
+    paths = []
+    for i, part in enumerate(parts, 1):
+        shard_path = os.path.join(shard_dir, f"collection_{i}.json")
+        with open(shard_path, 'w', encoding='utf-8') as f:
+            json.dump(part["collection"], f, ensure_ascii=False)
+        paths.append(shard_path)
+    
+    try:
+        reports = run_newman(paths, on_execution)
+    finally:
+        # 샤드 컬렉션은 실행이 끝나면 필요 없으므로 삭제
+        for shard_path in paths:
+            os.remove(shard_path)
+    
+    for i, report in enumerate(reports, 1):
+        with open(os.path.join(shard_dir, f"report_{i}.json"), 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False)
+    return merge_reports(collection, parts, reports)
+
+def run_postman_collection(collection_path=None, engine=None, shards=None, shard_mode=None,
+                           writer=None, progress_callback=None):
+    """
+    Postman 컬렉션을 실행합니다.
+
+    Args:
+        collection_path: 컬렉션 파일 경로 (프로젝트 루트 기준 상대 경로 가능)
+        engine: 실행 엔진 (auto, native, newman / 기본값 TESTFLOW_POSTMAN_ENGINE)
+        shards: newman으로 실행할 때 동시에 띄울 newman 프로세스 수 (기본값 TESTFLOW_NEWMAN_SHARDS)
+        shard_mode: 컬렉션 분할 방식 (folder, range / 기본값 TESTFLOW_NEWMAN_SHARD_MODE)
+        writer: 요청 결과를 끝나는 대로 기록할 RunWriter
+            (실행이 중간에 중단되어도 그때까지의 결과가 실행 기록에 남음)
+        progress_callback: 요청이 끝날 때마다 (완료 수, 전체 수, 요청 결과)로 호출
+    """
     # 현재 파일의 디렉토리 경로를 기준으로 절대 경로 설정
     current_dir = os.path.dirname(os.path.abspath(__file__))
     root_dir = os.path.dirname(current_dir)
@@ -22,31 +162,57 @@ def run_postman_collection(collection_path=None):
     if not os.path.exists(collection_path):
         return {"status": "fail", "error": f"❗ Postman collection 파일을 찾을 수 없습니다: {collection_path}"}
 
+    done = 0
+    total = 0
+    
+    def on_execution(execution):
+        nonlocal done
+        done += 1
+        if writer is not None:
+            writer.append_postman_execution(execution)
+        if progress_callback:
+            progress_callback(done, total, execution)
+    
+    engine = engine or POSTMAN_ENGINE
+    if engine != "newman":
+        try:
+            collection = load_collection(collection_path)
+            problems = find_unsupported(collection)
+            if not problems:
+                total = count_requests(collection)
+                return run_native_collection(collection, output_path, on_execution)
+            if engine == "native":
+                return {"status": "fail", "error": "내장 실행기가 지원하지 않는 컬렉션입니다:\n" + "\n".join(problems)}
+            logger.info("내장 실행기가 지원하지 않는 컬렉션이므로 newman으로 실행합니다: %s", problems[0])
+        except Exception as e:
+            return {
+                "status": "fail",
+                "error": str(e)
+            }
+
     try:
-        # Windows에서는 npx를 사용하여 newman 실행
-        command = f'npx newman run "{collection_path}" --reporters cli,json --reporter-json-export "{output_path}"'
+        total = count_requests(load_collection(collection_path))
+        shards = shards or NEWMAN_SHARDS
+        if shards > 1:
+            json_result = run_newman_shards(collection_path, output_path, shards, shard_mode or NEWMAN_SHARD_MODE,
+                                            on_execution)
+        else:
+            json_result = run_newman([collection_path], on_execution)[0]
         
-        # shell=True를 사용하여 명령어 실행
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        # 응답 본문은 실행 중에 블롭 저장소로 옮겼으므로 리포트 파일에는 블롭 키만 남음
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(json_result, f, ensure_ascii=False)
         
-        # JSON 결과 파일 읽기
-        with open(output_path, 'r', encoding='utf-8') as f:
-            json_result = json.load(f)
-        
-        # 결과를 더 읽기 쉽게 포맷팅
-        formatted_result = format_postman_result(json_result)
+        records = build_records(json_result)
         
         return {
             "status": "success",
-            "output": formatted_result,
+            "output": format_postman_result(records),
             "report_path": output_path,
-            "raw_result": json_result
+            "raw_result": json_result,
+            "records": records,
+            "engine": "newman"
         }
     except subprocess.CalledProcessError as e:
         return {
@@ -59,53 +225,57 @@ def run_postman_collection(collection_path=None):
             "error": str(e)
         }
 
-def format_postman_result(result):
+def run_native_collection(collection, output_path, on_execution=None):
     """
-    Postman 테스트 결과를 읽기 쉽게 포맷팅합니다.
+    내장 실행기로 컬렉션을 실행합니다. (newman 실행과 같은 결과 형식, 리포트 파일도 같은 경로에 저장)
+
+    on_execution(execution)은 요청이 끝날 때마다 호출됩니다.
     """
-    formatted = []
+    json_result = run_collection(collection, on_execution=on_execution)
     
-    # 실행 정보
-    run_info = result.get('run', {})
-    stats = run_info.get('stats', {})
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(json_result, f, ensure_ascii=False)
+    
+    records = build_records(json_result)
+    
+    return {
+        "status": "success",
+        "output": format_postman_result(records),
+        "report_path": output_path,
+        "raw_result": json_result,
+        "records": records,
+        "engine": "native"
+    }
+
+def format_postman_result(records):
+    """
+    Postman 요청 레코드(postman_records.build_records 결과)를 읽기 쉬운 텍스트로 포맷팅합니다.
+
+    화면/로그 표시용이며, 분석과 보고서는 이 텍스트 대신 레코드를 사용합니다.
+    """
+    counts = count_records(records)
+    formatted = []
     
     formatted.append("📊 테스트 실행 결과")
     formatted.append(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    formatted.append(f"총 요청 수: {stats.get('requests', {}).get('total', 0)}")
-    formatted.append(f"성공: {stats.get('requests', {}).get('passed', 0)}")
-    formatted.append(f"실패: {stats.get('requests', {}).get('failed', 0)}")
+    formatted.append(f"총 요청 수: {counts['total']}")
+    formatted.append(f"성공: {counts['PASS']}")
+    formatted.append(f"실패: {counts['FAIL'] + counts['ERROR']}")
     formatted.append("\n📝 상세 결과:")
     
     # 각 요청의 결과
-    executions = run_info.get('executions', [])
-    for idx, execution in enumerate(executions, 1):
-        request = execution.get('request', {})
-        response = execution.get('response', {})
-        
-        # 요청 이름 가져오기 (item.name 또는 request.name에서 찾기)
-        request_name = request.get('name', '')
-        if not request_name:
-            # item에서 이름 찾기
-            item = execution.get('item', {})
-            request_name = item.get('name', '이름 없음')
-        
-        method = request.get('method', '')
-        url = request.get('url', {}).get('raw', '')
-        
-        # URL에서 마지막 경로를 이름으로 사용 (이름이 없는 경우)
-        if request_name == '이름 없음' and url:
-            path_parts = url.split('/')
-            if len(path_parts) > 1:
-                request_name = path_parts[-1]
-        
-        formatted.append(f"\n{idx}. {method} - {request_name}")
-        formatted.append(f"   URL: {url}")
-        formatted.append(f"   상태 코드: {response.get('code', '')}")
-        formatted.append(f"   상태: {'✅ 성공' if execution.get('response', {}).get('code', 0) < 400 else '❌ 실패'}")
+    for record in records:
+        formatted.append(f"\n{record['seq']}. {record['method']} - {record['name']}")
+        formatted.append(f"   URL: {record['url']}")
+        formatted.append(f"   상태 코드: {record['status_code'] if record['status_code'] is not None else ''}")
+        formatted.append(f"   상태: {'✅ 성공' if record['result'] == 'PASS' else '❌ 실패'}")
         
         # 실패한 경우 상세 정보 추가
-        if execution.get('response', {}).get('code', 0) >= 400:
-            formatted.append(f"   실패 사유: {response.get('status', '')}")
-            formatted.append(f"   응답 본문: {response.get('body', '')}")
+        if record['result'] != 'PASS':
+            formatted.append(f"   실패 사유: {record['error'] or record['status'] or ''}")
+            for assertion in record['assertions']:
+                if assertion['error']:
+                    formatted.append(f"   실패한 테스트: {assertion['name']} ({assertion['error']})")
     
     return "\n".join(formatted)
@@ -0,0 +1,205 @@
+"""
+Postman 컬렉션 분할/병합
+
+newman 프로세스 하나는 요청을 순서대로 하나씩 보내므로, 큰 컬렉션은 여러 조각(샤드)으로 나눠
+newman 프로세스 여러 개로 동시에 실행한 뒤 리포트를 하나로 합칩니다.
+
+- folder: 최상위 폴더(또는 폴더 밖 요청) 단위로 나눕니다. 폴더 안의 요청 순서와 변수 흐름은 유지됩니다.
+- range: 요청을 컬렉션 순서대로 고르게 나눕니다.
+어느 방식이든 상위 폴더와 컬렉션의 변수, 인증, 스크립트는 각 샤드에 그대로 복사됩니다.
+샤드 사이에는 스크립트로 설정한 변수가 이어지지 않으므로, 한 단위에서 설정한 변수를 다른 단위가 읽으면
+경고를 남기고 나누지 않습니다.
+"""
+import re
+import copy
+import json
+import statistics
+import warnings
+from typing import List, Dict, Any, Optional
+
+SHARD_MODES = ("folder", "range")
+
+# 스크립트에서 변수를 설정하는 호출 (변수 이름이 문자열 리터럴이 아니면 이름을 알 수 없음)
+_SET_VARIABLE_PATTERN = re.compile(
+    r"\b(?:pm\.(?:collectionVariables|environment|globals|variables)\.set"
+    r"|postman\.set(?:Environment|Global)Variable)\s*\(\s*(?:([\"'`])(.*?)\1)?"
+)
+
+def count_requests(node: Dict[str, Any]) -> int:
+    """폴더(또는 컬렉션) 안의 요청 수"""
+    if "item" not in node:
+        return 1
+    return sum(count_requests(child) for child in node["item"])
+
+def _prune(node: Dict[str, Any], keep: set, counter: List[int]) -> Dict[str, Any]:
+    """keep에 포함된 번호의 요청만 남긴 사본을 만듭니다. (요청 번호는 컬렉션 순서)"""
+    children = []
+    for child in node.get("item", []):
+        if "item" in child:
+            pruned = _prune(child, keep, counter)
+            if pruned["item"]:
+                children.append(pruned)
+        else:
+            if counter[0] in keep:
+                children.append(child)
+            counter[0] += 1
+    result = {key: value for key, value in node.items() if key != "item"}
+    result["item"] = children
+    return result
+
+def _scripts_text(node: Dict[str, Any]) -> str:
+    """노드(와 하위 항목)의 모든 스크립트 소스"""
+    sources = []
+    for event in node.get("event") or []:
+        exec_lines = (event.get("script") or {}).get("exec") or []
+        sources.append("\n".join(exec_lines) if isinstance(exec_lines, list) else str(exec_lines))
+    sources += [_scripts_text(child) for child in node.get("item", [])]
+    return "\n".join(sources)
+
+def _set_variables(script: str) -> List[Optional[str]]:
+    """스크립트에서 설정하는 변수 이름 목록 (이름을 알 수 없는 호출은 None)"""
+    return [match.group(2) if match.group(1) else None for match in _SET_VARIABLE_PATTERN.finditer(script)]
+
+def shared_variables(collection: Dict[str, Any], mode: str = "folder") -> List[str]:
+    """
+    나눠서 실행하면 값이 이어지지 않는, 스크립트로 설정하는 변수 이름 목록을 반환합니다.
+
+    컬렉션 수준 스크립트에서 설정하는 변수와, folder 방식은 한 최상위 폴더에서 설정하고 다른 폴더가
+    {{이름}} 또는 스크립트에서 읽는 변수, range 방식은 스크립트에서 설정하는 모든 변수가 해당합니다.
+    이름을 알 수 없는 설정은 "?"로 표시합니다.
+    """
+    shared = [name or "?" for name in _set_variables(_scripts_text(dict(collection, item=[])))]
+    units = collection.get("item", [])
+    if mode == "range":
+        # 폴더 중간에서도 나뉠 수 있으므로 폴더 안에서 설정하는 변수도 끊길 수 있음
+        shared += [name or "?" for unit in units for name in _set_variables(_scripts_text(unit))]
+        return list(dict.fromkeys(shared))
+    texts = [json.dumps(unit, ensure_ascii=False) for unit in units]
+    scripts = [_scripts_text(unit) for unit in units]
+    for i in range(len(units)):
+        other_texts = texts[:i] + texts[i + 1:]
+        other_scripts = scripts[:i] + scripts[i + 1:]
+        for name in _set_variables(scripts[i]):
+            if name is None:
+                if other_texts:
+                    shared.append("?")
+            elif (any("{{" + name + "}}" in text for text in other_texts)
+                  or any(name in script for script in other_scripts)):
+                shared.append(name)
+    return list(dict.fromkeys(shared))
+
+def split_collection(collection: Dict[str, Any], shards: int, mode: str = "folder") -> List[Dict[str, Any]]:
+    """
+    컬렉션을 최대 shards개로 나눕니다.
+
+    샤드 사이에 이어져야 하는 변수(shared_variables)가 있으면 경고(UserWarning)를 남기고 나누지 않습니다.
+
+    Returns:
+        샤드 목록. 각 샤드는 {"collection": 샤드 컬렉션, "indexes": 원래 컬렉션에서의 요청 번호 목록}
+    """
+    if mode not in SHARD_MODES:
+        raise ValueError(f"지원하지 않는 분할 방식입니다: {mode} (사용 가능: {', '.join(SHARD_MODES)})")
+    total = count_requests(collection)
+    shards = max(1, min(shards, total))
+    if shards > 1:
+        shared = shared_variables(collection, mode)
+        if shared:
+            warnings.warn(f"스크립트로 설정한 변수가 샤드 사이에서 이어지지 않으므로 컬렉션을 나누지 않습니다: "
+                          f"{', '.join(shared)}", UserWarning, stacklevel=2)
+            shards = 1
+
+    # 나눌 단위: (요청 번호 목록)
+    units = []
+    if mode == "folder":
+        start = 0
+        for child in collection.get("item", []):
+            size = count_requests(child)
+            if size:
+                units.append(list(range(start, start + size)))
+            start += size
+    else:
+        units = [[index] for index in range(total)]
+
+    groups = [[] for _ in range(shards)]
+    if mode == "folder":
+        # 요청 수가 많은 단위부터 가장 적게 배정된 샤드에 배정
+        for unit in sorted(units, key=len, reverse=True):
+            min(groups, key=len).extend(unit)
+    else:
+        # 연속된 범위로 고르게 나눔
+        size, extra = divmod(total, shards)
+        start = 0
+        for i in range(shards):
+            end = start + size + (1 if i < extra else 0)
+            groups[i] = list(range(start, end))
+            start = end
+
+    result = []
+    for group in groups:
+        if not group:
+            continue
+        indexes = sorted(group)
+        shard = _prune(copy.deepcopy(collection), set(indexes), [0])
+        shard.setdefault("info", {})["name"] = f"{collection.get('info', {}).get('name', '')} [{len(result) + 1}]"
+        result.append({"collection": shard, "indexes": indexes})
+    return result
+
+def _sum_stats(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    stats = {}
+    for report in reports:
+        for name, values in report.get("run", {}).get("stats", {}).items():
+            merged = stats.setdefault(name, {"total": 0, "pending": 0, "failed": 0})
+            for key in merged:
+                merged[key] += values.get(key, 0)
+    # 반복(iteration)은 샤드가 동시에 한 번씩 실행한 것이므로 합치지 않음
+    if "iterations" in stats and reports:
+        stats["iterations"] = dict(reports[0]["run"]["stats"]["iterations"])
+    return stats
+
+def merge_reports(collection: Dict[str, Any], shards: List[Dict[str, Any]],
+                  reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    샤드별 newman JSON 리포트를 원래 컬렉션 순서의 리포트 하나로 합칩니다.
+
+    Args:
+        collection: 원래 컬렉션
+        shards: split_collection 결과
+        reports: 샤드 순서대로의 newman JSON 리포트
+    """
+    ordered = []
+    for position, (shard, report) in enumerate(zip(shards, reports)):
+        executions = report.get("run", {}).get("executions", [])
+        if len(executions) == len(shard["indexes"]):
+            keys = shard["indexes"]
+        else:
+            # setNextRequest 등으로 실행 수가 요청 수와 다르면 샤드 순서대로 뒤에 붙임
+            keys = [float("inf")] * len(executions)
+        ordered.extend((key, position, i, execution) for i, (key, execution) in enumerate(zip(keys, executions)))
+    ordered.sort(key=lambda entry: entry[:3])
+
+    runs = [report.get("run", {}) for report in reports]
+    response_times = [execution["response"]["responseTime"] for *_, execution in ordered
+                      if isinstance(execution.get("response"), dict) and "responseTime" in execution["response"]]
+    timings = [run.get("timings", {}) for run in runs]
+    first = reports[0] if reports else {}
+    return {
+        "collection": {"info": collection.get("info", {}), "item": collection.get("item", [])},
+        "environment": first.get("environment", {}),
+        "globals": first.get("globals", {}),
+        "run": {
+            "stats": _sum_stats(reports),
+            "timings": {
+                "responseAverage": statistics.mean(response_times) if response_times else 0,
+                "responseMin": min(response_times) if response_times else 0,
+                "responseMax": max(response_times) if response_times else 0,
+                "responseSd": statistics.pstdev(response_times) if response_times else 0,
+                "started": min((t["started"] for t in timings if "started" in t), default=0),
+                "completed": max((t["completed"] for t in timings if "completed" in t), default=0)
+            },
+            "executions": [execution for *_, execution in ordered],
+            "transfers": {"responseTotal": sum(run.get("transfers", {}).get("responseTotal", 0) for run in runs)},
+            "failures": [failure for run in runs for failure in run.get("failures", [])],
+            "error": next((run["error"] for run in runs if run.get("error")), None),
+            "shards": len(reports)
+        }
+    }
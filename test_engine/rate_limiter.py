@@ -0,0 +1,67 @@
+import time
+import threading
+from typing import Optional
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청률 제한기
+
+    분당 rate_per_minute개의 토큰이 일정하게 채워지고, 최대 burst개까지 쌓입니다.
+    acquire는 토큰이 생길 때까지 대기하므로 여러 스레드에서 함께 사용해도 전체 요청률이 제한됩니다.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        """
+        요청률 제한기 초기화
+
+        Args:
+            rate_per_minute: 분당 최대 요청 수 (0 이하이면 제한 없음)
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (기본값 1)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst or 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # penalize로 충전 시작 시각이 미래로 밀린 경우에는 그때까지 채우지 않음
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def acquire(self) -> float:
+        """
+        토큰 하나를 사용합니다. 토큰이 없으면 생길 때까지 대기합니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = max(0.0, self.updated_at - now) + (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self, seconds: float) -> None:
+        """
+        서버가 요청률 초과(429 등)를 알린 경우 모든 호출자가 잠시 쉬도록 토큰을 비웁니다.
+
+        Args:
+            seconds: 새 토큰이 채워지기 시작할 때까지의 시간
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            self.updated_at = max(self.updated_at, now + seconds)
@@ -0,0 +1,679 @@
+import os
+import json
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional, Iterable
+
+from test_engine.postman_records import postman_records, RECORD_FIELDS
+
+RESULTS_DIR = "results"
+# 실행/케이스 결과 인덱스 DB 경로 (환경 변수로 조정 가능)
+RESULT_DB_PATH = os.getenv("TESTFLOW_RESULT_DB", os.path.join(RESULTS_DIR, "results.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    execution_time TEXT NOT NULL,
+    env TEXT,
+    type TEXT,
+    scheduled INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'running',
+    path TEXT,
+    summary TEXT,
+    postman_result TEXT,
+    exported INTEGER NOT NULL DEFAULT 0,
+    aggregated INTEGER NOT NULL DEFAULT 0,
+    total INTEGER,
+    cancel_requested INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs (execution_time);
+CREATE INDEX IF NOT EXISTS idx_runs_env_time ON runs (env, execution_time);
+CREATE INDEX IF NOT EXISTS idx_runs_type_time ON runs (type, execution_time);
+CREATE INDEX IF NOT EXISTS idx_runs_unexported ON runs (exported) WHERE exported = 0;
+CREATE INDEX IF NOT EXISTS idx_runs_unaggregated ON runs (aggregated) WHERE aggregated = 0;
+
+CREATE TABLE IF NOT EXISTS case_results (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    case_id TEXT,
+    env TEXT,
+    type TEXT,
+    result TEXT,
+    status_code INTEGER,
+    execution_time TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (run_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_case_results_case_time ON case_results (case_id, execution_time);
+CREATE INDEX IF NOT EXISTS idx_case_results_env_time ON case_results (env, execution_time);
+CREATE INDEX IF NOT EXISTS idx_case_results_type_time ON case_results (type, execution_time);
+CREATE INDEX IF NOT EXISTS idx_case_results_time ON case_results (execution_time);
+
+CREATE TABLE IF NOT EXISTS postman_executions (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    name TEXT,
+    method TEXT,
+    url TEXT,
+    result TEXT,
+    status_code INTEGER,
+    status TEXT,
+    error TEXT,
+    response_time_ms REAL,
+    connect_ms REAL,
+    tls_ms REAL,
+    ttfb_ms REAL,
+    download_ms REAL,
+    request_bytes INTEGER,
+    response_bytes INTEGER,
+    assertions_total INTEGER NOT NULL DEFAULT 0,
+    assertions_failed INTEGER NOT NULL DEFAULT 0,
+    assertions TEXT,
+    PRIMARY KEY (run_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_postman_executions_name ON postman_executions (name);
+
+CREATE TABLE IF NOT EXISTS failure_stats (
+    case_id TEXT PRIMARY KEY,
+    fail_count INTEGER NOT NULL,
+    first_failure TEXT,
+    last_failure TEXT,
+    last_status_code INTEGER,
+    last_desc TEXT,
+    last_env TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_failure_stats_count ON failure_stats (fail_count);
+
+CREATE TABLE IF NOT EXISTS failure_stats_env (
+    case_id TEXT NOT NULL,
+    env TEXT NOT NULL,
+    fail_count INTEGER NOT NULL,
+    first_failure TEXT,
+    last_failure TEXT,
+    last_status_code INTEGER,
+    PRIMARY KEY (case_id, env)
+);
+CREATE INDEX IF NOT EXISTS idx_failure_stats_env_count ON failure_stats_env (env, fail_count);
+
+CREATE TABLE IF NOT EXISTS generations (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# 변경 감지용 세대 카운터 이름
+CASES_GENERATION = "cases"
+RESULTS_GENERATION = "results"
+
+# postman_executions 테이블 컬럼 = 요청 레코드 필드 (assertions는 JSON 문자열로 저장)
+POSTMAN_RECORD_COLUMNS = RECORD_FIELDS
+
+# IN 절에 한 번에 넣을 최대 실행 ID 수 (SQLite 변수 개수 제한 대비)
+_IN_CHUNK = 500
+
+def _status_code(value: Any) -> Optional[int]:
+    return value if isinstance(value, int) else None
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False)
+
+def _postman_record_row(run_id: str, record: Dict[str, Any]) -> tuple:
+    return (run_id,) + tuple(
+        _dumps(record.get(column) or []) if column == "assertions" else record.get(column)
+        for column in POSTMAN_RECORD_COLUMNS
+    )
+
+class ResultDB:
+    """
+    실행 기록과 케이스 결과를 인덱싱하는 SQLite 저장소
+
+    실행 기록 원본은 results/runs/*.jsonl 파일에 그대로 남고, 이 DB는 실행 ID, 케이스 ID,
+    환경, 유형, 실행 시간으로 조회할 수 있도록 같은 내용을 인덱싱합니다.
+    여러 스레드에서 하나의 연결을 공유하며, 여러 프로세스가 동시에 열 수 있도록 WAL 모드를 사용합니다.
+    """
+
+    def __init__(self, db_path: str = RESULT_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    # 세대 카운터
+
+    def _bump(self, name: str) -> None:
+        self._conn.execute(
+            "INSERT INTO generations (name, value) VALUES (?, 1) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + 1",
+            (name,)
+        )
+
+    def bump_generation(self, name: str) -> None:
+        """데이터가 바뀌었음을 알리도록 세대 카운터를 1 증가시킵니다."""
+        with self._lock:
+            self._bump(name)
+            self._conn.commit()
+
+    def get_generation(self, name: str) -> int:
+        """세대 카운터의 현재 값을 반환합니다. (한 번도 증가하지 않았으면 0)"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM generations WHERE name = ?", (name,)).fetchone()
+        return row["value"] if row else 0
+
+    # 쓰기
+
+    def insert_run(self, run_id: str, execution_time: str, env: str, test_type: str,
+                   scheduled: bool = False, status: str = "running", path: Optional[str] = None,
+                   summary: Optional[Dict[str, int]] = None,
+                   postman_result: Optional[Dict[str, Any]] = None) -> None:
+        """실행 정보를 등록합니다. (같은 ID가 있으면 덮어씀)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (id, execution_time, env, type, scheduled, status, path, summary, postman_result) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, execution_time, env, test_type, int(bool(scheduled)), status, path,
+                 _dumps(summary), _dumps(postman_result))
+            )
+            if postman_result is not None:
+                self._replace_postman_records(run_id, postman_result)
+            self._bump(RESULTS_GENERATION)
+            self._conn.commit()
+
+    def insert_results(self, run_id: str, env: str, test_type: str, execution_time: str,
+                       results: Iterable[Dict[str, Any]], start_seq: int = 1) -> None:
+        """케이스 결과들을 실행에 추가합니다. seq는 start_seq부터 차례로 매겨집니다."""
+        rows = [
+            (run_id, seq, result.get("id", "unknown"), env, result.get("test_type", test_type),
+             result.get("result", "UNKNOWN"), _status_code(result.get("status_code")),
+             result.get("execution_time", execution_time), json.dumps(result, ensure_ascii=False))
+            for seq, result in enumerate(results, start_seq)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO case_results "
+                "(run_id, seq, case_id, env, type, result, status_code, execution_time, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._bump(RESULTS_GENERATION)
+            self._conn.commit()
+
+    def set_postman_result(self, run_id: str, postman_result: Dict[str, Any]) -> None:
+        """실행에 Postman Collection 실행 결과를 기록합니다."""
+        with self._lock:
+            self._conn.execute("UPDATE runs SET postman_result = ? WHERE id = ?",
+                               (_dumps(postman_result), run_id))
+            self._replace_postman_records(run_id, postman_result)
+            self._bump(RESULTS_GENERATION)
+            self._conn.commit()
+
+    def _replace_postman_records(self, run_id: str, postman_result: Dict[str, Any]) -> None:
+        if "records" not in postman_result and not postman_result.get("raw_result"):
+            # 리포트 없이 실패한 실행은 실행 중에 기록된 요청 레코드를 그대로 둠
+            return
+        self._conn.execute("DELETE FROM postman_executions WHERE run_id = ?", (run_id,))
+        self._conn.executemany(
+            f"INSERT INTO postman_executions (run_id, {', '.join(POSTMAN_RECORD_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(POSTMAN_RECORD_COLUMNS) + 1))})",
+            [_postman_record_row(run_id, record) for record in postman_records(postman_result)]
+        )
+
+    def insert_postman_records(self, run_id: str, records: Iterable[Dict[str, Any]]) -> None:
+        """Postman 요청 레코드들을 실행에 추가합니다. (실행 중 끝난 요청을 모아서 호출, 같은 seq는 덮어씀)"""
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO postman_executions (run_id, {', '.join(POSTMAN_RECORD_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(POSTMAN_RECORD_COLUMNS) + 1))})",
+                [_postman_record_row(run_id, record) for record in records]
+            )
+            self._bump(RESULTS_GENERATION)
+            self._conn.commit()
+
+    def finish_run(self, run_id: str, status: str, summary: Dict[str, int]) -> None:
+        """실행 상태와 요약을 기록합니다."""
+        with self._lock:
+            self._conn.execute("UPDATE runs SET status = ?, summary = ? WHERE id = ?",
+                               (status, _dumps(summary), run_id))
+            self._bump(RESULTS_GENERATION)
+            self._conn.commit()
+
+    def set_run_total(self, run_id: str, total: int) -> None:
+        """실행할 전체 케이스 수를 기록합니다. (진행률 표시용)"""
+        with self._lock:
+            self._conn.execute("UPDATE runs SET total = ? WHERE id = ?", (total, run_id))
+            self._bump(RESULTS_GENERATION)
+            self._conn.commit()
+
+    def request_cancel(self, run_id: str) -> bool:
+        """진행 중인 실행의 취소를 요청합니다. 요청이 기록되면 True를 반환합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE runs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (run_id,)
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def is_cancel_requested(self, run_id: str) -> bool:
+        """실행에 취소가 요청되었는지 확인합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT cancel_requested FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def claim_unexported_runs(self, limit: Optional[int] = None) -> List[str]:
+        """
+        종료되었지만 아직 분석용으로 내보내지 않은 실행 ID를 가져오고 내보냄 표시를 합니다.
+
+        여러 프로세스가 동시에 호출해도 같은 실행을 두 번 가져가지 않습니다.
+        """
+        query = "SELECT id FROM runs WHERE exported = 0 AND status != 'running' ORDER BY execution_time"
+        params = []
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                run_ids = [row["id"] for row in self._conn.execute(query, params)]
+                for start in range(0, len(run_ids), _IN_CHUNK):
+                    chunk = run_ids[start:start + _IN_CHUNK]
+                    self._conn.execute(
+                        f"UPDATE runs SET exported = 1 WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                    )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return run_ids
+
+    def reset_exported(self, run_ids: List[str]) -> None:
+        """내보내기에 실패한 실행을 다시 내보낼 수 있도록 표시를 되돌립니다."""
+        with self._lock:
+            for start in range(0, len(run_ids), _IN_CHUNK):
+                chunk = run_ids[start:start + _IN_CHUNK]
+                self._conn.execute(
+                    f"UPDATE runs SET exported = 0 WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                )
+            self._conn.commit()
+
+    def pending_failure_runs(self, limit: Optional[int] = None) -> List[str]:
+        """종료되었지만 아직 실패 집계에 반영되지 않은 실행 ID를 반환합니다."""
+        query = "SELECT id FROM runs WHERE aggregated = 0 AND status != 'running' ORDER BY execution_time"
+        params = []
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [row["id"] for row in self._conn.execute(query, params)]
+
+    def record_failures(self, run_id: str, failures: List[Dict[str, Any]]) -> bool:
+        """
+        실행 하나의 실패 결과를 케이스별/환경별 실패 집계에 반영합니다.
+
+        집계 반영 표시와 집계 갱신을 한 트랜잭션에서 처리하므로 같은 실행이 두 번 집계되지 않습니다.
+
+        Args:
+            run_id: 실행 ID
+            failures: case_id, execution_time, env, status_code, desc 키를 가진 실패 목록
+
+        Returns:
+            이번 호출에서 반영했으면 True, 이미 반영된 실행이면 False
+        """
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                cursor = self._conn.execute("UPDATE runs SET aggregated = 1 WHERE id = ? AND aggregated = 0", (run_id,))
+                if cursor.rowcount == 0:
+                    self._conn.rollback()
+                    return False
+                for failure in failures:
+                    params = (failure["case_id"], failure["execution_time"], failure["execution_time"],
+                              _status_code(failure.get("status_code")))
+                    # SET 절의 기존 컬럼 값은 갱신 전 값으로 평가됨
+                    self._conn.execute(
+                        "INSERT INTO failure_stats (case_id, fail_count, first_failure, last_failure, last_status_code, last_desc, last_env) "
+                        "VALUES (?, 1, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (case_id) DO UPDATE SET "
+                        "fail_count = fail_count + 1, "
+                        "first_failure = MIN(first_failure, excluded.first_failure), "
+                        "last_status_code = CASE WHEN excluded.last_failure >= last_failure THEN excluded.last_status_code ELSE last_status_code END, "
+                        "last_desc = CASE WHEN excluded.last_failure >= last_failure THEN excluded.last_desc ELSE last_desc END, "
+                        "last_env = CASE WHEN excluded.last_failure >= last_failure THEN excluded.last_env ELSE last_env END, "
+                        "last_failure = MAX(last_failure, excluded.last_failure)",
+                        params + (failure.get("desc"), failure.get("env"))
+                    )
+                    self._conn.execute(
+                        "INSERT INTO failure_stats_env (case_id, env, fail_count, first_failure, last_failure, last_status_code) "
+                        "VALUES (?, ?, 1, ?, ?, ?) "
+                        "ON CONFLICT (case_id, env) DO UPDATE SET "
+                        "fail_count = fail_count + 1, "
+                        "first_failure = MIN(first_failure, excluded.first_failure), "
+                        "last_status_code = CASE WHEN excluded.last_failure >= last_failure THEN excluded.last_status_code ELSE last_status_code END, "
+                        "last_failure = MAX(last_failure, excluded.last_failure)",
+                        (failure["case_id"], failure.get("env") or "N/A") + params[1:]
+                    )
+                self._bump(RESULTS_GENERATION)
+                self._conn.commit()
+                return True
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def list_failure_stats(self, env: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """실패 횟수가 많은 순으로 케이스별 실패 집계를 반환합니다. env를 지정하면 해당 환경의 집계만 반환합니다."""
+        if env:
+            query = ("SELECT e.case_id, e.env, e.fail_count, e.first_failure, e.last_failure, e.last_status_code, s.last_desc "
+                     "FROM failure_stats_env e LEFT JOIN failure_stats s ON s.case_id = e.case_id "
+                     "WHERE e.env = ? ORDER BY e.fail_count DESC, e.last_failure DESC")
+            params = [env]
+        else:
+            query = ("SELECT case_id, last_env AS env, fail_count, first_failure, last_failure, last_status_code, last_desc "
+                     "FROM failure_stats ORDER BY fail_count DESC, last_failure DESC")
+            params = []
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+
+    def list_failure_env_breakdown(self, case_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        """케이스 ID별 환경별 실패 횟수를 반환합니다."""
+        breakdown = {}
+        with self._lock:
+            if case_ids is None:
+                rows = self._conn.execute("SELECT case_id, env, fail_count FROM failure_stats_env").fetchall()
+            else:
+                rows = []
+                for start in range(0, len(case_ids), _IN_CHUNK):
+                    chunk = case_ids[start:start + _IN_CHUNK]
+                    rows += self._conn.execute(
+                        f"SELECT case_id, env, fail_count FROM failure_stats_env WHERE case_id IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+        for row in rows:
+            breakdown.setdefault(row["case_id"], {})[row["env"]] = row["fail_count"]
+        return breakdown
+
+    def get_runs(self, run_ids: List[str], postman_result: bool = True) -> List[Dict[str, Any]]:
+        """
+        여러 실행 ID의 실행 정보를 조회합니다. (케이스 결과 제외)
+
+        postman_result가 False면 Postman 원본 결과를 읽지 않습니다. (요청 레코드는 load_postman_records로 조회)
+        """
+        runs = []
+        for start in range(0, len(run_ids), _IN_CHUNK):
+            chunk = run_ids[start:start + _IN_CHUNK]
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT * FROM runs WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+            runs.extend(self._run_from_row(row, postman_result) for row in rows)
+        return runs
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+            self._conn.commit()
+
+    # 조회
+
+    def _run_from_row(self, row: sqlite3.Row, postman_result: bool = True) -> Dict[str, Any]:
+        run = {
+            "id": row["id"],
+            "execution_time": row["execution_time"],
+            "env": row["env"] or "N/A",
+            "type": row["type"],
+            "scheduled": bool(row["scheduled"]),
+            "status": row["status"]
+        }
+        if row["summary"]:
+            run["summary"] = json.loads(row["summary"])
+        if postman_result and row["postman_result"]:
+            run["postman_result"] = json.loads(row["postman_result"])
+        return run
+
+    def _where(self, env: Optional[str], test_type: Optional[str]):
+        clauses, params = [], []
+        if env:
+            clauses.append("env = ?")
+            params.append(env)
+        if test_type:
+            clauses.append("type = ?")
+            params.append(test_type)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def list_runs(self, limit: Optional[int] = None, offset: int = 0, env: Optional[str] = None,
+                  test_type: Optional[str] = None, postman_result: bool = True) -> List[Dict[str, Any]]:
+        """실행 목록을 최신순으로 반환합니다. (케이스 결과 제외, postman_result는 get_runs와 같음)"""
+        where, params = self._where(env, test_type)
+        query = f"SELECT * FROM runs{where} ORDER BY execution_time DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._run_from_row(row, postman_result) for row in rows]
+
+    def count_runs(self, env: Optional[str] = None, test_type: Optional[str] = None) -> int:
+        """조건에 맞는 실행 수를 반환합니다."""
+        where, params = self._where(env, test_type)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """실행 ID로 실행 정보를 조회합니다. (케이스 결과 제외)"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return self._run_from_row(row) if row else None
+
+    def get_run_progress(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        실행 진행 상황을 반환합니다.
+
+        Returns:
+            status, total(전체 케이스 수, 모르면 None), done(완료된 케이스 수),
+            counts(결과별 건수), cancel_requested 키를 가진 dict
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, total, cancel_requested FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            counts = {
+                result: count for result, count in self._conn.execute(
+                    "SELECT result, COUNT(*) FROM case_results WHERE run_id = ? GROUP BY result", (run_id,)
+                )
+            }
+        return {
+            "status": row["status"],
+            "total": row["total"],
+            "done": sum(counts.values()),
+            "counts": counts,
+            "cancel_requested": bool(row["cancel_requested"])
+        }
+
+    def get_run_path(self, run_id: str) -> Optional[str]:
+        """실행 ID에 해당하는 원본 기록 파일 경로를 반환합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT path FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return row["path"] if row else None
+
+    def load_results(self, run_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """실행 ID별 케이스 결과 목록을 순번대로 반환합니다."""
+        grouped = {run_id: [] for run_id in run_ids}
+        for start in range(0, len(run_ids), _IN_CHUNK):
+            chunk = run_ids[start:start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT run_id, payload FROM case_results WHERE run_id IN ({placeholders}) ORDER BY run_id, seq",
+                    chunk
+                ).fetchall()
+            for row in rows:
+                grouped[row["run_id"]].append(json.loads(row["payload"]))
+        return grouped
+
+    def load_postman_records(self, run_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """실행 ID별 Postman 요청 레코드 목록을 순번대로 반환합니다."""
+        grouped = {run_id: [] for run_id in run_ids}
+        for start in range(0, len(run_ids), _IN_CHUNK):
+            chunk = run_ids[start:start + _IN_CHUNK]
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT * FROM postman_executions WHERE run_id IN ({','.join('?' * len(chunk))}) "
+                    "ORDER BY run_id, seq",
+                    chunk
+                ).fetchall()
+            for row in rows:
+                record = {column: row[column] for column in POSTMAN_RECORD_COLUMNS}
+                record["assertions"] = json.loads(record["assertions"]) if record["assertions"] else []
+                grouped[row["run_id"]].append(record)
+        return grouped
+
+    def find_case_results(self, case_id: str, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """특정 테스트 케이스의 실행 이력(실행 ID, 순번, 결과 등)을 최신순으로 반환합니다."""
+        query = ("SELECT run_id, seq, case_id, env, type, result, status_code, execution_time "
+                 "FROM case_results WHERE case_id = ? ORDER BY execution_time DESC")
+        params = [case_id]
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                "test_case_id": row["case_id"],
+                "run_id": row["run_id"],
+                "seq": row["seq"],
+                "env": row["env"],
+                "type": row["type"],
+                "result": row["result"],
+                "status_code": row["status_code"],
+                "execution_time": row["execution_time"]
+            }
+            for row in rows
+        ]
+
+    def load_case_result(self, run_id: str, seq: int) -> Optional[Dict[str, Any]]:
+        """실행 ID와 순번으로 케이스 결과 하나를 조회합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM case_results WHERE run_id = ? AND seq = ?",
+                                     (run_id, seq)).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+# 기존 결과 파일 가져오기 완료 여부를 기록하는 meta 키
+LEGACY_IMPORT_KEY = "legacy_import_done"
+
+def legacy_result_type(data: Dict[str, Any]) -> str:
+    """이전 형식 결과 파일의 실행 유형을 추정합니다."""
+    if "type" in data:
+        return data["type"]
+    if "test_type" in data:
+        return data["test_type"]
+    if data.get("results") and "test_type" in data["results"][0]:
+        return data["results"][0]["test_type"]
+    return "unknown"
+
+def _rewrite_json(path: str, data: Dict[str, Any]) -> None:
+    """JSON 파일을 임시 파일에 쓴 뒤 교체하여, 쓰는 도중에 중단되어도 원본이 깨지지 않도록 합니다."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+def import_result_files(db: ResultDB, results_dir: str = RESULTS_DIR) -> int:
+    """
+    DB에 없는 결과 파일(이전 형식 results/test_result_*.json, 실행 기록 results/runs/run_*.jsonl)을 가져옵니다.
+
+    이전 형식 파일에 Postman 원본 리포트가 그대로 들어 있으면 블롭 저장소로 옮기고 파일도 줄인 내용으로 다시 씁니다.
+
+    Returns:
+        새로 등록한 실행 수
+    """
+    # 순환 참조를 피하기 위해 지연 임포트
+    from test_engine.run_store import RUNS_DIR, read_run_file, compact_postman_result
+
+    candidates = []
+    if os.path.exists(results_dir):
+        candidates += [os.path.join(results_dir, name) for name in os.listdir(results_dir)
+                       if name.startswith("test_result_") and name.endswith(".json")]
+    if os.path.exists(RUNS_DIR):
+        candidates += [os.path.join(RUNS_DIR, name) for name in os.listdir(RUNS_DIR)
+                       if name.startswith("run_") and name.endswith(".jsonl")]
+
+    imported = 0
+    for path in candidates:
+        try:
+            if path.endswith(".jsonl"):
+                data = read_run_file(path)
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            if not data or "id" not in data or "execution_time" not in data:
+                continue
+            if db.get_run_path(data["id"]) is not None:
+                continue
+            test_type = legacy_result_type(data)
+            env = data.get("env", "N/A")
+            results = data.get("results", [])
+            summary = data.get("summary")
+            if summary is None and results:
+                summary = {}
+                for result in results:
+                    outcome = result.get("result", "UNKNOWN")
+                    summary[outcome] = summary.get(outcome, 0) + 1
+            postman_result = data.get("postman_result")
+            if postman_result:
+                postman_result = compact_postman_result(postman_result)
+                if not path.endswith(".jsonl") and postman_result != data["postman_result"]:
+                    _rewrite_json(path, dict(data, postman_result=postman_result))
+            db.insert_run(data["id"], data["execution_time"], env, test_type,
+                          scheduled=data.get("scheduled", False),
+                          status=data.get("status", "completed"), path=path, summary=summary,
+                          postman_result=postman_result)
+            db.insert_results(data["id"], env, test_type, data["execution_time"], results)
+            imported += 1
+        except Exception as e:
+            print(f"Error importing result file {path}: {str(e)}")
+    return imported
+
+_db = None
+_db_lock = threading.Lock()
+
+def get_result_db() -> ResultDB:
+    """
+    프로세스 공용 결과 DB를 반환합니다.
+
+    처음 열 때 한 번, DB에 아직 없는 기존 결과 파일을 가져옵니다.
+    (Postman 실행은 원본 리포트를 블롭 저장소로 옮기고 요청 레코드를 만들어 등록)
+    """
+    global _db
+    with _db_lock:
+        if _db is None:
+            db = ResultDB()
+            if db.get_meta(LEGACY_IMPORT_KEY) is None:
+                import_result_files(db)
+                db.set_meta(LEGACY_IMPORT_KEY, "1")
+            _db = db
+        return _db
@@ -0,0 +1,330 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator
+from test_engine.result_db import get_result_db
+from test_engine.failure_stats import update_failure_stats
+from test_engine.postman_records import execution_record, build_records
+from test_engine.blob_store import get_blob_store
+
+RESULTS_DIR = "results"
+RUNS_DIR = os.path.join(RESULTS_DIR, "runs")
+# 다른 프로세스에서 요청한 취소를 결과 DB에서 확인하는 최소 간격 (초)
+CANCEL_CHECK_INTERVAL = 1.0
+# 결과 DB에 한 번에 모아서 기록할 최대 결과 수
+DB_FLUSH_SIZE = 100
+# 모아 둔 결과를 결과 DB에 기록하는 최대 간격 (초, 진행률 표시가 이 간격으로 갱신됨)
+DB_FLUSH_INTERVAL = 1.0
+
+logger = logging.getLogger(__name__)
+
+def generate_run_id() -> str:
+    """같은 초에 여러 실행이 시작되어도 겹치지 않는 실행 ID를 생성합니다."""
+    return f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+def run_file_path(run_id: str) -> str:
+    """실행 ID에 해당하는 실행 기록 파일 경로를 반환합니다."""
+    return os.path.join(RUNS_DIR, f"run_{run_id}.jsonl")
+
+class RunWriter:
+    """
+    하나의 테스트 실행에 속한 모든 결과를 단일 append-only 파일(JSON Lines)에 기록하는 클래스
+
+    파일은 실행 정보(run) 레코드로 시작하여 케이스 결과(result) 레코드가 완료되는 대로
+    추가되고, 실행이 끝나면 요약(end) 레코드로 마무리됩니다. 같은 내용은 결과 DB에도
+    인덱싱되며, DB에는 DB_FLUSH_SIZE건 또는 DB_FLUSH_INTERVAL초마다 모아서 한 번에 기록합니다.
+    여러 스레드에서 동시에 append를 호출해도 안전합니다.
+
+    실행 중 취소가 요청되면 cancelled가 True가 되며, 실행기는 아직 시작하지 않은 케이스를 건너뜁니다.
+    """
+
+    def __init__(self, env: str = "dev", test_type: str = "ai_collection", scheduled: bool = False,
+                 aggregate_failures: bool = True):
+        """
+        실행 기록 파일 생성
+
+        Args:
+            env: 테스트 환경
+            test_type: 실행 유형 (ai_collection, postman 등)
+            scheduled: 예약 실행 여부
+            aggregate_failures: 실행이 완료되면 바로 실패 집계를 갱신할지 여부
+                (False면 실패 집계를 조회할 때 반영됨)
+        """
+        os.makedirs(RUNS_DIR, exist_ok=True)
+        self.env = env
+        self.test_type = test_type
+        self.scheduled = scheduled
+        self.aggregate_failures = aggregate_failures
+        self.execution_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.counts = {"PASS": 0, "FAIL": 0, "ERROR": 0}
+        self.closed = False
+        self._seq = 0
+        self._postman_seq = 0
+        self._pending_results = []
+        self._pending_records = []
+        self._flushed_at = 0.0
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._cancel_checked_at = 0.0
+        self._db = get_result_db()
+
+        # 'x' 모드로 열어 기존 실행 기록을 절대 덮어쓰지 않음
+        while True:
+            self.run_id = generate_run_id()
+            self.path = run_file_path(self.run_id)
+            try:
+                self._file = open(self.path, "x", encoding="utf-8")
+                break
+            except FileExistsError:
+                continue
+
+        self._write({
+            "kind": "run",
+            "id": self.run_id,
+            "execution_time": self.execution_time,
+            "env": env,
+            "type": test_type,
+            "scheduled": scheduled
+        })
+        self._db.insert_run(self.run_id, self.execution_time, env, test_type,
+                            scheduled=scheduled, path=self.path)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def _flush(self, force: bool = False) -> None:
+        """모아 둔 결과와 요청 레코드를 결과 DB에 기록합니다. (잠금을 잡은 상태에서 호출)"""
+        pending = len(self._pending_results) + len(self._pending_records)
+        if not pending:
+            return
+        now = time.monotonic()
+        if not force and pending < DB_FLUSH_SIZE and now - self._flushed_at < DB_FLUSH_INTERVAL:
+            return
+        if self._pending_results:
+            self._db.insert_results(self.run_id, self.env, self.test_type, self.execution_time,
+                                    self._pending_results,
+                                    start_seq=self._seq - len(self._pending_results) + 1)
+            self._pending_results = []
+        if self._pending_records:
+            self._db.insert_postman_records(self.run_id, self._pending_records)
+            self._pending_records = []
+        self._flushed_at = now
+
+    def append(self, result: Dict[str, Any]) -> None:
+        """케이스 결과 하나를 실행 기록에 추가하고 결과 DB에 등록합니다."""
+        with self._lock:
+            self._seq += 1
+            self._write({"kind": "result", "seq": self._seq, "result": result})
+            outcome = result.get("result", "UNKNOWN")
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+            self._pending_results.append(result)
+            self._flush()
+
+    def set_total(self, total: int) -> None:
+        """실행할 전체 케이스 수를 기록합니다. (진행률 표시용)"""
+        self._db.set_run_total(self.run_id, total)
+
+    def cancel(self) -> None:
+        """실행 취소를 요청합니다."""
+        self._cancel_event.set()
+        self._db.request_cancel(self.run_id)
+
+    @property
+    def cancelled(self) -> bool:
+        """취소가 요청되었는지 여부 (다른 프로세스의 요청은 CANCEL_CHECK_INTERVAL마다 확인)"""
+        if self._cancel_event.is_set():
+            return True
+        now = time.monotonic()
+        if now - self._cancel_checked_at >= CANCEL_CHECK_INTERVAL:
+            self._cancel_checked_at = now
+            if self._db.is_cancel_requested(self.run_id):
+                self._cancel_event.set()
+        return self._cancel_event.is_set()
+
+    def append_postman_execution(self, execution: Dict[str, Any]) -> None:
+        """
+        Postman 요청 하나의 실행 결과(newman 리포트의 executions 항목)를 요청 레코드로 실행 기록에 추가하고
+        결과 DB에 등록합니다. (원본은 실행이 끝나면 set_postman_result로 저장)
+        """
+        with self._lock:
+            self._postman_seq += 1
+            record = execution_record(execution, self._postman_seq)
+            self._write({"kind": "postman_execution", "seq": self._postman_seq, "record": record})
+            self._pending_records.append(record)
+            self._flush()
+
+    def set_postman_result(self, postman_result: Dict[str, Any]) -> None:
+        """Postman Collection 실행 결과를 실행 기록에 추가합니다. (원본 리포트와 응답 본문은 블롭 저장소에 저장)"""
+        postman_result = compact_postman_result(postman_result)
+        with self._lock:
+            self._write({"kind": "postman", "postman_result": postman_result})
+            self._flush(force=True)
+            self._db.set_postman_result(self.run_id, postman_result)
+
+    def close(self, status: str = "completed") -> None:
+        """요약 레코드를 기록하고 파일을 닫습니다. 완료된 실행이면 실패 집계도 갱신합니다."""
+        with self._lock:
+            if self.closed:
+                return
+            self._write({
+                "kind": "end",
+                "status": status,
+                "finished_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "summary": dict(self.counts)
+            })
+            self._file.close()
+            self.closed = True
+            self._flush(force=True)
+            self._db.finish_run(self.run_id, status, dict(self.counts))
+        if status != "completed" or not self.aggregate_failures:
+            return
+        try:
+            update_failure_stats()
+        except Exception:
+            logger.exception("실패 집계 갱신 중 오류")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.close("failed")
+        else:
+            self.close("cancelled" if self._cancel_event.is_set() else "completed")
+
+def read_run_file(path: str) -> Optional[Dict[str, Any]]:
+    """
+    실행 기록 파일을 읽어 기존 결과 파일과 같은 형식의 dict로 반환합니다.
+
+    중단된 실행의 마지막 줄이 잘려 있어도 그 전까지의 결과는 반환합니다.
+    Postman 실행이 끝나기 전에 중단되었으면 그때까지 기록된 요청 결과로 실패 결과를 만들어 반환합니다.
+    """
+    run = None
+    postman_records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            kind = record.get("kind")
+            if kind == "run":
+                run = {
+                    "id": record["id"],
+                    "execution_time": record["execution_time"],
+                    "env": record.get("env", "N/A"),
+                    "type": record.get("type", "ai_collection"),
+                    "scheduled": record.get("scheduled", False),
+                    "status": "running",
+                    "results": []
+                }
+            elif run is None:
+                continue
+            elif kind == "result":
+                run["results"].append(record["result"])
+            elif kind == "postman_execution":
+                if "record" in record:
+                    postman_records.append(record["record"])
+                else:
+                    postman_records.append(execution_record(record["execution"], record["seq"]))
+            elif kind == "postman":
+                run["postman_result"] = record["postman_result"]
+            elif kind == "end":
+                run["status"] = record.get("status", "completed")
+                run["summary"] = record.get("summary", {})
+    if run is not None and postman_records and "postman_result" not in run:
+        run["postman_result"] = {
+            "status": "fail",
+            "error": f"실행이 중단되었습니다. (완료된 요청 {len(postman_records)}개)",
+            "records": postman_records,
+            "partial": True
+        }
+    return run
+
+def compact_execution(execution: Dict[str, Any], store=None) -> Dict[str, Any]:
+    """
+    응답 본문(바이트마다 숫자 하나인 JSON 배열)을 블롭 저장소로 옮긴 실행 결과 사본을 반환합니다.
+
+    이미 옮겼거나 본문이 없는 실행 결과는 그대로 반환합니다.
+    """
+    response = execution.get("response")
+    stream = response.get("stream") if isinstance(response, dict) else None
+    if not isinstance(stream, dict) or not isinstance(stream.get("data"), list):
+        return execution
+    body = bytes(stream["data"])
+    compact = dict(execution)
+    compact["response"] = dict(response)
+    compact["response"]["stream"] = {"type": "Buffer", "blob": (store or get_blob_store()).put(body), "size": len(body)}
+    return compact
+
+def compact_postman_result(postman_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Postman 실행 결과를 저장용으로 줄인 사본을 반환합니다.
+
+    원본 리포트(raw_result)는 압축하여 블롭 저장소에 저장하고 키(raw_result_blob)만 남기며,
+    응답 본문은 내용별로 따로 저장하여 같은 응답은 한 번만 저장됩니다. 요청 레코드는 그대로 포함됩니다.
+    """
+    raw_result = postman_result.get("raw_result")
+    if not raw_result:
+        return {key: value for key, value in postman_result.items() if key != "raw_result"}
+    store = get_blob_store()
+    run = raw_result.get("run", {})
+    compact_raw = dict(raw_result)
+    compact_raw["run"] = dict(run, executions=[compact_execution(execution, store)
+                                              for execution in run.get("executions", [])])
+    compact = {key: value for key, value in postman_result.items() if key != "raw_result"}
+    if "records" not in compact:
+        compact["records"] = build_records(raw_result)
+    compact["raw_result_blob"] = store.put_json(compact_raw)
+    return compact
+
+def load_postman_raw_result(postman_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Postman 실행 결과의 원본 리포트를 반환합니다. (블롭 저장소에 있으면 읽어 옴, 없으면 None)"""
+    if postman_result.get("raw_result"):
+        return postman_result["raw_result"]
+    key = postman_result.get("raw_result_blob")
+    return get_blob_store().get_json(key) if key else None
+
+def load_response_body(response: Dict[str, Any]) -> bytes:
+    """리포트의 응답에서 본문 바이트를 읽습니다. (블롭 저장소에 있으면 읽어 옴)"""
+    stream = (response or {}).get("stream")
+    if not isinstance(stream, dict):
+        return b""
+    if stream.get("blob"):
+        return get_blob_store().get(stream["blob"])
+    if isinstance(stream.get("data"), list):
+        return bytes(stream["data"])
+    return b""
+
+def load_run(run_id: str) -> Optional[Dict[str, Any]]:
+    """실행 ID로 실행 기록을 로드합니다."""
+    path = run_file_path(run_id)
+    if not os.path.exists(path):
+        return None
+    return read_run_file(path)
+
+def iter_runs() -> Iterator[Dict[str, Any]]:
+    """저장된 모든 실행 기록을 순회합니다."""
+    if not os.path.exists(RUNS_DIR):
+        return
+    for filename in os.listdir(RUNS_DIR):
+        if filename.startswith("run_") and filename.endswith(".jsonl"):
+            try:
+                run = read_run_file(os.path.join(RUNS_DIR, filename))
+                if run:
+                    yield run
+            except Exception:
+                logger.exception("Error loading run file %s", filename)
+
+def find_case_results(case_id: str, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+    """결과 DB에서 특정 테스트 케이스의 실행 이력(실행 ID, 순번, 결과 등)을 최신순으로 조회합니다."""
+    return get_result_db().find_case_results(case_id, limit, offset)
+
+def load_case_result(run_id: str, seq: int) -> Optional[Dict[str, Any]]:
+    """실행 ID와 순번에 해당하는 케이스 결과를 로드합니다."""
+    return get_result_db().load_case_result(run_id, seq)
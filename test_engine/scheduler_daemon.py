@@ -0,0 +1,249 @@
+"""
+예약 테스트 실행 데몬
+
+Streamlit UI와 별도의 프로세스에서 예약 작업을 실행합니다. UI는 작업 명세를 작업 저장소에
+등록만 하고, 이 데몬이 주기적으로 명세를 읽어 스케줄에 반영한 뒤 실행합니다.
+스케줄(다음 실행 시각)은 SQLite 작업 저장소에 보관되므로 데몬을 재시작해도 유지되며,
+데몬이 멈춰 있던 동안 놓친 실행은 misfire_grace_time 이내라면 재시작 후 (coalesce 시 한 번만) 실행됩니다.
+
+실행 방법 (프로젝트 루트에서):
+    python -m test_engine.scheduler_daemon
+"""
+import os
+import sys
+import time
+import signal
+import socket
+import argparse
+import traceback
+from typing import List, Dict, Any, Optional
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (스크립트로 직접 실행하는 경우)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_MAX_INSTANCES
+from apscheduler.util import ref_to_obj
+
+try:
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+except ImportError:  # SQLAlchemy가 없으면 메모리 작업 저장소 사용 (재시작 시 스케줄 초기화)
+    SQLAlchemyJobStore = None
+
+from test_engine.job_store import (
+    JobStore, get_job_store, SCHEDULER_DB_PATH, SCHEDULER_NAME, SCHEDULED_TEST_FUNC
+)
+
+# 작업 명세를 다시 읽는 주기 (초)
+POLL_INTERVAL = float(os.getenv("TESTFLOW_SCHEDULER_POLL_INTERVAL", "5"))
+# 실행 이력을 기록하며 실제 작업 함수를 호출하는 래퍼 함수 참조
+EXECUTE_JOB_FUNC = "test_engine.scheduler_daemon:execute_job"
+# 기본 주간 테스트 작업 ID
+WEEKLY_TEST_JOB_ID = "weekly_test"
+
+TRIGGERS = {
+    "cron": CronTrigger,
+    "date": DateTrigger,
+    "interval": IntervalTrigger
+}
+
+def run_scheduled_test(selected_cases: Optional[List[str]] = None, env: str = "dev",
+                       max_workers: Optional[int] = None, per_host_limit: Optional[int] = None,
+                       backend: str = "thread") -> Optional[str]:
+    """
+    예약된 테스트를 실행합니다.
+
+    Args:
+        selected_cases: 실행할 케이스 목록 ("ID - 제목" 형식, None이면 전체 케이스)
+        env: 테스트 환경
+        max_workers: 동시 실행 수
+        per_host_limit: 호스트별 최대 동시 요청 수
+        backend: 실행 백엔드 (thread, async)
+
+    Returns:
+        실행 기록 파일 경로
+    """
+    # 실행할 때만 필요한 무거운 모듈은 지연 임포트
+    from test_engine.test_runner import load_all_cases, run_selected_cases, create_issue_file
+    from test_engine.run_store import RunWriter
+
+    try:
+        if selected_cases is None:
+            # 모든 테스트 케이스 선택
+            cases = load_all_cases()
+            if not cases:
+                print("실행할 테스트 케이스가 없습니다.")
+                return None
+            selected_cases = [f"{case['id']} - {case['title']}" for case in cases]
+
+        # 테스트 실행 (결과는 실행 기록 파일 하나에 저장)
+        with RunWriter(env=env, test_type="ai_collection", scheduled=True) as writer:
+            results = run_selected_cases(selected_cases, env, max_workers, per_host_limit, backend, writer)
+        result_file = writer.path
+
+        # 실패한 테스트 케이스에 대해 이슈 파일 생성
+        for result in results:
+            if result["result"] == "FAIL":
+                issue_file = create_issue_file(result)
+                print(f"이슈 파일 생성됨: {issue_file}")
+
+        print(f"스케줄된 테스트가 완료되었습니다. 결과 파일: {result_file}")
+        return result_file
+
+    except Exception as e:
+        print(f"스케줄된 테스트 실행 중 오류 발생: {str(e)}")
+        raise
+
+def execute_job(job_id: str, func: str, kwargs: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    작업 함수를 실행하고 시작 시각, 소요 시간, 결과(또는 오류)를 실행 이력에 기록합니다.
+
+    Args:
+        job_id: 예약 작업 ID
+        func: 실행할 함수 참조 ("모듈:함수" 형식)
+        kwargs: 실행 함수에 전달할 키워드 인자
+    """
+    store = get_job_store()
+    run_id = store.start_job_run(job_id, None)
+    start = time.perf_counter()
+    try:
+        result = ref_to_obj(func)(**(kwargs or {}))
+    except Exception as e:
+        store.finish_job_run(run_id, "error", time.perf_counter() - start,
+                             error=f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}")
+        raise
+    store.finish_job_run(run_id, "success", time.perf_counter() - start,
+                         result=None if result is None else str(result))
+    return result
+
+def build_trigger(spec: Dict[str, Any]):
+    """작업 명세의 트리거 정보로 APScheduler 트리거를 생성합니다."""
+    trigger_cls = TRIGGERS[spec["trigger"]]
+    trigger_args = dict(spec["trigger_args"])
+    if spec["trigger"] != "date":
+        if spec.get("end_date"):
+            trigger_args["end_date"] = spec["end_date"]
+        # 같은 시각에 예약된 작업들이 한꺼번에 실행되지 않도록 시작 시각을 분산
+        jitter = spec.get("options", {}).get("jitter")
+        if jitter:
+            trigger_args["jitter"] = int(jitter)
+    return trigger_cls(**trigger_args)
+
+def register_default_jobs(store: JobStore) -> None:
+    """기본 주간 테스트(매주 토요일 14시, 전체 케이스)를 등록합니다. 사용자가 삭제한 경우 다시 만들지 않습니다."""
+    store.add_job_if_absent(
+        WEEKLY_TEST_JOB_ID,
+        SCHEDULED_TEST_FUNC,
+        "cron",
+        {"day_of_week": "sat", "hour": 14, "minute": 0},
+        kwargs={"env": "dev"},
+        name="주간 전체 테스트"
+    )
+
+def create_scheduler() -> BackgroundScheduler:
+    """SQLite 작업 저장소를 사용하는 스케줄러를 생성합니다."""
+    jobstores = {}
+    if SQLAlchemyJobStore is not None:
+        jobstores["default"] = SQLAlchemyJobStore(url=f"sqlite:///{os.path.abspath(SCHEDULER_DB_PATH)}")
+    else:
+        print("SQLAlchemy가 설치되어 있지 않아 메모리 작업 저장소를 사용합니다. 데몬을 재시작하면 스케줄이 초기화됩니다.")
+    return BackgroundScheduler(jobstores=jobstores)
+
+def record_skipped_runs(store: JobStore):
+    """놓친 실행(misfire)과 동시 실행 제한으로 건너뛴 실행을 실행 이력에 기록하는 리스너를 반환합니다."""
+    def listener(event):
+        if event.code == EVENT_JOB_MISSED:
+            run_times = [event.scheduled_run_time]
+            status = "missed"
+        else:
+            run_times = event.scheduled_run_times
+            status = "skipped"
+        for run_time in run_times:
+            store.record_job_event(event.job_id, run_time.strftime("%Y-%m-%d %H:%M:%S") if run_time else None, status)
+    return listener
+
+def sync_jobs(scheduler: BackgroundScheduler, store: JobStore) -> None:
+    """
+    작업 저장소의 명세를 스케줄러에 반영하고, 다음 실행 시각을 저장소에 기록합니다.
+
+    명세마다 마지막으로 반영한 버전(applied_version)을 저장소에 기록하여 바뀐 작업만 다시 등록하므로,
+    데몬을 재시작해도 이미 반영된 작업의 스케줄(밀린 실행 포함)은 그대로 유지됩니다.
+    """
+    for spec in store.list_jobs(include_removed=True):
+        job_id = spec["id"]
+        if spec["applied_version"] == spec["version"]:
+            continue
+        if spec["removed"]:
+            if scheduler.get_job(job_id):
+                scheduler.remove_job(job_id)
+                print(f"예약 작업 제거: {job_id}")
+        else:
+            options = spec["options"]
+            try:
+                scheduler.add_job(
+                    EXECUTE_JOB_FUNC,
+                    trigger=build_trigger(spec),
+                    kwargs={"job_id": job_id, "func": spec["func"], "kwargs": spec["kwargs"]},
+                    id=job_id,
+                    name=spec["name"],
+                    max_instances=int(options["max_instances"]),
+                    coalesce=bool(options["coalesce"]),
+                    misfire_grace_time=int(options["misfire_grace_time"]) if options["misfire_grace_time"] else None,
+                    replace_existing=True
+                )
+                print(f"예약 작업 등록: {job_id}")
+            except Exception as e:
+                print(f"예약 작업 등록 중 오류 {job_id}: {str(e)}")
+        store.mark_applied(job_id, spec["version"])
+
+    # 실행이 끝나 스케줄에서 빠진 작업(한 번만 실행 등)은 다음 실행 시각을 비움
+    next_run_times = {spec["id"]: None for spec in store.list_jobs()}
+    for job in scheduler.get_jobs():
+        next_run_time = getattr(job, "next_run_time", None)
+        next_run_times[job.id] = next_run_time.strftime("%Y-%m-%d %H:%M:%S") if next_run_time else None
+    store.set_next_run_times(next_run_times)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="TestFlow AI 예약 테스트 실행 데몬")
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL,
+                        help="작업 명세를 다시 읽는 주기 (초)")
+    args = parser.parse_args(argv)
+
+    store = get_job_store()
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+    if not store.acquire_lease(SCHEDULER_NAME, owner):
+        print("다른 스케줄러 데몬이 이미 실행 중입니다.")
+        return 1
+
+    # SIGTERM도 Ctrl+C와 같이 정상 종료 처리
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    register_default_jobs(store)
+    scheduler = create_scheduler()
+    scheduler.add_listener(record_skipped_runs(store), EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+    scheduler.start()
+    print(f"스케줄러 데몬 시작 (소유자: {owner})")
+
+    try:
+        while True:
+            if not store.acquire_lease(SCHEDULER_NAME, owner):
+                print("스케줄러 실행 권한을 잃었습니다. 데몬을 종료합니다.")
+                return 1
+            try:
+                sync_jobs(scheduler, store)
+            except Exception as e:
+                print(f"예약 작업 동기화 중 오류: {str(e)}")
+            time.sleep(args.poll_interval)
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        scheduler.shutdown(wait=True)
+        store.release_lease(SCHEDULER_NAME, owner)
+        print("스케줄러 데몬 종료")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,51 +1,135 @@
 import os
+import sys
 import json
-import google.generativeai as genai
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dotenv import load_dotenv
 import re
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from test_engine.case_repository import get_case_repository
+from test_engine.rate_limiter import RateLimiter
+from test_engine.llm_cache import get_llm_cache, LLM_CACHE_ENABLED
+from test_engine.llm_backends import LLMBackend, BACKENDS, create_backend
 
 # 환경 변수 로드
 load_dotenv()
 
+# 프롬프트 템플릿 버전 (프롬프트를 바꾸면 올려서 이전 캐시 응답을 쓰지 않도록 함)
+PROMPT_TEMPLATE_VERSION = "1"
+# 사용 가능한 모델 목록을 다시 조회하기까지의 시간 (초)
+MODEL_LIST_TTL = int(os.getenv("TESTFLOW_MODEL_LIST_TTL", "3600"))
+
+# 일괄 생성 설정 (환경 변수로 조정 가능)
+# 분당 최대 LLM 요청 수
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("TESTFLOW_LLM_RPM", "60"))
+# 동시에 진행할 LLM 요청 수
+LLM_CONCURRENCY = int(os.getenv("TESTFLOW_LLM_CONCURRENCY", "4"))
+# 요청률 초과 등 일시적인 오류의 최대 재시도 횟수
+LLM_MAX_RETRIES = int(os.getenv("TESTFLOW_LLM_MAX_RETRIES", "5"))
+# 재시도 대기 시간 (초, 시도마다 두 배로 늘어남)
+LLM_RETRY_BASE_DELAY = float(os.getenv("TESTFLOW_LLM_RETRY_BASE_DELAY", "2"))
+
+# 재시도할 일시적인 오류 (google.api_core.exceptions 클래스 이름)
+RETRYABLE_ERRORS = {"ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "DeadlineExceeded", "InternalServerError"}
+
+def is_retryable_error(error: Exception) -> bool:
+    """요청률 초과(429)나 일시적인 서버 오류인지 확인합니다."""
+    if type(error).__name__ in RETRYABLE_ERRORS:
+        return True
+    code = getattr(error, "code", None)
+    if code in (429, 500, 503, 504):
+        return True
+    message = str(error)
+    return "429" in message or "Resource has been exhausted" in message or "quota" in message.lower()
+
+def parse_generation_requests(content: str, filename: str = "") -> List[str]:
+    """
+    일괄 생성할 자연어 요청 목록을 파싱합니다. 형식은 파일 확장자로 구분합니다.
+
+    - .json: 문자열 목록 또는 "request" 키를 가진 객체 목록
+    - .jsonl: 한 줄에 문자열 또는 "request" 키를 가진 객체 하나
+    - 그 외: 한 줄에 요청 하나 (빈 줄과 #으로 시작하는 줄은 무시)
+    """
+    lines = content.splitlines()
+    if filename.endswith(".json"):
+        items = json.loads(content)
+    elif filename.endswith(".jsonl"):
+        items = [json.loads(line) for line in lines if line.strip()]
+    else:
+        items = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    requests = [item.get("request", "") if isinstance(item, dict) else str(item) for item in items]
+    return [request.strip() for request in requests if request and request.strip()]
+
+def load_generation_requests(path: str) -> List[str]:
+    """일괄 생성할 자연어 요청 목록을 파일에서 읽습니다. (형식은 parse_generation_requests 참고)"""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_generation_requests(f.read(), path)
+
+_model_names: Optional[List[str]] = None
+_model_names_fetched_at = 0.0
+_model_names_lock = threading.Lock()
+
+def list_available_models(refresh: bool = False) -> List[str]:
+    """
+    사용 가능한 Gemini 모델 이름 목록을 반환합니다.
+
+    목록 조회는 네트워크 요청이므로 MODEL_LIST_TTL 동안 결과를 재사용합니다.
+    """
+    global _model_names, _model_names_fetched_at
+    import google.generativeai as genai
+
+    with _model_names_lock:
+        if refresh or _model_names is None or time.monotonic() - _model_names_fetched_at >= MODEL_LIST_TTL:
+            genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
+            _model_names = [model.name for model in genai.list_models()]
+            _model_names_fetched_at = time.monotonic()
+        return list(_model_names)
+
 class TestCaseGenerator:
-    def __init__(self):
-        self.api_key = os.getenv('GOOGLE_API_KEY')
+    def __init__(self, backend: Optional[LLMBackend] = None):
+        """
+        Args:
+            backend: 사용할 LLM 백엔드 (기본값은 TESTFLOW_LLM_BACKEND로 선택한 백엔드)
+        """
         self.cases_dir = os.getenv('TEST_CASES_DIR', 'cases')
         
-        # Gemini API 설정
-        genai.configure(api_key=self.api_key)
+        # LLM 백엔드 (Gemini 또는 로컬 대역)
+        self.backend = backend or create_backend()
         
-        # 사용 가능한 모델 확인
-        available_models = genai.list_models()
-        model_names = [model.name for model in available_models]
-        # print("Available models:", model_names)
-        
-        # gemini-pro 모델 사용
-        self.model = genai.GenerativeModel('gemini-2.0-flash-lite-preview-02-05')
+        # 모든 생성 요청(단건/일괄)이 함께 쓰는 요청률 제한 (로컬 백엔드는 제한 없음)
+        self.rate_limiter = RateLimiter(LLM_REQUESTS_PER_MINUTE if self.backend.rate_limited else 0,
+                                        burst=LLM_CONCURRENCY)
         
         # cases 디렉토리가 없으면 생성
         if not os.path.exists(self.cases_dir):
             os.makedirs(self.cases_dir)
 
-    def extract_json_from_response(self, text):
+    def parse_json_response(self, text) -> Optional[Dict[str, Any]]:
         """
-        응답 텍스트에서 JSON 부분을 추출합니다.
+        응답 텍스트에서 JSON 부분을 파싱합니다. JSON이 없거나 잘못되었으면 None을 반환합니다.
         """
         # JSON 형식의 텍스트를 찾기 위한 정규식
         json_pattern = r'\{[\s\S]*\}'
         match = re.search(json_pattern, text)
-        
-        if match:
-            try:
-                # 추출된 JSON 문자열을 파싱
-                return json.loads(match.group(0))
-            except json.JSONDecodeError:
-                # JSON 파싱 실패 시 기본 테스트 케이스 반환
-                return self.create_default_test_case()
-        else:
-            # JSON 형식이 없는 경우 기본 테스트 케이스 반환
-            return self.create_default_test_case()
+        if not match:
+            return None
+        try:
+            # 추출된 JSON 문자열을 파싱
+            return json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return None
+
+    def extract_json_from_response(self, text):
+        """
+        응답 텍스트에서 JSON 부분을 추출합니다.
+        """
+        parsed = self.parse_json_response(text)
+        # JSON 형식이 없거나 파싱에 실패하면 기본 테스트 케이스 반환
+        return parsed if parsed is not None else self.create_default_test_case()
 
     def create_default_test_case(self):
         """
@@ -71,58 +155,109 @@ class TestCaseGenerator:
             "test_type": "ai_collection"  # 기본 테스트 타입을 ai_collection으로 설정
         }
 
-    def generate_test_case(self, natural_language_request):
+    def call_model(self, prompt: str) -> str:
+        """
+        요청률 제한을 지켜 모델을 호출하고 응답 텍스트를 반환합니다.
+
+        요청률 초과(429)나 일시적인 서버 오류는 지수 백오프로 LLM_MAX_RETRIES번까지 재시도합니다.
+        """
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            try:
+                return self.backend.generate(prompt)
+            except Exception as e:
+                if attempt >= LLM_MAX_RETRIES or not is_retryable_error(e):
+                    raise
+                delay = LLM_RETRY_BASE_DELAY * (2 ** attempt) * random.uniform(0.5, 1.5)
+                # 다른 스레드의 요청도 함께 늦춰 요청률 초과가 반복되지 않도록 함
+                self.rate_limiter.penalize(delay)
+                print(f"LLM 요청 재시도 ({attempt + 1}/{LLM_MAX_RETRIES}, {delay:.1f}초 후): {str(e)}")
+                time.sleep(delay)
+
+    def build_test_case(self, natural_language_request: str, use_cache: bool = True) -> Tuple[Dict[str, Any], bool]:
         """
-        자연어 요청을 받아 Gemini를 통해 테스트 케이스를 생성합니다.
+        자연어 요청으로 테스트 케이스를 만듭니다. (저장하지 않음, 실패 시 예외 발생)
+
+        같은 요청(정규화 후)·모델·프롬프트 템플릿 버전의 응답이 캐시에 있으면 모델을 호출하지 않습니다.
+
+        Returns:
+            (테스트 케이스, 캐시 응답 사용 여부)
+        """
+        use_cache = use_cache and LLM_CACHE_ENABLED
+        cache = get_llm_cache() if use_cache else None
+        if cache is not None:
+            try:
+                cached_text = cache.get(natural_language_request, self.backend.model, PROMPT_TEMPLATE_VERSION)
+            except Exception as e:
+                print(f"LLM 응답 캐시 조회 중 오류: {str(e)}")
+                cached_text = None
+            if cached_text is not None:
+                return self._complete_test_case(self.extract_json_from_response(cached_text)), True
+
+        # LLM 프롬프트 구성
+        prompt = f"""
+        다음 요청에 대한 테스트 케이스를 JSON 형식으로 생성해주세요.
+        반드시 아래 형식의 JSON만 응답해주세요. 다른 텍스트는 포함하지 마세요.
+
+        요청: {natural_language_request}
+
+        응답 형식:
+        {{
+            "id": "TC_타임스탬프",
+            "method": "HTTP 메서드 (GET, POST, PUT, DELETE 중 하나)",
+            "test_case_id": "TC_타임스탬프",
+            "title": "테스트 케이스 제목",
+            "description": "테스트 케이스 설명",
+            "steps": [
+                {{
+                    "step_id": 1,
+                    "action": "수행할 동작",
+                    "expected_result": "기대 결과"
+                }}
+            ],
+            "preconditions": ["전제 조건"],
+            "postconditions": ["후행 조건"],
+            "tags": ["태그1", "태그2"],
+            "test_type": "ai_collection"
+        }}
+
+        주의사항:
+        1. id와 test_case_id는 동일한 값이어야 합니다.
+        2. method는 반드시 GET, POST, PUT, DELETE 중 하나여야 합니다.
+        3. steps 배열에는 최소 하나 이상의 단계가 포함되어야 합니다.
+        4. test_type은 반드시 "ai_collection"으로 설정해야 합니다.
+        """
+
+        # LLM 호출
+        response_text = self.call_model(prompt)
+        
+        # 응답에서 JSON 추출 (올바른 JSON 응답만 캐시)
+        test_case = self.parse_json_response(response_text)
+        if test_case is None:
+            return self._complete_test_case(self.create_default_test_case()), False
+        if cache is not None:
+            try:
+                cache.put(natural_language_request, self.backend.model, PROMPT_TEMPLATE_VERSION, response_text)
+            except Exception as e:
+                print(f"LLM 응답 캐시 저장 중 오류: {str(e)}")
+        return self._complete_test_case(test_case), False
+
+    def _complete_test_case(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        # 필수 필드가 없는 경우 기본값 설정
+        if "id" not in test_case:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            test_case["id"] = f"TC_{timestamp}"
+            test_case["test_case_id"] = f"TC_{timestamp}"
+        if "method" not in test_case:
+            test_case["method"] = "GET"
+        return test_case
+
+    def generate_test_case(self, natural_language_request, use_cache: bool = True):
+        """
+        자연어 요청을 받아 LLM을 통해 테스트 케이스를 생성합니다.
         """
         try:
-            # Gemini 프롬프트 구성
-            prompt = f"""
-            다음 요청에 대한 테스트 케이스를 JSON 형식으로 생성해주세요.
-            반드시 아래 형식의 JSON만 응답해주세요. 다른 텍스트는 포함하지 마세요.
-
-            요청: {natural_language_request}
-
-            응답 형식:
-            {{
-                "id": "TC_타임스탬프",
-                "method": "HTTP 메서드 (GET, POST, PUT, DELETE 중 하나)",
-                "test_case_id": "TC_타임스탬프",
-                "title": "테스트 케이스 제목",
-                "description": "테스트 케이스 설명",
-                "steps": [
-                    {{
-                        "step_id": 1,
-                        "action": "수행할 동작",
-                        "expected_result": "기대 결과"
-                    }}
-                ],
-                "preconditions": ["전제 조건"],
-                "postconditions": ["후행 조건"],
-                "tags": ["태그1", "태그2"],
-                "test_type": "ai_collection"
-            }}
-
-            주의사항:
-            1. id와 test_case_id는 동일한 값이어야 합니다.
-            2. method는 반드시 GET, POST, PUT, DELETE 중 하나여야 합니다.
-            3. steps 배열에는 최소 하나 이상의 단계가 포함되어야 합니다.
-            4. test_type은 반드시 "ai_collection"으로 설정해야 합니다.
-            """
-
-            # Gemini API 호출
-            response = self.model.generate_content(prompt)
-            
-            # 응답에서 JSON 추출
-            test_case = self.extract_json_from_response(response.text)
-            
-            # 필수 필드가 없는 경우 기본값 설정
-            if "id" not in test_case:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                test_case["id"] = f"TC_{timestamp}"
-                test_case["test_case_id"] = f"TC_{timestamp}"
-            if "method" not in test_case:
-                test_case["method"] = "GET"
+            test_case, cached = self.build_test_case(natural_language_request, use_cache)
             
             # save_test_case 메서드를 사용하여 파일 저장
             test_case_id = self.save_test_case(test_case)
@@ -130,7 +265,8 @@ class TestCaseGenerator:
             return {
                 "status": "success",
                 "test_case_id": test_case_id,
-                "test_case": test_case
+                "test_case": test_case,
+                "cached": cached
             }
             
         except Exception as e:
@@ -139,26 +275,79 @@ class TestCaseGenerator:
                 "error": str(e)
             }
 
+    def generate_test_cases(self, natural_language_requests: List[str], max_workers: Optional[int] = None,
+                            progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+                            use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        여러 자연어 요청으로 테스트 케이스를 동시에 생성합니다.
+
+        LLM 요청은 max_workers개까지 동시에 진행되며 전체 요청률은 TESTFLOW_LLM_RPM으로 제한됩니다.
+        생성된 케이스는 완료되는 순서대로 저장됩니다.
+
+        Args:
+            natural_language_requests: 자연어 요청 목록
+            max_workers: 동시 LLM 요청 수 (기본값 TESTFLOW_LLM_CONCURRENCY)
+            progress_callback: 항목이 끝날 때마다 (완료 수, 전체 수, 항목 결과)로 호출
+            use_cache: 캐시된 LLM 응답 사용 여부
+
+        Returns:
+            요청 순서대로 정렬된 항목별 결과 목록
+            (index, request, status, test_case_id, test_case, cached, error, elapsed 키)
+        """
+        total = len(natural_language_requests)
+        results = [None] * total
+        if not total:
+            return []
+        
+        def build(request):
+            start = time.perf_counter()
+            try:
+                test_case, cached = self.build_test_case(request, use_cache)
+                return test_case, cached, None, time.perf_counter() - start
+            except Exception as e:
+                return None, False, e, time.perf_counter() - start
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers or LLM_CONCURRENCY, total)) as executor:
+            futures = {
+                executor.submit(build, request): index
+                for index, request in enumerate(natural_language_requests)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                test_case, cached, error, elapsed = future.result()
+                item = {
+                    "index": index,
+                    "request": natural_language_requests[index],
+                    "status": "error",
+                    "test_case_id": None,
+                    "test_case": None,
+                    "cached": cached,
+                    "error": None,
+                    "elapsed": round(elapsed, 2)
+                }
+                if error is None:
+                    try:
+                        # 저장은 이 스레드에서 한 건씩 진행
+                        item["test_case_id"] = self.save_test_case(test_case)
+                        item["test_case"] = test_case
+                        item["status"] = "success"
+                    except Exception as e:
+                        error = e
+                if error is not None:
+                    item["error"] = str(error)
+                results[index] = item
+                if progress_callback:
+                    progress_callback(done, total, item)
+        return results
+
     def get_all_test_cases(self):
         """
         저장된 모든 테스트 케이스를 반환합니다.
         """
-        test_cases = []
-        for filename in os.listdir(self.cases_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.cases_dir, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    test_case = json.load(f)
-                    test_case['filepath'] = filepath
-                    test_cases.append(test_case)
-        return test_cases
+        return get_case_repository().all()
 
     def save_test_case(self, test_case: dict) -> str:
         """테스트 케이스를 파일로 저장합니다."""
-        # 테스트 케이스 ID 생성
-        test_case_id = f"test_case_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        test_case["id"] = test_case_id
-        
         # test_type이 설정되지 않았으면 기본값으로 설정
         if "test_type" not in test_case:
             test_case["test_type"] = "ai_collection"
@@ -177,15 +366,49 @@ class TestCaseGenerator:
         elif any(keyword in title for keyword in ["회원가입", "signup", "register", "가입", "회원"]):
             feature_folder = "회원가입"
         
-        # 기능 폴더 경로 생성
-        feature_dir = os.path.join("cases", feature_folder)
-        os.makedirs(feature_dir, exist_ok=True)
+        # 새 ID를 할당하여 기능 폴더에 새 파일로 저장 (케이스 인덱스에도 반영)
+        test_case_id = get_case_repository().create(test_case, feature_folder)
         
-        # 파일 경로 생성
-        filepath = os.path.join(feature_dir, f"{test_case_id}.json")
-        
-        # 파일 저장
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(test_case, f, ensure_ascii=False, indent=2)
-        
-        return test_case_id 
\ No newline at end of file
+        return test_case_id 
+
+_generator = None
+_generator_lock = threading.Lock()
+
+def get_test_case_generator() -> TestCaseGenerator:
+    """처음 사용할 때 테스트 케이스 생성기를 만들고 이후에는 같은 인스턴스를 재사용합니다."""
+    global _generator
+    with _generator_lock:
+        if _generator is None:
+            _generator = TestCaseGenerator()
+        return _generator
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="자연어 요청 파일로 테스트 케이스 일괄 생성")
+    parser.add_argument("requests_file", help="요청 파일 (.txt: 한 줄에 하나, .json, .jsonl)")
+    parser.add_argument("--workers", type=int, default=LLM_CONCURRENCY, help="동시 LLM 요청 수")
+    parser.add_argument("--report", help="항목별 결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--no-cache", action="store_true", help="캐시된 LLM 응답을 사용하지 않음")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), help="LLM 백엔드 (기본값: TESTFLOW_LLM_BACKEND)")
+    args = parser.parse_args(argv)
+
+    requests = load_generation_requests(args.requests_file)
+    print(f"{len(requests)}개 요청으로 테스트 케이스를 생성합니다. (동시 {args.workers}, 분당 최대 {LLM_REQUESTS_PER_MINUTE:.0f}건)")
+
+    def report_progress(done, total, item):
+        status = item["test_case_id"] if item["status"] == "success" else f"오류: {item['error']}"
+        if item["cached"]:
+            status += " (캐시)"
+        print(f"[{done}/{total}] {item['request'][:40]} => {status}")
+
+    generator = TestCaseGenerator(create_backend(args.backend)) if args.backend else get_test_case_generator()
+    results = generator.generate_test_cases(requests, args.workers, report_progress,
+                                            use_cache=not args.no_cache)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    failed = sum(1 for item in results if item["status"] != "success")
+    print(f"완료: 성공 {len(results) - failed}건, 실패 {failed}건")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,57 +1,62 @@
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
 import requests
 from typing import List, Dict, Any, Optional
 from test_engine.test_utils import run_test_case
-import plotly.graph_objects as go
-import pandas as pd
-import altair as alt
+from test_engine.http_session import SessionManager, get_session_manager, timed_request, DEFAULT_POOL_SIZE
+from test_engine.case_repository import get_case_repository
+from test_engine.run_store import RunWriter, run_file_path, read_run_file, load_postman_raw_result, load_response_body
+from test_engine.result_db import get_result_db
+from test_engine.postman_records import postman_records, count_records
 import sys
 # sys.path.append(".")  # 프로젝트 루트 추가
-from integrations.jira_api import JiraAPI
 
 CASE_DIR = "cases"
 LOG_DIR = "logs"
 ISSUE_DIR = "issues"  # 이슈 저장 폴더
 
+# 동시 실행 기본값 (환경 변수로 조정 가능)
+DEFAULT_MAX_WORKERS = int(os.getenv("TESTFLOW_MAX_WORKERS", "8"))
+DEFAULT_PER_HOST_LIMIT = int(os.getenv("TESTFLOW_PER_HOST_LIMIT", "4"))
+
+# 분석/시각화 함수는 test_engine.analytics로 옮겨졌으며, 기존 임포트 경로는 처음 사용할 때 불러옴
+_ANALYTICS_NAMES = {
+    "plot_test_trend", "build_latency_frame", "plot_latency_breakdown",
+    "analyze_failure_patterns", "plot_coverage", "TIMING_COLUMNS"
+}
+
+def __getattr__(name):
+    if name in _ANALYTICS_NAMES:
+        from test_engine import analytics
+        return getattr(analytics, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def load_all_cases():
-    """모든 테스트 케이스를 로드합니다."""
-    cases = []
-    cases_dir = "cases"
-    
-    if os.path.exists(cases_dir):
-        # cases 디렉토리 하위의 모든 디렉토리와 파일 탐색
-        for root, dirs, files in os.walk(cases_dir):
-            for file in files:
-                if file.endswith(".json"):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            case = json.load(f)
-                            # 파일 경로 정보 추가
-                            case['filepath'] = file_path
-                            cases.append(case)
-                    except Exception as e:
-                        print(f"Error loading case file {file_path}: {str(e)}")
-    
-    return cases
+    """모든 테스트 케이스를 로드합니다. (변경된 파일만 다시 읽음)"""
+    return get_case_repository().all()
 
-def run_test_case(case: Dict[str, Any], env: str = "dev") -> Dict[str, Any]:
-    """단일 테스트 케이스를 실행합니다."""
+def run_test_case(case: Dict[str, Any], env: str = "dev",
+                  session_manager: Optional[SessionManager] = None,
+                  writer: Optional[RunWriter] = None) -> Dict[str, Any]:
+    """단일 테스트 케이스를 실행합니다.
+
+    writer가 주어지면 해당 실행 기록에 결과를 추가하고, 없으면 단일 케이스 실행으로 저장합니다.
+    """
     try:
-        # 환경에 따른 API URL 설정
-        base_url = get_base_url(env)
-        
         # 요청 정보 추출
         method = case.get("method", "GET")
-        endpoint = case.get("endpoint", "")
         headers = case.get("headers", {})
         body = case.get("body", {})
         
-        # API 요청 실행
-        url = f"{base_url}{endpoint}"
-        response = requests.request(
+        # API 요청 실행 (호스트별 keep-alive 세션 재사용)
+        url = case_url(case, env)
+        session = (session_manager or get_session_manager()).get_session(url)
+        response, metrics = timed_request(
+            session,
             method=method,
             url=url,
             headers=headers,
@@ -59,55 +64,130 @@ def run_test_case(case: Dict[str, Any], env: str = "dev") -> Dict[str, Any]:
         )
         
         # 결과 생성
-        result = {
-            "id": case.get("id", "unknown"),
-            "desc": case.get("description", "No description"),
-            "result": "PASS" if response.status_code == case.get("expected_status", 200) else "FAIL",
-            "status_code": response.status_code,
-            "body": response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text,
-            "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "env": env,
-            "test_type": case.get("test_type", "ai_collection")  # 테스트 케이스에서 test_type 가져오기
-        }
+        body = response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text
+        result = build_result(case, env, response.status_code, body, metrics)
         
         # 결과 저장
-        save_result(result)
+        save_result(result, writer)
         
         return result
         
     except Exception as e:
-        result = {
-            "id": case.get("id", "unknown"),
-            "desc": case.get("description", "No description"),
-            "result": "ERROR",
-            "reason": str(e),
-            "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "env": env,
-            "test_type": case.get("test_type", "ai_collection")  # 테스트 케이스에서 test_type 가져오기
-        }
+        result = build_error_result(case, env, e)
         
         # 오류 결과 저장
-        save_result(result)
+        save_result(result, writer)
         
         return result
 
-def run_selected_cases(selected_cases: List[str], env: str = "dev") -> List[Dict[str, Any]]:
-    """선택된 테스트 케이스들을 실행합니다."""
-    all_cases = load_all_cases()
-    results = []
-    
-    # 선택된 케이스 ID 추출
-    selected_ids = [case.split(" - ")[0] for case in selected_cases]
-    
-    # 선택된 케이스만 필터링
-    cases_to_run = [case for case in all_cases if case["id"] in selected_ids]
-    
-    # 각 케이스 실행
-    for case in cases_to_run:
-        result = run_test_case(case, env)
-        results.append(result)
-    
-    return results
+def build_result(case: Dict[str, Any], env: str, status_code: int, body: Any,
+                 metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """응답 정보로 테스트 결과를 생성합니다. (실행 백엔드 공통)
+
+    metrics에는 구간별 소요 시간(timings, ms)과 송수신 바이트 수가 포함됩니다.
+    """
+    result = {
+        "id": case.get("id", "unknown"),
+        "desc": case.get("description", "No description"),
+        "result": "PASS" if status_code == case.get("expected_status", 200) else "FAIL",
+        "status_code": status_code,
+        "body": body,
+        "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "env": env,
+        "test_type": case.get("test_type", "ai_collection")  # 테스트 케이스에서 test_type 가져오기
+    }
+    if metrics:
+        result.update(metrics)
+    return result
+
+def build_error_result(case: Dict[str, Any], env: str, error: Exception) -> Dict[str, Any]:
+    """실행 중 예외가 발생한 경우의 테스트 결과를 생성합니다."""
+    return {
+        "id": case.get("id", "unknown"),
+        "desc": case.get("description", "No description"),
+        "result": "ERROR",
+        "reason": str(error),
+        "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "env": env,
+        "test_type": case.get("test_type", "ai_collection")  # 테스트 케이스에서 test_type 가져오기
+    }
+
+def run_selected_cases(selected_cases: List[str], env: str = "dev",
+                       max_workers: Optional[int] = None,
+                       per_host_limit: Optional[int] = None,
+                       backend: str = "thread",
+                       writer: Optional[RunWriter] = None) -> List[Dict[str, Any]]:
+    """선택된 테스트 케이스들을 실행합니다.
+
+    backend가 "async"이면 asyncio 기반 실행기를 사용하며,
+    이때 max_workers는 동시에 처리할 최대 요청 수로 사용됩니다.
+    writer를 주지 않으면 이 실행을 위한 실행 기록을 새로 만듭니다.
+    """
+    # 선택된 케이스 ID 추출 (중복 제거, 선택 순서 유지)
+    selected_ids = list(dict.fromkeys(case.split(" - ")[0] for case in selected_cases))
+    
+    # 인덱스에서 선택된 케이스만 조회
+    repository = get_case_repository()
+    cases_to_run = [case for case in (repository.get(case_id) for case_id in selected_ids) if case]
+    if writer is not None:
+        writer.set_total(len(cases_to_run))
+    
+    # 각 케이스 실행 (결과는 케이스 순서대로 반환)
+    if backend == "async":
+        # aiohttp는 async 백엔드를 사용할 때만 필요하므로 지연 import
+        from test_engine.async_runner import run_cases_async_blocking
+        return run_cases_async_blocking(cases_to_run, env, max_workers, per_host_limit, writer)
+    return run_cases_concurrently(cases_to_run, env, max_workers, per_host_limit, writer)
+
+def run_cases_concurrently(cases: List[Dict[str, Any]], env: str = "dev",
+                           max_workers: Optional[int] = None,
+                           per_host_limit: Optional[int] = None,
+                           writer: Optional[RunWriter] = None) -> List[Dict[str, Any]]:
+    """테스트 케이스들을 동시에 실행하고 원래 순서대로 결과를 반환합니다.
+
+    max_workers는 전체 동시 실행 수, per_host_limit은 요청 URL의 호스트별 최대 동시 요청 수입니다.
+    max_workers가 1 이하이면 기존과 같이 순차 실행합니다.
+    모든 케이스 결과는 하나의 실행 기록(writer)에 완료되는 순서대로 추가됩니다.
+    실행 중 취소가 요청되면 아직 시작하지 않은 케이스는 건너뛰고 실행된 결과만 반환합니다.
+    """
+    if writer is None:
+        with RunWriter(env=env) as own_writer:
+            return run_cases_concurrently(cases, env, max_workers, per_host_limit, own_writer)
+    
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    per_host_limit = per_host_limit or DEFAULT_PER_HOST_LIMIT
+    
+    # 실행 단위로 세션을 만들고 실행이 끝나면 커넥션을 정리
+    pool_size = max(DEFAULT_POOL_SIZE, per_host_limit)
+    with SessionManager(pool_size=pool_size) as session_manager:
+        if max_workers <= 1 or len(cases) <= 1:
+            results = []
+            for case in cases:
+                if writer.cancelled:
+                    break
+                results.append(run_test_case(case, env, session_manager, writer))
+            return results
+        
+        # 호스트별 동시 요청 수 제한
+        host_semaphores = {}
+        host_lock = threading.Lock()
+        
+        def get_host_semaphore(host):
+            with host_lock:
+                if host not in host_semaphores:
+                    host_semaphores[host] = threading.BoundedSemaphore(per_host_limit)
+                return host_semaphores[host]
+        
+        def run_with_host_limit(case):
+            host = urlparse(case_url(case, env)).netloc
+            with get_host_semaphore(host):
+                if writer.cancelled:
+                    return None
+                return run_test_case(case, env, session_manager, writer)
+        
+        # executor.map은 입력 순서대로 결과를 반환 (취소로 건너뛴 케이스는 제외)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(cases))) as executor:
+            return [result for result in executor.map(run_with_host_limit, cases) if result is not None]
 
 def get_base_url(env: str) -> str:
     """환경에 따른 기본 URL을 반환합니다."""
@@ -118,93 +198,57 @@ def get_base_url(env: str) -> str:
     }
     return env_urls.get(env, env_urls["dev"])
 
-def save_result(result: Dict[str, Any]) -> None:
-    """테스트 결과를 저장합니다."""
-    results_dir = "results"
-    if not os.path.exists(results_dir):
-        os.makedirs(results_dir)
-    
-    # 현재 시간으로 고유한 ID 생성
-    timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-    
+def case_url(case: Dict[str, Any], env: str) -> str:
+    """케이스의 요청 URL을 반환합니다. endpoint가 절대 URL이면 환경의 기본 URL 대신 그대로 사용합니다."""
+    endpoint = case.get("endpoint", "")
+    if urlparse(endpoint).scheme in ("http", "https"):
+        return endpoint
+    return f"{get_base_url(env)}{endpoint}"
+
+def save_result(result: Dict[str, Any], writer: Optional[RunWriter] = None) -> None:
+    """테스트 결과를 저장합니다.
+
+    writer가 주어지면 실행 기록에 결과를 추가하고, 없으면 결과 하나짜리 실행 기록을 만듭니다.
+    """
     # 테스트 ID를 결과에서 가져옴
     test_id = result.get('id', 'unknown')
     
-    # 결과 파일의 형식을 변경 (ID만 포함)
-    result_file = f"test_result_{timestamp}.json"
-    
     # test_type이 없는 경우 기본값 설정
     if "test_type" not in result:
-        # 케이스 파일에서 test_type 확인 시도
+        # 케이스 인덱스에서 test_type 확인 시도
         try:
-            # 케이스 파일 찾기 (cases 디렉토리 내의 모든 JSON 파일 검색)
-            case_file = None
-            for root, dirs, files in os.walk("cases"):
-                for file in files:
-                    if file.endswith(".json") and test_id in file:
-                        case_file = os.path.join(root, file)
-                        break
-                if case_file:
-                    break
-            
-            # 케이스 파일에서 test_type 읽기
-            if case_file and os.path.exists(case_file):
-                with open(case_file, "r", encoding="utf-8") as f:
-                    case_data = json.load(f)
-                    result["test_type"] = case_data.get("test_type", "ai_collection")
-            else:
-                # 케이스 파일을 찾지 못한 경우 기본값 설정
-                result["test_type"] = "ai_collection"
+            case_data = get_case_repository().get(test_id)
+            result["test_type"] = case_data.get("test_type", "ai_collection") if case_data else "ai_collection"
         except Exception as e:
             print(f"케이스 파일 읽기 중 오류: {str(e)}")
             result["test_type"] = "ai_collection"
     
-    # 결과 파일 저장
-    result_path = os.path.join(results_dir, result_file)
-    
-    # 테스트 케이스 ID와 실행 시간을 포함한 전체 결과 작성
-    full_result = {
-        "id": timestamp,
-        "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "env": result.get("env", "개발"),
-        "results": [result],
-        "type": result.get("test_type", "ai_collection"),  # test_type을 type으로 변환하여 저장
-        "scheduled": False
-    }
-    
-    with open(result_path, "w", encoding="utf-8") as f:
-        json.dump(full_result, f, ensure_ascii=False, indent=2)
-    
-    # 테스트 케이스와 실행 ID를 연결하는 파일도 저장
-    link_file = f"test_result_{test_id}_{timestamp}.json"
-    link_path = os.path.join(results_dir, link_file)
+    if writer is not None:
+        writer.append(result)
+        return
     
-    link_data = {
-        "test_case_id": test_id,
-        "execution_id": timestamp,
-        "execution_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "result": result.get("result", "UNKNOWN"),
-        "type": result.get("test_type", "ai_collection")  # test_type을 type으로 통일
-    }
-    
-    with open(link_path, "w", encoding="utf-8") as f:
-        json.dump(link_data, f, ensure_ascii=False, indent=2)
+    # 단독 실행: 결과 하나로 구성된 실행 기록 생성 (실패 집계는 조회할 때 반영)
+    with RunWriter(env=result.get("env", "개발"), test_type=result.get("test_type", "ai_collection"),
+                   aggregate_failures=False) as single_writer:
+        single_writer.append(result)
 
-def load_test_history() -> List[Dict[str, Any]]:
-    """테스트 실행 이력을 로드합니다."""
-    results = []
-    results_dir = "results"
-    
-    if not os.path.exists(results_dir):
-        return results
-    
-    for filename in os.listdir(results_dir):
-        if filename.startswith("test_result_") and filename.endswith(".json"):
-            with open(os.path.join(results_dir, filename), "r", encoding="utf-8") as f:
-                result = json.load(f)
-                results.append(result)
-    
-    return sorted(results, key=lambda x: x["execution_time"], reverse=True)
+def load_test_history(limit: Optional[int] = None, offset: int = 0, env: Optional[str] = None,
+                      test_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    테스트 실행 이력을 결과 DB에서 최신순으로 로드합니다.
+
+    Args:
+        limit: 가져올 최대 실행 수 (None이면 전체)
+        offset: 건너뛸 실행 수 (페이지 조회용)
+        env: 환경 필터
+        test_type: 실행 유형 필터
+    """
+    db = get_result_db()
+    runs = db.list_runs(limit, offset, env, test_type)
+    results_by_run = db.load_results([run["id"] for run in runs])
+    for run in runs:
+        run["results"] = results_by_run.get(run["id"], [])
+    return runs
 
 def save_results(results):
     os.makedirs(LOG_DIR, exist_ok=True)
@@ -251,6 +295,8 @@ def create_issue_file(result):
     try:
         create_jira_issue = os.getenv('CREATE_JIRA_ISSUE', 'false').lower() == 'true'
         if create_jira_issue:
+            # Jira 연동을 켠 경우에만 필요하므로 지연 임포트
+            from integrations.jira_api import JiraAPI
             jira_client = JiraAPI()
             project_key = os.getenv('JIRA_PROJECT_KEY')
             
@@ -277,9 +323,15 @@ def create_issue_file(result):
     
     return filepath
 
-def run_and_report():
+def run_and_report(max_workers: Optional[int] = None, per_host_limit: Optional[int] = None,
+                   backend: str = "thread"):
     cases = load_all_cases()
-    results = [run_test_case(case) for case in cases]
+    with RunWriter(env="dev") as writer:
+        if backend == "async":
+            from test_engine.async_runner import run_cases_async_blocking
+            results = run_cases_async_blocking(cases, "dev", max_workers, per_host_limit, writer)
+        else:
+            results = run_cases_concurrently(cases, "dev", max_workers, per_host_limit, writer)
     save_results(results)
 
     for result in results:
@@ -347,127 +399,26 @@ def group_cases_by_feature(cases):
 def update_case_priority(case_id: str, priority: str) -> bool:
     """테스트 케이스의 우선순위를 업데이트합니다."""
     try:
-        cases = load_all_cases()
-        for case in cases:
-            if case["id"] == case_id:
-                case["priority"] = priority
-                save_case(case)
-                return True
-        return False
+        case = get_case_repository().get(case_id)
+        if case is None:
+            return False
+        case["priority"] = priority
+        save_case(case)
+        return True
     except Exception:
         return False
 
 def save_case(case: Dict[str, Any]) -> None:
-    """테스트 케이스를 저장합니다."""
-    cases_dir = "cases"
-    if not os.path.exists(cases_dir):
-        os.makedirs(cases_dir)
-    
-    filename = f"test_case_{case['id']}.json"
-    with open(os.path.join(cases_dir, filename), "w", encoding="utf-8") as f:
-        json.dump(case, f, ensure_ascii=False, indent=2)
+    """테스트 케이스를 저장합니다. (기존 케이스는 원래 파일에 덮어씀)"""
+    get_case_repository().save(case)
 
 def delete_case(case_id: str) -> bool:
     """테스트 케이스를 삭제합니다."""
     try:
-        filename = f"test_case_{case_id}.json"
-        filepath = os.path.join("cases", filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            return True
-        return False
+        return get_case_repository().delete(case_id)
     except Exception:
         return False
 
-def plot_test_trend(test_history: List[Dict[str, Any]]) -> go.Figure:
-    """테스트 실행 추이를 시각화합니다."""
-    if not test_history:
-        # 빈 데이터로 기본 그래프 생성
-        fig = go.Figure()
-        fig.add_annotation(
-            text="테스트 실행 이력이 없습니다",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            showarrow=False
-        )
-        return fig
-    
-    # 데이터프레임 생성
-    data = []
-    for history in test_history:
-        if history.get('type') == 'test_case':
-            for result in history.get('results', []):
-                data.append({
-                    'execution_time': history['execution_time'],
-                    'result': result.get('result', 'UNKNOWN'),
-                    'test_id': result.get('id', 'UNKNOWN')
-                })
-        elif history.get('type') == 'postman':
-            postman_result = history.get('postman_result', {})
-            if postman_result.get('status') == 'success':
-                output_lines = postman_result.get('output', '').split('\n')
-                for line in output_lines:
-                    if '✅' in line:
-                        data.append({
-                            'execution_time': history['execution_time'],
-                            'result': 'PASS',
-                            'test_id': line.split(' - ')[0] if ' - ' in line else 'UNKNOWN'
-                        })
-                    elif '❌' in line:
-                        data.append({
-                            'execution_time': history['execution_time'],
-                            'result': 'FAIL',
-                            'test_id': line.split(' - ')[0] if ' - ' in line else 'UNKNOWN'
-                        })
-                    elif '⚠️' in line:
-                        data.append({
-                            'execution_time': history['execution_time'],
-                            'result': 'ERROR',
-                            'test_id': line.split(' - ')[0] if ' - ' in line else 'UNKNOWN'
-                        })
-    
-    if not data:
-        # 데이터가 없는 경우 기본 그래프 생성
-        fig = go.Figure()
-        fig.add_annotation(
-            text="시각화할 데이터가 없습니다",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            showarrow=False
-        )
-        return fig
-    
-    df = pd.DataFrame(data)
-    df['execution_time'] = pd.to_datetime(df['execution_time'])
-    df = df.sort_values('execution_time')
-    
-    # 결과별 카운트 계산
-    result_counts = df.groupby(['execution_time', 'result']).size().unstack(fill_value=0)
-    
-    # 그래프 생성
-    fig = go.Figure()
-    
-    # 각 결과별로 선 추가
-    for result in ['PASS', 'FAIL', 'ERROR']:
-        if result in result_counts.columns:
-            fig.add_trace(go.Scatter(
-                x=result_counts.index,
-                y=result_counts[result],
-                name=result,
-                mode='lines+markers'
-            ))
-    
-    # 레이아웃 설정
-    fig.update_layout(
-        title='테스트 실행 추이',
-        xaxis_title='실행 시간',
-        yaxis_title='실행 횟수',
-        legend_title='결과',
-        hovermode='x unified'
-    )
-    
-    return fig
-
 def calculate_coverage() -> Dict[str, float]:
     """테스트 커버리지를 계산합니다."""
     cases = load_all_cases()
@@ -494,189 +445,56 @@ def calculate_coverage() -> Dict[str, float]:
     
     return coverage
 
-def analyze_failure_patterns() -> pd.DataFrame:
-    """실패 패턴을 분석합니다."""
-    history = load_test_history()
-    if not history:
-        return pd.DataFrame()
-    
-    # 실패한 테스트만 필터링
-    failures = []
-    for history_item in history:
-        if history_item.get('type') == 'test_case':
-            for result in history_item.get('results', []):
-                if result.get('result') == 'FAIL':
-                    failures.append({
-                        'id': result.get('id', 'UNKNOWN'),
-                        'desc': result.get('desc', 'N/A'),
-                        'status_code': result.get('status_code', 'N/A'),
-                        'reason': result.get('reason', 'N/A'),
-                        'execution_time': history_item.get('execution_time', 'N/A'),
-                        'env': history_item.get('env', 'N/A')
-                    })
-        elif history_item.get('type') == 'postman':
-            postman_result = history_item.get('postman_result', {})
-            if postman_result.get('status') == 'success':
-                output_lines = postman_result.get('output', '').split('\n')
-                for line in output_lines:
-                    if '❌' in line:
-                        # Postman 결과에서 실패 정보 추출
-                        parts = line.split(' - ')
-                        test_id = parts[0] if len(parts) > 0 else 'UNKNOWN'
-                        test_desc = parts[1] if len(parts) > 1 else 'N/A'
-                        failures.append({
-                            'id': test_id,
-                            'desc': test_desc,
-                            'status_code': 'N/A',
-                            'reason': 'Postman test failure',
-                            'execution_time': history_item.get('execution_time', 'N/A'),
-                            'env': history_item.get('env', 'N/A')
-                        })
-    
-    if not failures:
-        return pd.DataFrame()
-    
-    # 실패 패턴 분석
-    patterns = []
-    for failure in failures:
-        pattern = {
-            "테스트 ID": failure["id"],
-            "설명": failure["desc"],
-            "상태 코드": failure["status_code"],
-            "실패 횟수": sum(1 for f in failures if f["id"] == failure["id"]),
-            "마지막 실패": failure["execution_time"],
-            "환경": failure["env"]
-        }
-        patterns.append(pattern)
-    
-    # DataFrame 생성 및 중복 제거
-    df = pd.DataFrame(patterns)
-    if not df.empty:
-        df = df.drop_duplicates(subset=["테스트 ID"])
-        df = df.sort_values("실패 횟수", ascending=False)
-    
-    return df
+def format_run_label(run: Dict[str, Any]) -> str:
+    """UI에 표시할 실행 정보 문자열("ID - 실행시간 - 타입: 타입명")을 만듭니다."""
+    test_type = run.get("type") or "unknown"
+    # 사용자 친화적인 표현으로 변환
+    friendly_type = "AI 생성 테스트" if test_type == "ai_collection" else "Postman Collection" if test_type == "postman" else test_type
+    return f"{run['id']} - {run['execution_time']} - 타입: {friendly_type}"
 
-def plot_coverage(coverage_data: Dict[str, float]) -> alt.Chart:
-    """테스트 커버리지를 시각화합니다."""
-    # 데이터프레임 생성
-    df = pd.DataFrame({
-        '기능': list(coverage_data.keys()),
-        '커버리지': list(coverage_data.values())
-    })
-    
-    # 전체 커버리지 제외
-    df = df[df['기능'] != '전체']
-    
-    # 차트 생성
-    chart = alt.Chart(df).mark_bar().encode(
-        x='기능',
-        y='커버리지',
-        color=alt.Color('커버리지', scale=alt.Scale(scheme='redyellowgreen', domain=[0, 100])),
-        tooltip=['기능', '커버리지']
-    ).properties(
-        title='테스트 커버리지',
-        width=600,
-        height=400
-    )
-    
-    return chart
+def load_test_runs(limit: Optional[int] = None, offset: int = 0) -> List[str]:
+    """테스트 실행 목록을 최신순으로 로드합니다. limit/offset으로 페이지 단위 조회가 가능합니다."""
+    return [format_run_label(run) for run in get_result_db().list_runs(limit, offset)]
 
-def load_test_runs() -> List[str]:
-    """테스트 실행 목록을 로드합니다."""
-    test_runs = []
-    results_dir = "results"
-    
-    if not os.path.exists(results_dir):
-        return test_runs
-    
-    # 고유한 테스트 실행 ID 추출 (test_result_[ID].json 형식)
-    run_files = {}
-    for filename in os.listdir(results_dir):
-        if filename.startswith("test_result_") and filename.endswith(".json"):
-            try:
-                # 파일 내용 읽기
-                file_path = os.path.join(results_dir, filename)
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                
-                # 결과 파일에 type 필드가 있는지 확인
-                if "id" in data and "execution_time" in data:
-                    run_id = data["id"]
-                    execution_time = data["execution_time"]
-                    
-                    # type 필드 확인 (파일 형식이 다를 수 있음)
-                    test_type = "unknown"
-                    if "type" in data:  # 새로운 형식
-                        test_type = data["type"]
-                    elif "test_type" in data:  # 이전 형식
-                        test_type = data["test_type"]
-                    elif "results" in data and data["results"] and "test_type" in data["results"][0]:
-                        # results 배열의 첫 번째 항목에서 test_type 확인
-                        test_type = data["results"][0]["test_type"]
-                    
-                    # 사용자 친화적인 표현으로 변환
-                    friendly_type = "AI 생성 테스트" if test_type == "ai_collection" else "Postman Collection" if test_type == "postman" else test_type
-                    
-                    # UI에 표시할 실행 정보 형식 지정
-                    run_info = f"{run_id} - {execution_time} - 타입: {friendly_type}"
-                    
-                    # 중복 제거를 위해 사전에 저장
-                    run_files[run_id] = run_info
-            except Exception as e:
-                print(f"Error loading test run file {filename}: {str(e)}")
-    
-    # 테스트 실행 목록 반환
-    test_runs = list(run_files.values())
-    return sorted(test_runs, reverse=True)
+def count_test_runs() -> int:
+    """저장된 테스트 실행 수를 반환합니다."""
+    return get_result_db().count_runs()
 
 def find_result_file(run_id):
     """주어진 run_id에 해당하는 결과 파일을 찾습니다."""
     if not run_id:
         return None
     
-    # 결과 파일 추정 패턴 목록
-    file_patterns = [
-        f"test_result_{run_id}.json",  # 정확한 ID 일치
-        f"{run_id}.json"  # 간단한 ID만
-    ]
-    
-    # results 디렉토리 확인
-    results_dir = "results"
-    if not os.path.exists(results_dir):
-        return None
+    # 결과 DB에 등록된 원본 파일 경로 확인
+    path = get_result_db().get_run_path(run_id)
+    if path and os.path.exists(path):
+        return path
     
-    # 패턴에 맞는 파일 찾기
-    for pattern in file_patterns:
-        file_path = os.path.join(results_dir, pattern)
+    # DB에 아직 없는 경우 파일 이름 규칙으로 확인
+    candidates = [
+        run_file_path(run_id),
+        os.path.join("results", f"test_result_{run_id}.json"),  # 정확한 ID 일치
+        os.path.join("results", f"{run_id}.json")  # 간단한 ID만
+    ]
+    for file_path in candidates:
         if os.path.exists(file_path):
             return file_path
     
-    # 패턴 일치 파일이 없으면 부분 일치 검색
-    for filename in os.listdir(results_dir):
-        if filename.endswith(".json") and run_id in filename:
-            # 파일 내용을 확인하여 올바른 run_id인지 검증
-            try:
-                file_path = os.path.join(results_dir, filename)
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                    # 메인 결과 파일 (테스트 실행 결과)
-                    if "id" in data and data["id"] == run_id:
-                        return file_path
-                    
-                    # 링크 파일 (테스트 케이스-실행 관계)
-                    if "execution_id" in data and data["execution_id"] == run_id:
-                        # 실제 실행 결과 파일 찾기
-                        real_result_file = os.path.join(results_dir, f"test_result_{data['execution_id']}.json")
-                        if os.path.exists(real_result_file):
-                            return real_result_file
-            except Exception as e:
-                print(f"파일 검사 중 오류 {filename}: {str(e)}")
-    
     # 파일을 찾지 못한 경우
     return None
 
+def load_result_file(result_file: str) -> Optional[Dict[str, Any]]:
+    """결과 파일(이전 형식 JSON 또는 실행 기록 JSONL)을 읽어 실행 결과 dict로 반환합니다."""
+    if result_file.endswith(".jsonl"):
+        return read_run_file(result_file)
+    with open(result_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_postman_run_records(run_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """실행의 Postman 요청 레코드를 결과 DB에서 조회합니다. (DB에 없으면 저장된 결과로 만듦)"""
+    records = get_result_db().load_postman_records([run_data["id"]]).get(run_data["id"])
+    return records or postman_records(run_data.get("postman_result"))
+
 def generate_comparison_report(selected_run, comparison_run):
     """두 테스트 실행 결과를 비교하여 보고서를 생성합니다."""
     report = []
@@ -704,13 +522,11 @@ def generate_comparison_report(selected_run, comparison_run):
             print(f"비교 결과 파일을 찾을 수 없음: {comparison_id}")
             return None
         
-        with open(result_file, "r", encoding="utf-8") as f:
-            current_data = json.load(f)
+        current_data = load_result_file(result_file)
         
         comparison_data = None
         if comparison_file:
-            with open(comparison_file, "r", encoding="utf-8") as f:
-                comparison_data = json.load(f)
+            comparison_data = load_result_file(comparison_file)
         
         # 테스트 타입이 다른 경우 비교할 수 없음
         if comparison_data and current_data.get("type") != comparison_data.get("type"):
@@ -748,51 +564,22 @@ def generate_comparison_report(selected_run, comparison_run):
             comparison_result = comparison_data.get("postman_result", {}) if comparison_data else None
             
             if current_result.get("status") == "success":
-                # 현재 실행 결과 요약 추출 및 분석
-                current_total_count = 0
-                current_success_count = 0
-                current_fail_count = 0
-                current_warning_count = 0
-                
-                # raw_result로부터 실제 요청 결과 분석
-                if 'raw_result' in current_result and 'run' in current_result['raw_result']:
-                    executions = current_result['raw_result']['run'].get('executions', [])
-                    current_total_count = len(executions)
-                    
-                    for execution in executions:
-                        response = execution.get('response', {})
-                        status_code = response.get('code', 0)
-                        
-                        # 상태 코드로 성공/실패 판단
-                        if 200 <= status_code < 300:
-                            current_success_count += 1
-                        elif status_code >= 400:
-                            current_fail_count += 1
-                        else:
-                            current_warning_count += 1
-                
-                # 비교 실행 결과 요약 추출 및 분석
-                comparison_total_count = 0
-                comparison_success_count = 0
-                comparison_fail_count = 0
-                comparison_warning_count = 0
-                
+                # 요청 레코드로 결과 요약 (성공: PASS, 실패: FAIL, 경고: 응답 없음)
+                current_records = load_postman_run_records(current_data)
+                comparison_records = []
                 if comparison_result and comparison_result.get("status") == "success":
-                    if 'raw_result' in comparison_result and 'run' in comparison_result['raw_result']:
-                        executions = comparison_result['raw_result']['run'].get('executions', [])
-                        comparison_total_count = len(executions)
-                        
-                        for execution in executions:
-                            response = execution.get('response', {})
-                            status_code = response.get('code', 0)
-                            
-                            # 상태 코드로 성공/실패 판단
-                            if 200 <= status_code < 300:
-                                comparison_success_count += 1
-                            elif status_code >= 400:
-                                comparison_fail_count += 1
-                            else:
-                                comparison_warning_count += 1
+                    comparison_records = load_postman_run_records(comparison_data)
+                current_counts = count_records(current_records)
+                comparison_counts = count_records(comparison_records)
+                
+                current_total_count = current_counts["total"]
+                current_success_count = current_counts["PASS"]
+                current_fail_count = current_counts["FAIL"]
+                current_warning_count = current_counts["ERROR"]
+                comparison_total_count = comparison_counts["total"]
+                comparison_success_count = comparison_counts["PASS"]
+                comparison_fail_count = comparison_counts["FAIL"]
+                comparison_warning_count = comparison_counts["ERROR"]
                 
                 # 결과 요약 비교 표시
                 report.append("### Postman 테스트 결과 비교")
@@ -812,46 +599,16 @@ def generate_comparison_report(selected_run, comparison_run):
                 # 상세 비교 결과
                 report.append(f"## 상세 비교 결과\n")
                 
-                # Postman 요청 추출 (현재)
-                current_requests = {}
-                if 'raw_result' in current_result and 'run' in current_result['raw_result']:
-                    executions = current_result['raw_result']['run'].get('executions', [])
-                    for execution in executions:
-                        item = execution.get('item', {})
-                        request = execution.get('request', {})
-                        response = execution.get('response', {})
-                        
-                        method = request.get('method', '')
-                        path = '/'.join(request.get('url', {}).get('path', []))
-                        name = item.get('name', f"{method} {path}")
-                        status_code = response.get('code', 0)
-                        
-                        status = "성공" if 200 <= status_code < 300 else "실패" if status_code >= 400 else "경고"
-                        current_requests[name] = {
-                            "status": status,
-                            "status_code": status_code
-                        }
-                
-                # Postman 요청 추출 (비교)
-                comparison_requests = {}
-                if comparison_result and comparison_result.get("status") == "success":
-                    if 'raw_result' in comparison_result and 'run' in comparison_result['raw_result']:
-                        executions = comparison_result['raw_result']['run'].get('executions', [])
-                        for execution in executions:
-                            item = execution.get('item', {})
-                            request = execution.get('request', {})
-                            response = execution.get('response', {})
-                            
-                            method = request.get('method', '')
-                            path = '/'.join(request.get('url', {}).get('path', []))
-                            name = item.get('name', f"{method} {path}")
-                            status_code = response.get('code', 0)
-                            
-                            status = "성공" if 200 <= status_code < 300 else "실패" if status_code >= 400 else "경고"
-                            comparison_requests[name] = {
-                                "status": status,
-                                "status_code": status_code
-                            }
+                # 요청 이름별 상태
+                status_labels = {"PASS": "성공", "FAIL": "실패", "ERROR": "경고"}
+                current_requests = {
+                    record["name"]: {"status": status_labels[record["result"]], "status_code": record["status_code"]}
+                    for record in current_records
+                }
+                comparison_requests = {
+                    record["name"]: {"status": status_labels[record["result"]], "status_code": record["status_code"]}
+                    for record in comparison_records
+                }
                 
                 # 상태가 변경된 요청만 표시
                 report.append("### 상태가 변경된 요청")
@@ -1030,9 +787,8 @@ def generate_test_report(selected_run, result_file_path=None):
             print(f"결과 파일을 찾을 수 없음: {run_id}")
             return None
         
-        with open(result_file, "r", encoding="utf-8") as f:
-            result_data = json.load(f)
-            print(f"결과 데이터 타입: {result_data.get('type', 'unknown')}")
+        result_data = load_result_file(result_file)
+        print(f"결과 데이터 타입: {result_data.get('type', 'unknown')}")
         
         # 필수 필드 확인
         if 'id' not in result_data or 'execution_time' not in result_data:
@@ -1077,84 +833,59 @@ def generate_test_report(selected_run, result_file_path=None):
                 
             result = result_data["postman_result"]
             if result.get("status") == "success":
-                # Postman 결과 분석
-                output_lines = result.get("output", "").split('\n')
-                
-                # 결과 요약 추출
-                total_count = 0
-                success_count = 0
-                fail_count = 0
-                warning_count = 0
-                
-                for line in output_lines:
-                    if "총 요청 수:" in line:
-                        try:
-                            total_count = int(line.split(":")[1].strip())
-                        except (ValueError, IndexError):
-                            pass
-                    elif "성공:" in line:
-                        try:
-                            success_count = int(line.split(":")[1].strip())
-                        except (ValueError, IndexError):
-                            pass
-                    elif "실패:" in line:
-                        try:
-                            fail_count = int(line.split(":")[1].strip())
-                        except (ValueError, IndexError):
-                            pass
+                # 요청 레코드로 결과 요약
+                records = load_postman_run_records(result_data)
+                counts = count_records(records)
                 
                 # 결과 요약
                 report.append(f"## 테스트 결과 요약\n")
-                report.append(f"- 총 요청 수: {total_count}")
-                report.append(f"- 성공: {success_count}")
-                report.append(f"- 실패: {fail_count}")
-                report.append(f"- 경고: {warning_count}\n")
+                report.append(f"- 총 요청 수: {counts['total']}")
+                report.append(f"- 성공: {counts['PASS']}")
+                report.append(f"- 실패: {counts['FAIL']}")
+                report.append(f"- 경고: {counts['ERROR']}\n")
                 
                 # 상세 결과
                 report.append(f"## 상세 결과\n")
                 
-                # raw_result에서 실행 정보 추출
-                if 'raw_result' in result and 'run' in result['raw_result']:
-                    executions = result['raw_result']['run'].get('executions', [])
-                    for execution in executions:
-                        item = execution.get('item', {})
-                        request = execution.get('request', {})
-                        response = execution.get('response', {})
-                        
-                        # 요청 정보
-                        method = request.get('method', '')
-                        url = request.get('url', {})
-                        host = url.get('host', [''])[0] if isinstance(url.get('host', []), list) and url.get('host', []) else ''
-                        port = url.get('port', '')
-                        path = '/'.join(url.get('path', [])) if isinstance(url.get('path', []), list) else ''
-                        full_url = f"http://{host}:{port}/{path}"
-                        
-                        # 요청 본문
-                        request_body = request.get('body', {}).get('raw', '') if isinstance(request.get('body', {}), dict) else ''
-                        
-                        # 응답 정보
-                        response_code = response.get('code', '')
-                        response_body = ''
-                        if 'stream' in response and 'data' in response['stream']:
-                            try:
-                                response_body = bytes(response['stream']['data']).decode('utf-8')
-                            except:
-                                response_body = str(response['stream']['data'])
-                        
-                        # 보고서에 추가
-                        report.append(f"### {method} - {item.get('name', '')}")
-                        report.append(f"**Endpoint**: {full_url}")
-                        report.append(f"**Status Code**: {response_code}")
-                        
-                        if request_body:
-                            report.append("\n**Request Body**:")
-                            report.append(f"```json\n{request_body}\n```")
-                        
-                        if response_body:
-                            report.append("\n**Response Body**:")
-                            report.append(f"```json\n{response_body}\n```")
-                        
-                        report.append("")  # 각 요청 사이에 빈 줄 추가
+                # 요청/응답 본문은 레코드에 없으므로 원본 리포트(블롭 저장소)에서 순번으로 찾음
+                executions = (load_postman_raw_result(result) or {}).get('run', {}).get('executions', [])
+                for record in records:
+                    execution = executions[record['seq'] - 1] if record['seq'] <= len(executions) else {}
+                    request = execution.get('request', {})
+                    response = execution.get('response') or {}
+                    
+                    # 요청 본문
+                    request_body = request.get('body', {}).get('raw', '') if isinstance(request.get('body', {}), dict) else ''
+                    
+                    # 응답 본문
+                    body = load_response_body(response)
+                    try:
+                        response_body = body.decode('utf-8')
+                    except UnicodeDecodeError:
+                        response_body = str(body)
+                    
+                    # 보고서에 추가
+                    report.append(f"### {record['method']} - {record['name']}")
+                    report.append(f"**Endpoint**: {record['url']}")
+                    report.append(f"**Status Code**: {record['status_code'] if record['status_code'] is not None else ''}")
+                    if record['response_time_ms'] is not None:
+                        report.append(f"**Response Time**: {record['response_time_ms']:.0f} ms")
+                    if record['assertions']:
+                        passed = record['assertions_total'] - record['assertions_failed']
+                        report.append(f"**Tests**: {passed}/{record['assertions_total']} 통과")
+                        for assertion in record['assertions']:
+                            if assertion['error']:
+                                report.append(f"- ❌ {assertion['name']}: {assertion['error']}")
+                    
+                    if request_body:
+                        report.append("\n**Request Body**:")
+                        report.append(f"```json\n{request_body}\n```")
+                    
+                    if response_body:
+                        report.append("\n**Response Body**:")
+                        report.append(f"```json\n{response_body}\n```")
+                    
+                    report.append("")  # 각 요청 사이에 빈 줄 추가
         elif test_type in ["test_case", "ai_collection"]:  # test_case 또는 ai_collection 타입
             # 테스트 케이스 결과 처리
             if "results" not in result_data:
@@ -1241,17 +972,16 @@ def load_test_result(run_id: str) -> Optional[Dict[str, Any]]:
             print(f"결과 파일을 찾을 수 없습니다: {actual_id}")
             return None
         
-        with open(result_file, "r", encoding="utf-8") as f:
-            result = json.load(f)
-            
-            # 결과 타입이 없는 경우 추가
-            if 'type' not in result:
-                if 'postman_result' in result:
-                    result['type'] = 'postman'
-                else:
-                    result['type'] = 'test_case'
-            
-            return result
+        result = load_result_file(result_file)
+        
+        # 결과 타입이 없는 경우 추가
+        if 'type' not in result:
+            if 'postman_result' in result:
+                result['type'] = 'postman'
+            else:
+                result['type'] = 'test_case'
+        
+        return result
     except Exception as e:
         print(f"테스트 결과 로드 중 오류 발생: {str(e)}")
         return None
@@ -1,9 +1,12 @@
 import requests
 import json
+from test_engine.http_session import get_session_manager, timed_request
 
-def run_test_case(case):
+def run_test_case(case, session_manager=None):
     try:
-        response = requests.request(
+        session = (session_manager or get_session_manager()).get_session(case["url"])
+        response, metrics = timed_request(
+            session,
             method=case["method"],
             url=case["url"],
             headers=case.get("headers", {}),
@@ -19,7 +22,8 @@ def run_test_case(case):
             "status": response.status_code,
             "body": response.text,
             "result": "PASS" if passed else "FAIL",
-            "reason": "" if passed else "Unexpected response"
+            "reason": "" if passed else "Unexpected response",
+            **metrics
         }
 
     except Exception as e: